@@ -36,6 +36,8 @@ class Settings(BaseSettings):
     persistence_backend: Literal["file", "sqlite"] = Field(default="file", alias="PERSISTENCE_BACKEND")
     database_url: str = Field(default="sqlite:///transcribeflow.db", alias="DATABASE_URL")
     csv_log_path: Path = Field(default=Path("output/log.csv"), alias="CSV_LOG_PATH")
+    sheet_buffer_max_rows: int = Field(default=100, alias="SHEET_BUFFER_MAX_ROWS")
+    sheet_buffer_max_delay_ms: int = Field(default=250, alias="SHEET_BUFFER_MAX_DELAY_MS")
 
     # Integrations toggles
     google_sheets_enabled: bool = Field(default=False, alias="GOOGLE_SHEETS_ENABLED")
@@ -51,14 +53,31 @@ class Settings(BaseSettings):
     s3_access_key: str = Field(default="", alias="S3_ACCESS_KEY")
     s3_secret_key: str = Field(default="", alias="S3_SECRET_KEY")
     s3_region: str = Field(default="", alias="S3_REGION")
+    s3_multipart_threshold_mb: int = Field(default=64, alias="S3_MULTIPART_THRESHOLD_MB")
+    s3_multipart_chunk_mb: int = Field(default=16, alias="S3_MULTIPART_CHUNK_MB")
+    s3_max_concurrency: int = Field(default=8, alias="S3_MAX_CONCURRENCY")
+    s3_resumable_uploads: bool = Field(default=True, alias="S3_RESUMABLE_UPLOADS")
+    s3_background_uploads: bool = Field(default=False, alias="S3_BACKGROUND_UPLOADS")
+    local_backup_enabled: bool = Field(default=False, alias="LOCAL_BACKUP_ENABLED")
+    local_backup_dir: Path = Field(default=Path("backup_mirror"), alias="LOCAL_BACKUP_DIR")
+    local_backup_allow_hardlinks: bool = Field(default=False, alias="LOCAL_BACKUP_ALLOW_HARDLINKS")
     gotranscript_enabled: bool = Field(default=False, alias="GOTRANSCRIPT_ENABLED")
     gotranscript_base_url: str = Field(default="https://api.gotranscript.com", alias="GOTRANSCRIPT_BASE_URL")
     gotranscript_api_key: str = Field(default="", alias="GOTRANSCRIPT_API_KEY")
     gotranscript_timeout_sec: int = Field(default=30, alias="GOTRANSCRIPT_TIMEOUT_SEC")
+    gotranscript_max_concurrency: int = Field(default=4, alias="GOTRANSCRIPT_MAX_CONCURRENCY")
 
     # Telemetry
     alert_webhook_url: str = Field(default="", alias="ALERT_WEBHOOK_URL")
     metrics_webhook_url: str = Field(default="", alias="METRICS_WEBHOOK_URL")
+    job_events_webhook_url: str = Field(default="", alias="JOB_EVENTS_WEBHOOK_URL")
+    job_events_webhook_secret: str = Field(default="", alias="JOB_EVENTS_WEBHOOK_SECRET")
+    event_bus_workers: int = Field(default=4, alias="EVENT_BUS_WORKERS")
+    event_bus_max_pending: int = Field(default=1000, alias="EVENT_BUS_MAX_PENDING")
+    dashboard_stream_history: int = Field(default=500, alias="DASHBOARD_STREAM_HISTORY")
+    dashboard_stream_heartbeat_sec: int = Field(default=15, alias="DASHBOARD_STREAM_HEARTBEAT_SEC")
+    health_refresh_interval_sec: int = Field(default=15, alias="HEALTH_REFRESH_INTERVAL_SEC")
+    upload_dedupe_enabled: bool = Field(default=True, alias="UPLOAD_DEDUPE_ENABLED")
 
     # Watcher
     watcher_poll_interval: int = Field(default=5, alias="WATCHER_POLL_INTERVAL")
@@ -66,6 +85,17 @@ class Settings(BaseSettings):
     max_request_body_mb: int = Field(default=2048, alias="MAX_REQUEST_BODY_MB")  # 2 GB uploads via GUI
     openai_chunk_trigger_mb: int = Field(default=25, alias="OPENAI_CHUNK_TRIGGER_MB")
     openai_chunk_duration_sec: int = Field(default=900, alias="OPENAI_CHUNK_DURATION_SEC")
+    pipeline_resume_enabled: bool = Field(default=False, alias="PIPELINE_RESUME_ENABLED")
+    pipeline_streaming_enabled: bool = Field(default=False, alias="PIPELINE_STREAMING_ENABLED")
+    artifact_parallel_writes: bool = Field(default=True, alias="ARTIFACT_PARALLEL_WRITES")
+    artifact_json_compact: bool = Field(default=False, alias="ARTIFACT_JSON_COMPACT")
+    artifact_incremental_builds: bool = Field(default=True, alias="ARTIFACT_INCREMENTAL_BUILDS")
+    template_bulk_render_workers: int = Field(default=4, alias="TEMPLATE_BULK_RENDER_WORKERS")
+    template_bulk_render_max_items: int = Field(default=1000, alias="TEMPLATE_BULK_RENDER_MAX_ITEMS")
+    package_compression_level: int = Field(default=6, alias="PACKAGE_COMPRESSION_LEVEL")
+    package_compression_workers: int = Field(default=4, alias="PACKAGE_COMPRESSION_WORKERS")
+    bulk_review_package_workers: int = Field(default=4, alias="BULK_REVIEW_PACKAGE_WORKERS")
+    bulk_review_max_jobs: int = Field(default=500, alias="BULK_REVIEW_MAX_JOBS")
     allowed_download_extensions: List[str] = Field(
         default_factory=lambda: ["txt", "srt", "vtt", "json", "zip"], alias="ALLOWED_DOWNLOAD_EXTENSIONS"
     )
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from interfaces.cli.rescore_accuracy import main
+
+
+if __name__ == "__main__":
+    main()
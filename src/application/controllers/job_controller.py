@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from domain.entities.job import Job
-from domain.entities.value_objects import EngineType
+from domain.entities.value_objects import EngineType, JobStatus
 from domain.usecases.create_job import CreateJobFromInbox, CreateJobInput
 from domain.usecases.pipeline import ProcessJobPipeline
 from domain.usecases.retry_or_reject import RetryDecision, RetryOrRejectJob
-from domain.ports.repositories import JobRepository
+from domain.ports.repositories import JobRepository, UploadIndex
+
+# Jobs in these states are not worth reusing: a re-upload should start over.
+_NON_REUSABLE_STATUSES = frozenset({JobStatus.FAILED, JobStatus.REJECTED})
 
 
 class JobController:
@@ -20,11 +23,13 @@ class JobController:
         create_job_use_case: CreateJobFromInbox,
         pipeline_use_case: Optional[ProcessJobPipeline],
         retry_use_case: RetryOrRejectJob,
+        upload_index: Optional[UploadIndex] = None,
     ) -> None:
         self.job_repository = job_repository
         self.create_job_use_case = create_job_use_case
         self.pipeline_use_case = pipeline_use_case
         self.retry_use_case = retry_use_case
+        self.upload_index = upload_index
 
     def list_jobs(self, limit: int = 20, page: int = 1) -> tuple[List[Job], bool]:
         page = max(page, 1)
@@ -40,6 +45,26 @@ class JobController:
         input_data = CreateJobInput(source_path=path, profile_id=profile_id, engine=engine)
         return self.create_job_use_case.execute(input_data)
 
+    def ingest_upload(self, path: Path, profile_id: str, engine: EngineType, digest: str) -> Tuple[Job, bool]:
+        """Creates a job for an uploaded file, or returns the job already created for the same content.
+
+        The second item is True when an existing job was reused. Content is matched by
+        ``digest`` together with profile and engine, since either changes the output.
+        """
+        key = f"{digest}|{profile_id}|{engine.value}"
+        if self.upload_index:
+            existing_id = self.upload_index.find(key)
+            existing = self.job_repository.find_by_id(existing_id) if existing_id else None
+            if existing and existing.status not in _NON_REUSABLE_STATUSES:
+                return existing, True
+        input_data = CreateJobInput(
+            source_path=path, profile_id=profile_id, engine=engine, metadata={"upload_digest": digest}
+        )
+        job = self.create_job_use_case.execute(input_data)
+        if self.upload_index:
+            self.upload_index.register(key, job.id)
+        return job, False
+
     def process_job(self, job_id: str) -> None:
         if not self.pipeline_use_case:
             raise RuntimeError("Pipeline ainda nao esta configurado. Conclua a etapa de artefatos.")
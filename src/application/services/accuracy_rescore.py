@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from statistics import mean
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from domain.entities.job import Job
+from domain.entities.transcription import PostEditResult, Segment, TranscriptionResult
+from domain.entities.value_objects import ArtifactType
+from domain.ports.repositories import JobRepository, TranscriptionStore
+
+from .accuracy_service import TranscriptionAccuracyGuard
+
+
+@dataclass(frozen=True)
+class RescoreTask:
+    """Picklable unit of work handed to the scoring workers."""
+
+    job_id: str
+    json_path: str
+    version: int = 1
+    reference_text: Optional[str] = None
+    stored_wer_asr: Optional[float] = None
+    stored_penalty: Optional[float] = None
+    language: str = ""
+    transcription_store: Optional[TranscriptionStore] = None
+
+
+@dataclass
+class RescoreOutcome:
+    job_id: str
+    metadata: Dict[str, str] = field(default_factory=dict)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    score: float = 0.0
+    wer: float = 0.0
+    requires_review: bool = False
+    previous_status: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class RescoreSummary:
+    threshold: float
+    outcomes: List[RescoreOutcome] = field(default_factory=list)
+    skipped: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def scored(self) -> List[RescoreOutcome]:
+        return [outcome for outcome in self.outcomes if not outcome.error]
+
+    @property
+    def failed(self) -> List[RescoreOutcome]:
+        return [outcome for outcome in self.outcomes if outcome.error]
+
+    @property
+    def status_changes(self) -> int:
+        return sum(
+            1
+            for outcome in self.scored
+            if outcome.previous_status and outcome.previous_status != outcome.metadata.get("accuracy_status")
+        )
+
+    def to_markdown(self) -> str:
+        timestamp = datetime.now(timezone.utc).isoformat()
+        scored = self.scored
+        lines = [
+            "# Accuracy Re-evaluation",
+            "",
+            f"- Generated at: {timestamp}",
+            f"- Threshold: {self.threshold:.4f}",
+            f"- Jobs re-scored: {len(scored)}",
+            f"- Jobs skipped: {len(self.skipped)}",
+            f"- Jobs failed: {len(self.failed)}",
+        ]
+        if scored:
+            lines.extend(
+                [
+                    f"- Average score: {mean(outcome.score for outcome in scored):.4f}",
+                    f"- Average WER: {mean(outcome.wer for outcome in scored):.4f}",
+                    f"- Jobs marked for review: {sum(1 for outcome in scored if outcome.requires_review)}",
+                    f"- Status changes: {self.status_changes}",
+                    "",
+                    "| Job ID | Score | WER | Status | Previous Status |",
+                    "| --- | --- | --- | --- | --- |",
+                ]
+            )
+            for outcome in scored[-20:]:
+                lines.append(
+                    f"| {outcome.job_id} | {outcome.score:.4f} | {outcome.wer:.4f} | "
+                    f"{outcome.metadata.get('accuracy_status', '')} | {outcome.previous_status or '-'} |"
+                )
+        return "\n".join(lines) + "\n"
+
+
+class AccuracyBatchRescorer:
+    """Re-scores stored jobs in a process pool and writes metadata back in bulk."""
+
+    def __init__(
+        self,
+        job_repository: JobRepository,
+        guard: TranscriptionAccuracyGuard,
+        max_workers: Optional[int] = None,
+        transcription_store: Optional[TranscriptionStore] = None,
+    ) -> None:
+        self.job_repository = job_repository
+        self.guard = guard
+        self.max_workers = max_workers
+        self.transcription_store = transcription_store
+
+    def run(
+        self,
+        jobs: Iterable[Job],
+        threshold: Optional[float] = None,
+        dry_run: bool = False,
+    ) -> RescoreSummary:
+        threshold = self.guard.threshold if threshold is None else threshold
+        summary = RescoreSummary(threshold=threshold)
+        jobs_by_id: Dict[str, Job] = {}
+        tasks: List[RescoreTask] = []
+        for job in jobs:
+            task = self._build_task(job)
+            if isinstance(task, str):
+                summary.skipped[job.id] = task
+                continue
+            jobs_by_id[job.id] = job
+            tasks.append(task)
+
+        worker = partial(score_task, threshold=threshold)
+        for outcome in self._map(worker, tasks):
+            job = jobs_by_id[outcome.job_id]
+            outcome.previous_status = (job.metadata or {}).get("accuracy_status")
+            summary.outcomes.append(outcome)
+
+        if not dry_run:
+            self._write_back(summary)
+        return summary
+
+    def _reload(self, job_ids: List[str]) -> List[Job]:
+        find_many = getattr(self.job_repository, "find_many", None)
+        if find_many:
+            return list(find_many(job_ids))
+        jobs = (self.job_repository.find_by_id(job_id) for job_id in job_ids)
+        return [job for job in jobs if job]
+
+    def _build_task(self, job: Job) -> RescoreTask | str:
+        json_path = job.output_paths.get(ArtifactType.STRUCTURED_JSON)
+        if not json_path or not Path(json_path).is_file():
+            return "missing_json_artifact"
+        metadata = job.metadata or {}
+        stored_wer_asr = _as_float(metadata.get("accuracy_wer_asr"))
+        if stored_wer_asr is None and self.transcription_store is None:
+            return "missing_asr_baseline"
+        return RescoreTask(
+            job_id=job.id,
+            json_path=str(json_path),
+            version=job.version,
+            reference_text=self.guard.load_reference(job),
+            stored_wer_asr=stored_wer_asr,
+            stored_penalty=_as_float(metadata.get("accuracy_penalty")),
+            language=metadata.get("accuracy_language") or job.language or "",
+            transcription_store=self.transcription_store,
+        )
+
+    def _map(self, worker, tasks: Sequence[RescoreTask]) -> Iterable[RescoreOutcome]:
+        if not tasks:
+            return []
+        if self.max_workers is not None and self.max_workers <= 1:
+            return [worker(task) for task in tasks]
+        workers = self.max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(worker, tasks, chunksize=chunksize))
+
+    def _write_back(self, summary: RescoreSummary) -> None:
+        # Scoring can take long enough for the pipeline or a reviewer to change a job
+        # meanwhile; repositories replace whole records, so re-read every job right
+        # before writing and only merge the accuracy keys into the current version.
+        scored = {outcome.job_id: outcome for outcome in summary.scored}
+        updated: List[Job] = []
+        for job in self._reload(list(scored)):
+            outcome = scored[job.id]
+            job.metadata = job.metadata or {}
+            job.metadata.update({key: value for key, value in outcome.metadata.items() if key.startswith("accuracy_")})
+            updated.append(job)
+            if self.guard.metric_dispatcher:
+                self.guard.metric_dispatcher("accuracy.guard.evaluated", outcome.metrics)
+        if not updated:
+            return
+        if hasattr(self.job_repository, "update_many"):
+            self.job_repository.update_many(updated)  # type: ignore[attr-defined]
+        else:
+            for job in updated:
+                self.job_repository.update(job)
+        if self.guard.metric_dispatcher:
+            self.guard.metric_dispatcher(
+                "accuracy.guard.rescored",
+                {
+                    "threshold": summary.threshold,
+                    "rescored": len(summary.scored),
+                    "skipped": len(summary.skipped),
+                    "failed": len(summary.failed),
+                    "status_changes": summary.status_changes,
+                },
+            )
+
+
+def score_task(task: RescoreTask, threshold: float) -> RescoreOutcome:
+    """Loads the JSON artifact of one job and recomputes its accuracy metadata.
+
+    When the raw ASR output was persisted the ASR WER is recomputed from it,
+    otherwise the value stored by the last evaluation is reused.
+    """
+    try:
+        payload = json.loads(Path(task.json_path).read_text(encoding="utf-8"))
+        post_edit = PostEditResult(
+            text=payload.get("text") or "",
+            segments=[
+                Segment(
+                    id=int(item.get("id", index)),
+                    start=float(item.get("start", 0.0)),
+                    end=float(item.get("end", 0.0)),
+                    text=item.get("text") or "",
+                    speaker=item.get("speaker"),
+                    confidence=item.get("confidence"),
+                )
+                for index, item in enumerate(payload.get("segments") or [])
+            ],
+            flags=payload.get("flags") or [],
+            language=payload.get("language"),
+        )
+        asr_text = task.transcription_store.load_text(task.job_id, task.version) if task.transcription_store else None
+    except (OSError, ValueError, TypeError, AttributeError) as exc:
+        return RescoreOutcome(job_id=task.job_id, error=f"{exc.__class__.__name__}: {exc}")
+    if asr_text is None and task.stored_wer_asr is None:
+        return RescoreOutcome(job_id=task.job_id, error="missing_asr_baseline")
+
+    guard = TranscriptionAccuracyGuard(job_repository=None, log_repository=None, threshold=threshold)  # type: ignore[arg-type]
+    transcription = (
+        TranscriptionResult(text=asr_text, segments=[], language=task.language) if asr_text is not None else None
+    )
+    result = guard.score(
+        task.job_id,
+        transcription,
+        post_edit,
+        task.reference_text,
+        language=post_edit.language or task.language,
+        wer_asr=None if transcription else task.stored_wer_asr,
+        penalty=task.stored_penalty,
+    )
+    return RescoreOutcome(
+        job_id=task.job_id,
+        metadata=result.metadata,
+        metrics=result.metrics,
+        score=result.score,
+        wer=result.wer,
+        requires_review=result.requires_review,
+    )
+
+
+def _as_float(value: object) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+
+__all__ = ["AccuracyBatchRescorer", "RescoreOutcome", "RescoreSummary", "RescoreTask", "score_task"]
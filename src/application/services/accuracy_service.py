@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import re
-import unicodedata
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+from application.services.edit_distance import levenshtein
+from application.services.tokenization import TokenCache, tokenize
 from domain.entities.job import Job
 from domain.entities.log_entry import LogEntry
 from domain.entities.transcription import PostEditResult, TranscriptionResult
@@ -14,6 +14,17 @@ from domain.entities.value_objects import LogLevel
 from domain.ports.repositories import JobRepository, LogRepository
 
 
+@dataclass(frozen=True)
+class AccuracyScore:
+    """Result of one scoring run: the numbers plus the job metadata and metric payload they produce."""
+
+    score: float
+    wer: float
+    requires_review: bool
+    metadata: Dict[str, str]
+    metrics: Dict[str, Any]
+
+
 @dataclass
 class TranscriptionAccuracyGuard:
     """Evaluates transcription quality and records metadata/logs."""
@@ -29,76 +40,120 @@ class TranscriptionAccuracyGuard:
         job = self.job_repository.find_by_id(job_id)
         if not job:
             return
-        reference_text = self.reference_loader(job) if self.reference_loader else self._resolve_metadata_reference(job)
-        score_payload = self._calculate_score(transcription, post_edit, reference_text)
-        score = score_payload["score"]
-        job.metadata = job.metadata or {}
-        job.metadata.update(
-            {
-                "accuracy_score": f"{score:.4f}",
-                "accuracy_baseline": f"{score_payload['baseline']:.4f}",
-                "accuracy_penalty": f"{score_payload['penalty']:.4f}",
-                "accuracy_wer": f"{score_payload['wer_active']:.4f}",
-                "accuracy_wer_asr": f"{score_payload['wer_asr']:.4f}",
-                "accuracy_reference_source": score_payload["reference_source"],
-                "accuracy_status": "passing" if score >= self.threshold else "needs_review",
-                "accuracy_method": "heuristic_v2",
-                "accuracy_requires_review": "true" if score < self.threshold else "false",
-                "accuracy_language": post_edit.language or transcription.language or "",
-                "accuracy_updated_at": datetime.now(timezone.utc).isoformat(),
-            }
+        result = self.score(
+            job_id,
+            transcription,
+            post_edit,
+            self.load_reference(job),
+            language=post_edit.language or transcription.language or "",
         )
-        if score_payload.get("wer_reference") is not None:
-            job.metadata["accuracy_wer_reference"] = f"{score_payload['wer_reference']:.4f}"
-
+        score = result.score
+        job.metadata = job.metadata or {}
+        job.metadata.update(result.metadata)
         self.job_repository.update(job)
 
         level = LogLevel.INFO if score >= self.threshold else LogLevel.WARNING
         message = (
-            f"Acuracia estimada {score:.2%} (WER {score_payload['wer_active']:.2%})."
+            f"Acuracia estimada {score:.2%} (WER {result.wer:.2%})."
             if score >= self.threshold
-            else f"Acuracia abaixo do alvo ({score:.2%}, WER {score_payload['wer_active']:.2%}). Job marcado para revisao."
+            else f"Acuracia abaixo do alvo ({score:.2%}, WER {result.wer:.2%}). Job marcado para revisao."
         )
         self.log_repository.append(LogEntry(job_id=job_id, event="accuracy_evaluated", level=level, message=message))
-        metric_payload = {
-            "job_id": job_id,
-            "score": score,
-            "baseline": score_payload["baseline"],
-            "penalty": score_payload["penalty"],
-            "wer_active": score_payload["wer_active"],
-            "reference_source": score_payload["reference_source"],
-            "requires_review": score < self.threshold,
-        }
         if self.metric_dispatcher:
-            self.metric_dispatcher("accuracy.guard.evaluated", metric_payload)
+            self.metric_dispatcher("accuracy.guard.evaluated", result.metrics)
         if score < self.threshold and self.alert_dispatcher:
             self.alert_dispatcher(
                 "accuracy.guard.alert",
                 {
                     "job_id": job_id,
                     "score": score,
-                    "wer_active": score_payload["wer_active"],
+                    "wer_active": result.wer,
                     "threshold": self.threshold,
                 },
             )
 
+    def score(
+        self,
+        job_id: str,
+        transcription: Optional[TranscriptionResult],
+        post_edit: PostEditResult,
+        reference_text: Optional[str] = None,
+        language: str = "",
+        wer_asr: Optional[float] = None,
+        penalty: Optional[float] = None,
+    ) -> AccuracyScore:
+        """Scores a post-edit without touching repositories.
+
+        Batch re-scoring may pass the stored ``wer_asr``/``penalty`` instead of the
+        ASR transcription, since both only depend on the original outputs.
+        """
+        score_payload = self._calculate_score(transcription, post_edit, reference_text, wer_asr, penalty)
+        score = float(score_payload["score"])
+        return AccuracyScore(
+            score=score,
+            wer=float(score_payload["wer_active"]),
+            requires_review=score < self.threshold,
+            metadata=self._build_metadata(score_payload, language),
+            metrics=self._metric_payload(job_id, score_payload),
+        )
+
+    def load_reference(self, job: Job) -> Optional[str]:
+        """Client reference text for ``job`` from ``reference_loader`` or its metadata."""
+        return self.reference_loader(job) if self.reference_loader else self._resolve_metadata_reference(job)
+
+    def _metric_payload(self, job_id: str, score_payload: Dict[str, Any]) -> Dict[str, Any]:
+        score = score_payload["score"]
+        return {
+            "job_id": job_id,
+            "score": score,
+            "baseline": score_payload["baseline"],
+            "penalty": score_payload["penalty"],
+            "wer_active": score_payload["wer_active"],
+            "reference_source": score_payload["reference_source"],
+            "requires_review": score < self.threshold,
+        }
+
+    def _build_metadata(self, score_payload: Dict[str, Any], language: str) -> Dict[str, str]:
+        score = score_payload["score"]
+        metadata = {
+            "accuracy_score": f"{score:.4f}",
+            "accuracy_baseline": f"{score_payload['baseline']:.4f}",
+            "accuracy_penalty": f"{score_payload['penalty']:.4f}",
+            "accuracy_wer": f"{score_payload['wer_active']:.4f}",
+            "accuracy_wer_asr": f"{score_payload['wer_asr']:.4f}",
+            "accuracy_reference_source": score_payload["reference_source"],
+            "accuracy_status": "passing" if score >= self.threshold else "needs_review",
+            "accuracy_method": "heuristic_v2",
+            "accuracy_requires_review": "true" if score < self.threshold else "false",
+            "accuracy_language": language,
+            "accuracy_updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if score_payload.get("wer_reference") is not None:
+            metadata["accuracy_wer_reference"] = f"{score_payload['wer_reference']:.4f}"
+        return metadata
+
     def _calculate_score(
         self,
-        transcription: TranscriptionResult,
+        transcription: Optional[TranscriptionResult],
         post_edit: PostEditResult,
         reference_text: Optional[str] = None,
+        wer_asr: Optional[float] = None,
+        penalty: Optional[float] = None,
     ) -> Dict[str, Optional[float] | float | str]:
-        wer_asr = self._word_error_rate(post_edit.text, transcription.text)
+        tokens = TokenCache()
+        if wer_asr is None:
+            wer_asr = self._word_error_rate(post_edit.text, transcription.text if transcription else "", tokens)
         reference_source = "asr_output"
         wer_reference: Optional[float] = None
         baseline_wer = wer_asr
         if reference_text:
-            wer_reference = self._word_error_rate(post_edit.text, reference_text)
+            wer_reference = self._word_error_rate(post_edit.text, reference_text, tokens)
             if wer_reference < wer_asr:
                 baseline_wer = wer_reference
                 reference_source = "client_reference"
         baseline = max(0.0, 1.0 - baseline_wer)
-        penalty = self._estimate_penalty(post_edit)
+        if penalty is None:
+            penalty = self._estimate_penalty(post_edit, tokens)
         score = max(0.0, baseline - penalty)
         return {
             "score": score,
@@ -110,9 +165,10 @@ class TranscriptionAccuracyGuard:
             "reference_source": reference_source,
         }
 
-    def _estimate_penalty(self, post_edit: PostEditResult) -> float:
-        tokens = max(1, len(self._tokenize(post_edit.text)))
-        placeholder_penalty = post_edit.text.count("???") / tokens
+    def _estimate_penalty(self, post_edit: PostEditResult, tokens: Optional[TokenCache] = None) -> float:
+        cache = tokens or TokenCache()
+        token_count = max(1, len(cache.tokens(post_edit.text)))
+        placeholder_penalty = post_edit.text.count("???") / token_count
         flag_penalty = len(post_edit.flags) * 0.02
         wordings_penalty = self._estimate_confidence_penalty(post_edit)
         return min(0.6, placeholder_penalty + flag_penalty + wordings_penalty)
@@ -129,14 +185,12 @@ class TranscriptionAccuracyGuard:
 
     @staticmethod
     def _tokenize(text: str) -> List[str]:
-        normalized = unicodedata.normalize("NFKD", text or "").casefold()
-        normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
-        cleaned = re.sub(r"[^a-z0-9\s]", " ", normalized)
-        return [token for token in cleaned.split() if token]
-
-    def _word_error_rate(self, reference: str, hypothesis: str) -> float:
-        reference_tokens = self._tokenize(reference)
-        hypothesis_tokens = self._tokenize(hypothesis)
+        return tokenize(text)
+
+    def _word_error_rate(self, reference: str, hypothesis: str, tokens: Optional[TokenCache] = None) -> float:
+        cache = tokens or TokenCache()
+        reference_tokens = cache.tokens(reference)
+        hypothesis_tokens = cache.tokens(hypothesis)
         if not reference_tokens and not hypothesis_tokens:
             return 0.0
         if not reference_tokens:
@@ -146,21 +200,7 @@ class TranscriptionAccuracyGuard:
 
     @staticmethod
     def _levenshtein(reference: List[str], hypothesis: List[str]) -> int:
-        if not reference:
-            return len(hypothesis)
-        if not hypothesis:
-            return len(reference)
-        previous = list(range(len(hypothesis) + 1))
-        for i, ref_token in enumerate(reference, start=1):
-            current = [i]
-            for j, hyp_token in enumerate(hypothesis, start=1):
-                cost = 0 if ref_token == hyp_token else 1
-                insertion = current[-1] + 1
-                deletion = previous[j] + 1
-                substitution = previous[j - 1] + cost
-                current.append(min(insertion, deletion, substitution))
-            previous = current
-        return previous[-1]
+        return levenshtein(reference, hypothesis)
 
     @staticmethod
     def _resolve_metadata_reference(job: Job) -> Optional[str]:
@@ -183,4 +223,4 @@ class TranscriptionAccuracyGuard:
             return None
 
 
-__all__ = ["TranscriptionAccuracyGuard"]
+__all__ = ["AccuracyScore", "TranscriptionAccuracyGuard"]
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple
 from uuid import uuid4
 
 from domain.entities.artifact import Artifact
@@ -12,13 +17,34 @@ from domain.entities.transcription import PostEditResult
 from domain.entities.value_objects import ArtifactType
 from domain.ports.services import ArtifactBuilder
 
-from .subtitle_formatter import SubtitleFormatter
+from .cue_optimizer import CueOptimizer
+from .json_stream import JsonStreamWriter, StreamedArray
+from .subtitle_formatter import SubtitleEntry, SubtitleFormatter
 from .validator_service import TranscriptValidator
 from .delivery_template_service import DeliveryTemplateRegistry
 
 
+# Only the TXT rendering reads these; the JSON artifact leaves them out (and so does
+# its hash) so re-templating a job does not rewrite or stale its JSON artifact.
+TXT_ONLY_METADATA = frozenset(
+    {"delivery_template", "delivery_template_updated_at", "delivery_locale", "delivery_locale_updated_at"}
+)
+
+
 class FilesystemArtifactBuilder(ArtifactBuilder):
-    """Writes TXT/SRT/VTT/JSON artifacts to the output/ directory."""
+    """Writes TXT/SRT/VTT/JSON artifacts to the output/ directory.
+
+    Every format goes to a temp file that replaces the final name only once it is
+    complete; with ``parallel_writes`` the formats are rendered concurrently.
+
+    With ``incremental`` each format records a hash of its inputs in a hidden
+    ``.<stem>.inputs.json`` manifest and is only rewritten when that hash changes:
+    TXT depends on the post-edit text, header fields and the resolved template
+    body, SRT/VTT on the segments, subtitle rules and cue-optimizer settings, JSON
+    on those plus the post-edit result (its ``warnings`` come from the optimized
+    cues) and job metadata minus the delivery template/locale keys. Changing a
+    job's template or locale therefore rewrites the TXT alone.
+    """
 
     def __init__(
         self,
@@ -26,60 +52,198 @@ class FilesystemArtifactBuilder(ArtifactBuilder):
         subtitle_formatter: SubtitleFormatter,
         validator: TranscriptValidator,
         template_registry: DeliveryTemplateRegistry | None = None,
+        cue_optimizer: CueOptimizer | None = None,
+        parallel_writes: bool = False,
+        compact_json: bool = False,
+        incremental: bool = False,
+        metric_dispatcher: Optional[Callable[[str, Dict[str, Any]], None]] = None,
     ) -> None:
         self.output_dir = output_dir
         self.subtitle_formatter = subtitle_formatter
         self.validator = validator
         self.template_registry = template_registry
+        self.cue_optimizer = cue_optimizer
+        self.parallel_writes = parallel_writes
+        self.json_writer = JsonStreamWriter(compact=compact_json)
+        self.incremental = incremental
+        self.metric_dispatcher = metric_dispatcher
 
     def build(self, job: Job, profile: Profile, post_edit_result: PostEditResult) -> Iterable[Artifact]:
         job_dir = self.output_dir / job.id
         job_dir.mkdir(parents=True, exist_ok=True)
-        version_tag = f"v{job.version}"
-
-        artifacts: List[Artifact] = []
-
-        text_path = job_dir / f"{job.id}_{version_tag}.txt"
-        text_path.write_text(self._build_txt(job, profile, post_edit_result), encoding="utf-8")
-        artifacts.append(self._artifact(job, ArtifactType.TRANSCRIPT_TXT, text_path, job.version))
-
-        srt_content = self.subtitle_formatter.to_srt(post_edit_result.segments, profile)
-        srt_path = job_dir / f"{job.id}_{version_tag}.srt"
-        srt_path.write_text(srt_content, encoding="utf-8")
-        artifacts.append(self._artifact(job, ArtifactType.SUBTITLE_SRT, srt_path, job.version))
-
-        vtt_content = self.subtitle_formatter.to_vtt(post_edit_result.segments, profile)
-        vtt_path = job_dir / f"{job.id}_{version_tag}.vtt"
-        vtt_path.write_text(vtt_content, encoding="utf-8")
-        artifacts.append(self._artifact(job, ArtifactType.SUBTITLE_VTT, vtt_path, job.version))
-
-        warnings = self.validator.validate(profile, post_edit_result.segments)
-        json_payload = {
-            "job_id": job.id,
-            "profile": profile.id,
-            "language": post_edit_result.language or job.language,
-            "text": post_edit_result.text,
-            "segments": [
-                {
-                    "id": segment.id,
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text,
-                    "speaker": segment.speaker,
-                }
-                for segment in post_edit_result.segments
-            ],
-            "flags": post_edit_result.flags,
-            "warnings": warnings,
-            "metadata": job.metadata,
+        stem = f"{job.id}_v{job.version}"
+        targets = [
+            (ArtifactType.TRANSCRIPT_TXT, job_dir / f"{stem}.txt"),
+            (ArtifactType.SUBTITLE_SRT, job_dir / f"{stem}.srt"),
+            (ArtifactType.SUBTITLE_VTT, job_dir / f"{stem}.vtt"),
+            (ArtifactType.STRUCTURED_JSON, job_dir / f"{stem}.json"),
+        ]
+
+        manifest_path = job_dir / f".{stem}.inputs.json"
+        fingerprints: Dict[str, str] = {}
+        recorded: Dict[str, str] = {}
+        if self.incremental:
+            fingerprints = self._fingerprints(job, profile, post_edit_result)
+            recorded = self._read_manifest(manifest_path)
+        stale = {
+            artifact_type
+            for artifact_type, path in targets
+            if not self.incremental
+            or recorded.get(artifact_type.value) != fingerprints[artifact_type.value]
+            or not path.exists()
         }
-        json_path = job_dir / f"{job.id}_{version_tag}.json"
-        json_path.write_text(json.dumps(json_payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        artifacts.append(self._artifact(job, ArtifactType.STRUCTURED_JSON, json_path, job.version))
 
-        return artifacts
+        entries: List[SubtitleEntry] = []
+        warnings: List[str] = []
+        if stale - {ArtifactType.TRANSCRIPT_TXT}:
+            cues = post_edit_result.segments
+            if self.cue_optimizer:
+                cues = self.cue_optimizer.optimize(post_edit_result.segments, profile)
+            entries = self.subtitle_formatter.build_entries(cues, profile)
+            warnings = self.validator.validate(profile, cues)
 
-    def _build_txt(self, job: Job, profile: Profile, post_edit_result: PostEditResult) -> str:
+        renderers: Dict[ArtifactType, Callable[[TextIO], None]] = {
+            ArtifactType.TRANSCRIPT_TXT: lambda handle: handle.write(self._build_txt(job, profile, post_edit_result)),
+            ArtifactType.SUBTITLE_SRT: lambda handle: self.subtitle_formatter.write(entries, "srt", handle),
+            ArtifactType.SUBTITLE_VTT: lambda handle: self.subtitle_formatter.write(entries, "vtt", handle),
+            ArtifactType.STRUCTURED_JSON: lambda handle: self.json_writer.write_object(
+                handle, self._json_fields(job, profile, post_edit_result, warnings)
+            ),
+        }
+        writers: List[Tuple[ArtifactType, Path, Callable[[TextIO], None]]] = [
+            (artifact_type, path, renderers[artifact_type]) for artifact_type, path in targets if artifact_type in stale
+        ]
+
+        if self.parallel_writes and len(writers) > 1:
+            with ThreadPoolExecutor(max_workers=len(writers), thread_name_prefix=f"artifacts-{job.id}") as executor:
+                futures = [executor.submit(self._write_atomic, path, render) for _, path, render in writers]
+                timings = [future.result() for future in futures]
+        else:
+            timings = [self._write_atomic(path, render) for _, path, render in writers]
+        if self.incremental and writers:
+            self._write_atomic(manifest_path, lambda handle: json.dump(fingerprints, handle, indent=2, sort_keys=True))
+
+        if self.metric_dispatcher:
+            for (artifact_type, path, _), (render_ms, commit_ms, size) in zip(writers, timings):
+                self.metric_dispatcher(
+                    "artifacts.format.written",
+                    {
+                        "job_id": job.id,
+                        "format": artifact_type.value,
+                        "render_ms": render_ms,
+                        "commit_ms": commit_ms,
+                        "bytes": size,
+                        "parallel": self.parallel_writes,
+                    },
+                )
+            for artifact_type, _ in targets:
+                if artifact_type not in stale:
+                    self.metric_dispatcher(
+                        "artifacts.format.reused", {"job_id": job.id, "format": artifact_type.value}
+                    )
+        return [self._artifact(job, artifact_type, path, job.version) for artifact_type, path in targets]
+
+    def _fingerprints(self, job: Job, profile: Profile, post_edit_result: PostEditResult) -> Dict[str, str]:
+        """Hashes the inputs each format is rendered from (see the class docstring)."""
+        rules = asdict(profile.subtitle_rules())
+        segments = [
+            [segment.id, segment.start, segment.end, segment.text, segment.speaker]
+            for segment in post_edit_result.segments
+        ]
+        optimizer = vars(self.cue_optimizer) if self.cue_optimizer else None
+        subtitles = _digest(segments, rules, optimizer)
+        header, body, template_id, language = self._txt_sources(job, profile, post_edit_result)
+        template = None
+        if self.template_registry:
+            resolved = self.template_registry.resolve(template_id, language)
+            template = [resolved.id, resolved.locale, resolved.body]
+        return {
+            ArtifactType.TRANSCRIPT_TXT.value: _digest(header, body, template_id, language, template),
+            ArtifactType.SUBTITLE_SRT.value: subtitles,
+            ArtifactType.SUBTITLE_VTT.value: subtitles,
+            ArtifactType.STRUCTURED_JSON.value: _digest(
+                job.id,
+                profile.id,
+                post_edit_result.language or job.language,
+                post_edit_result.text,
+                segments,
+                post_edit_result.flags,
+                rules,
+                optimizer,
+                _json_metadata(job),
+                self.json_writer.compact,
+            ),
+        }
+
+    @staticmethod
+    def _read_manifest(path: Path) -> Dict[str, str]:
+        try:
+            recorded = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return recorded if isinstance(recorded, dict) else {}
+
+    @staticmethod
+    def _write_atomic(path: Path, render: Callable[[TextIO], None]) -> Tuple[float, float, int]:
+        """Streams ``render`` into a temp file next to ``path`` and swaps it in with ``os.replace``.
+
+        Returns (render_ms, commit_ms, bytes): render covers producing and writing the
+        content, commit covers the final flush/close plus the rename.
+        """
+        # Unique per call so concurrent builds of the same job never write the same temp file.
+        tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        try:
+            start = time.perf_counter()
+            handle = tmp_path.open("w", encoding="utf-8")
+            try:
+                render(handle)
+                rendered = time.perf_counter()
+            finally:
+                handle.close()
+            os.replace(tmp_path, path)
+            committed = time.perf_counter()
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return (
+            round((rendered - start) * 1000, 3),
+            round((committed - rendered) * 1000, 3),
+            path.stat().st_size,
+        )
+
+    @staticmethod
+    def _json_fields(
+        job: Job, profile: Profile, post_edit_result: PostEditResult, warnings: List[str]
+    ) -> List[Tuple[str, Any]]:
+        segments = (
+            {
+                "id": segment.id,
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "speaker": segment.speaker,
+            }
+            for segment in post_edit_result.segments
+        )
+        return [
+            ("job_id", job.id),
+            ("profile", profile.id),
+            ("language", post_edit_result.language or job.language),
+            ("text", post_edit_result.text),
+            ("segments", StreamedArray(segments)),
+            ("flags", post_edit_result.flags),
+            ("warnings", warnings),
+            ("metadata", _json_metadata(job)),
+        ]
+
+    def _txt_sources(
+        self,
+        job: Job,
+        profile: Profile,
+        post_edit_result: PostEditResult,
+        template_id: Optional[str] = None,
+        locale: Optional[str] = None,
+    ) -> Tuple[str, str, Optional[str], Optional[str]]:
         header_lines = [
             f"Arquivo original: {job.source_path.name}",
             f"Perfil editorial: {profile.id}",
@@ -91,11 +255,32 @@ class FilesystemArtifactBuilder(ArtifactBuilder):
             header_lines.extend([f"- {text}" for text in disclaimers])
         header = "\n".join(header_lines)
         body = post_edit_result.text.strip()
+        template_id = template_id or job.metadata.get("delivery_template") or profile.meta.get("delivery_template")
+        language = (
+            locale
+            or job.metadata.get("delivery_locale")
+            or post_edit_result.language
+            or job.language
+            or profile.meta.get("language")
+        )
+        return header, body, template_id, language
+
+    def _build_txt(self, job: Job, profile: Profile, post_edit_result: PostEditResult) -> str:
+        return self.render_txt(job, profile, post_edit_result)
+
+    def render_txt(
+        self,
+        job: Job,
+        profile: Profile,
+        post_edit_result: PostEditResult,
+        template_id: Optional[str] = None,
+        locale: Optional[str] = None,
+    ) -> str:
+        """Renders the TXT artifact body, optionally with another template or locale than the job's."""
+        header, body, template_id, language = self._txt_sources(job, profile, post_edit_result, template_id, locale)
         if not self.template_registry:
             return f"{header}\n\n{body}\n"
 
-        template_id = job.metadata.get("delivery_template") or profile.meta.get("delivery_template")
-        language = job.metadata.get("delivery_locale") or post_edit_result.language or job.language or profile.meta.get("language")
         rendered = self.template_registry.render(
             template_id,
             {
@@ -118,3 +303,12 @@ class FilesystemArtifactBuilder(ArtifactBuilder):
             path=path,
             version=version,
         )
+
+
+def _json_metadata(job: Job) -> Dict[str, Any]:
+    return {key: value for key, value in job.metadata.items() if key not in TXT_ONLY_METADATA}
+
+
+def _digest(*parts: Any) -> str:
+    encoded = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
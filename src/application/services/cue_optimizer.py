@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Optional
+
+from domain.entities.profile import Profile, SubtitleConfig
+from domain.entities.transcription import Segment
+
+from .line_breaker import break_lines, split_cues
+
+
+class CueOptimizer:
+    """Turns post-edited segments into subtitle cues that satisfy the profile's SubtitleConfig.
+
+    One linear pass splits segments that do not fit ``max_lines`` lines, merges
+    short or too-fast neighbours of the same speaker while the result still
+    fits, and finally stretches cues into the following gap until they reach
+    the reading speed. Cue text is returned already broken into lines.
+    """
+
+    def __init__(self, max_merge_gap: float = 0.5, min_duration: float = 1.0, min_gap: float = 0.04) -> None:
+        self.max_merge_gap = max_merge_gap
+        self.min_duration = min_duration
+        self.min_gap = min_gap
+
+    def optimize(self, segments: Iterable[Segment], profile: Profile) -> List[Segment]:
+        rules = profile.subtitle_rules()
+        cues: List[Segment] = []
+        for piece in self._split(segments, rules):
+            if cues and self._should_merge(cues[-1], piece, rules):
+                cues[-1] = self._merge(cues[-1], piece)
+            else:
+                cues.append(piece)
+        self._retime(cues, rules)
+        for index, cue in enumerate(cues):
+            cue.id = index
+            cue.text = "\n".join(break_lines(cue.text, rules.max_chars_per_line, rules.line_breaking))
+        return cues
+
+    def _split(self, segments: Iterable[Segment], rules: SubtitleConfig) -> Iterator[Segment]:
+        for segment in segments:
+            lines = break_lines(segment.text, rules.max_chars_per_line, rules.line_breaking)
+            for start, end, cue_lines in split_cues(lines, rules.max_lines, segment.start, segment.end):
+                yield Segment(
+                    id=segment.id,
+                    start=start,
+                    end=end,
+                    text=" ".join(cue_lines),
+                    speaker=segment.speaker,
+                    confidence=segment.confidence,
+                )
+
+    def _should_merge(self, previous: Segment, current: Segment, rules: SubtitleConfig) -> bool:
+        if previous.speaker != current.speaker or not previous.text or not current.text:
+            return False
+        if current.start - previous.end > self.max_merge_gap:
+            return False
+        if not (self._needs_help(previous, rules) or self._needs_help(current, rules)):
+            return False
+        combined = f"{previous.text} {current.text}"
+        if len(combined) > rules.max_chars_per_line * rules.max_lines + rules.max_lines - 1:
+            return False
+        return len(break_lines(combined, rules.max_chars_per_line, rules.line_breaking)) <= rules.max_lines
+
+    def _needs_help(self, cue: Segment, rules: SubtitleConfig) -> bool:
+        duration = cue.end - cue.start
+        return duration < self.min_duration or len(cue.text) > rules.reading_speed_cps * max(duration, 0.0)
+
+    @staticmethod
+    def _merge(previous: Segment, current: Segment) -> Segment:
+        return Segment(
+            id=previous.id,
+            start=previous.start,
+            end=max(previous.end, current.end),
+            text=f"{previous.text} {current.text}",
+            speaker=previous.speaker,
+            confidence=_min_confidence(previous.confidence, current.confidence),
+        )
+
+    def _retime(self, cues: List[Segment], rules: SubtitleConfig) -> None:
+        cps = max(rules.reading_speed_cps, 1)
+        for index, cue in enumerate(cues):
+            target = cue.start + max(len(cue.text) / cps, self.min_duration)
+            if cue.end >= target:
+                continue
+            if index + 1 < len(cues):
+                target = min(target, cues[index + 1].start - self.min_gap)
+            cue.end = max(cue.end, target)
+
+
+def _min_confidence(first: Optional[float], second: Optional[float]) -> Optional[float]:
+    values = [value for value in (first, second) if value is not None]
+    return min(values) if values else None
+
+
+__all__ = ["CueOptimizer"]
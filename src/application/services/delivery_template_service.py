@@ -1,11 +1,27 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 
+_PLACEHOLDER_PATTERN = re.compile(r"{{\s*([\w\.]+)\s*}}")
+
+
+def compile_template(body: str) -> Tuple[str, ...]:
+    """Splits a body into alternating literal and placeholder parts (literal, key, literal, ..., literal)."""
+    return tuple(_PLACEHOLDER_PATTERN.split(body))
+
+
+def render_parts(parts: Tuple[str, ...], context: Dict[str, str]) -> str:
+    chunks = list(parts)
+    chunks[1::2] = [context.get(key, "") for key in parts[1::2]]
+    return "".join(chunks)
+
+
 @dataclass(frozen=True)
 class DeliveryTemplate:
     """Represents a formatted template that can be applied to TXT outputs."""
@@ -16,21 +32,69 @@ class DeliveryTemplate:
     body: str
     source_path: Path
     locale: Optional[str] = None
+    parts: Tuple[str, ...] = field(default=(), repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.parts:
+            object.__setattr__(self, "parts", compile_template(self.body))
+
+    def render(self, context: Dict[str, str]) -> str:
+        return render_parts(self.parts, context).strip() + "\n"
 
 
 class DeliveryTemplateRegistry:
-    """Loads and caches TXT templates with YAML front matter definitions."""
+    """Loads and caches TXT templates with YAML front matter definitions.
+
+    Templates are compiled once when loaded. The directory is scanned lazily and at
+    most every ``refresh_interval`` seconds; only files whose mtime changed are
+    parsed again, and deleted files drop out of the index.
+    """
 
-    def __init__(self, base_dir: Path) -> None:
+    def __init__(self, base_dir: Path, refresh_interval: float = 2.0) -> None:
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.refresh_interval = refresh_interval
         self._base_templates: Dict[str, DeliveryTemplate] = {}
         self._localized_templates: Dict[Tuple[str, str], DeliveryTemplate] = {}
         self._loaded_paths: Dict[str, DeliveryTemplate] = {}
+        self._mtimes: Dict[str, int] = {}
+        self._checked_at: Optional[float] = None
+        self._lock = threading.RLock()
         self._list_cache: List[DeliveryTemplate] | None = None
-        self._load_all_templates()
+
+    def refresh(self, force: bool = False) -> bool:
+        """Re-reads templates whose files changed since the last scan. Returns True if the index changed."""
+        if not force and self._is_fresh():
+            return False
+        with self._lock:
+            if not force and self._is_fresh():
+                return False
+            current: Dict[str, Tuple[Path, int]] = {}
+            for path in self.base_dir.rglob("*.template.txt"):
+                try:
+                    current[str(path)] = (path, path.stat().st_mtime_ns)
+                except OSError:
+                    continue
+            changed = [path for key, (path, mtime) in current.items() if self._mtimes.get(key) != mtime]
+            removed = [key for key in self._loaded_paths if key not in current]
+            for key in removed:
+                self._loaded_paths.pop(key, None)
+                self._mtimes.pop(key, None)
+            for path in changed:
+                try:
+                    self._load_template(path)
+                except FileNotFoundError:
+                    continue
+            if changed or removed:
+                self._rebuild_index()
+            self._checked_at = time.monotonic()
+            return bool(changed or removed)
+
+    def _is_fresh(self) -> bool:
+        return self._checked_at is not None and time.monotonic() - self._checked_at < self.refresh_interval
 
     def list_templates(self) -> List[DeliveryTemplate]:
+        self.refresh()
         if self._list_cache is not None:
             return list(self._list_cache)
         templates: Dict[str, DeliveryTemplate] = {}
@@ -42,13 +106,16 @@ class DeliveryTemplateRegistry:
 
     def get(self, template_id: Optional[str]) -> DeliveryTemplate:
         """Retorna o template lógico e carrega se necessário."""
+        self.refresh()
         candidate = (template_id or self.default_template_id).strip()
         if not candidate:
             raise FileNotFoundError("Nenhum template definido.")
         if candidate not in self._base_templates:
             path = self.base_dir / f"{candidate}.template.txt"
             if path.exists():
-                loaded_id = self._load_template(path)
+                with self._lock:
+                    loaded_id = self._load_template(path)
+                    self._rebuild_index()
                 return self._base_templates[loaded_id]
             default = self._base_templates.get(self.default_template_id)
             if default:
@@ -58,24 +125,20 @@ class DeliveryTemplateRegistry:
 
     @property
     def default_template_id(self) -> str:
+        self.refresh()
         if "default" in self._base_templates:
             return "default"
         if self._base_templates:
             return next(iter(self._base_templates))
         return "default"
 
-    def render(self, template_id: Optional[str], context: Dict[str, str], language: Optional[str] = None) -> str:
+    def resolve(self, template_id: Optional[str], language: Optional[str] = None) -> DeliveryTemplate:
+        """Returns the template ``render`` would use for this id and language."""
         template = self._get_localized(template_id, language) if language else None
-        if template is None:
-            template = self.get(template_id)
-        pattern = re.compile(r"{{\s*([\w\.]+)\s*}}")
-
-        def replace(match: re.Match[str]) -> str:
-            key = match.group(1)
-            return context.get(key, "")
+        return template if template is not None else self.get(template_id)
 
-        rendered = pattern.sub(replace, template.body)
-        return rendered.strip() + "\n"
+    def render(self, template_id: Optional[str], context: Dict[str, str], language: Optional[str] = None) -> str:
+        return self.resolve(template_id, language).render(context)
 
     def _normalize_locale(self, value: Optional[str]) -> Optional[str]:
         if not value:
@@ -85,11 +148,12 @@ class DeliveryTemplateRegistry:
 
     def _load_template(self, path: Path) -> str:
         """
-        Carrega um template e registra em _base_templates usando o ID lógico correto.
-        Retorna o identificador utilizado.
+        Carrega um template em _loaded_paths usando o ID lógico correto; o índice
+        público só muda em _rebuild_index. Retorna o identificador utilizado.
         """
         if not path.exists():
             raise FileNotFoundError(f"Template nao encontrado: {path}")
+        mtime = path.stat().st_mtime_ns
         raw = path.read_text(encoding="utf-8")
         metadata, body = self._split_front_matter(raw)
 
@@ -112,27 +176,37 @@ class DeliveryTemplateRegistry:
             source_path=path,
             locale=locale,
         )
-        resolved = str(path.resolve())
-        self._loaded_paths[resolved] = document
-        stem_id = path.stem.replace(".template", "").strip()
+        self._loaded_paths[str(path)] = document
+        self._mtimes[str(path)] = mtime
+        return template_id
+
+    @staticmethod
+    def _register(
+        document: DeliveryTemplate,
+        base: Dict[str, DeliveryTemplate],
+        localized: Dict[Tuple[str, str], DeliveryTemplate],
+    ) -> None:
+        template_id = document.id
+        locale = document.locale
+        stem_id = document.source_path.stem.replace(".template", "").strip()
         if locale:
-            self._localized_templates[(template_id, locale)] = document
-            self._base_templates.setdefault(template_id, document)
+            localized[(template_id, locale)] = document
+            base.setdefault(template_id, document)
             if stem_id:
-                self._base_templates.setdefault(stem_id, document)
+                base.setdefault(stem_id, document)
         else:
-            self._base_templates[template_id] = document
+            base[template_id] = document
             if stem_id:
-                self._base_templates.setdefault(stem_id, document)
-        self._invalidate_cache()
-        return template_id
+                base.setdefault(stem_id, document)
 
-    def _load_all_templates(self) -> None:
-        for path in sorted(self.base_dir.rglob("*.template.txt")):
-            try:
-                self._load_template(path)
-            except FileNotFoundError:
-                continue
+    def _rebuild_index(self) -> None:
+        # Built aside and swapped in so concurrent readers never see a half-filled index.
+        base: Dict[str, DeliveryTemplate] = {}
+        localized: Dict[Tuple[str, str], DeliveryTemplate] = {}
+        for key in sorted(self._loaded_paths):
+            self._register(self._loaded_paths[key], base, localized)
+        self._base_templates, self._localized_templates = base, localized
+        self._invalidate_cache()
 
     def _invalidate_cache(self) -> None:
         self._list_cache = None
@@ -150,20 +224,12 @@ class DeliveryTemplateRegistry:
     def _get_localized(self, template_id: Optional[str], language: Optional[str]) -> Optional[DeliveryTemplate]:
         if not language:
             return None
+        self.refresh()
         slug = template_id or self.default_template_id
         normalized_lang = self._normalize_locale(language)
         if not normalized_lang:
             return None
         key = (slug, normalized_lang)
-        if key in self._localized_templates:
-            return self._localized_templates[key]
-        # Attempt to load localized files lazily.
-        for path in self.base_dir.rglob(f"{slug}.template.txt"):
-            resolved = str(path.resolve())
-            if resolved not in self._loaded_paths:
-                loaded_id = self._load_template(path)
-                if (loaded_id, normalized_lang) in self._localized_templates:
-                    return self._localized_templates[(loaded_id, normalized_lang)]
         if key in self._localized_templates:
             return self._localized_templates[key]
         prefix = normalized_lang.split("-")[0]
@@ -187,4 +253,4 @@ class DeliveryTemplateRegistry:
         return {}, raw_text
 
 
-__all__ = ["DeliveryTemplate", "DeliveryTemplateRegistry"]
+__all__ = ["DeliveryTemplate", "DeliveryTemplateRegistry", "compile_template", "render_parts"]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+def encode_tokens(reference: Sequence[Hashable], hypothesis: Sequence[Hashable]) -> Tuple[List[int], List[int]]:
+    """Maps both token sequences onto a shared integer alphabet."""
+    vocabulary: Dict[Hashable, int] = {}
+    encoded_reference = [vocabulary.setdefault(token, len(vocabulary)) for token in reference]
+    encoded_hypothesis = [vocabulary.setdefault(token, len(vocabulary)) for token in hypothesis]
+    return encoded_reference, encoded_hypothesis
+
+
+def levenshtein(reference: Sequence[Hashable], hypothesis: Sequence[Hashable], band: Optional[int] = None) -> int:
+    """Token-level edit distance (unit costs).
+
+    Common prefix/suffix are trimmed first; the remainder runs through the
+    bit-parallel kernel, or through the banded DP when ``band`` is given and
+    the lengths differ by at most ``band``.
+    """
+    ref_ids, hyp_ids = encode_tokens(reference, hypothesis)
+    ref_ids, hyp_ids = _trim_common_affixes(ref_ids, hyp_ids)
+    if not ref_ids:
+        return len(hyp_ids)
+    if not hyp_ids:
+        return len(ref_ids)
+    if band is not None and abs(len(ref_ids) - len(hyp_ids)) <= band:
+        return banded_levenshtein(ref_ids, hyp_ids, band)
+    return bit_parallel_levenshtein(ref_ids, hyp_ids)
+
+
+def bit_parallel_levenshtein(reference: Sequence[int], hypothesis: Sequence[int]) -> int:
+    """Myers/Hyyro bit-vector edit distance over integer token ids.
+
+    Python integers act as arbitrarily wide bit-vectors, so the longer
+    sequence is encoded as the pattern and the loop runs once per token of
+    the shorter one.
+    """
+    if len(reference) < len(hypothesis):
+        reference, hypothesis = hypothesis, reference
+    length = len(reference)
+    if length == 0:
+        return len(hypothesis)
+    if not hypothesis:
+        return length
+
+    match_masks: Dict[int, int] = {}
+    for position, token in enumerate(reference):
+        match_masks[token] = match_masks.get(token, 0) | (1 << position)
+
+    full = (1 << length) - 1
+    high_bit = 1 << (length - 1)
+    vertical_pos = full
+    vertical_neg = 0
+    score = length
+    for token in hypothesis:
+        eq = match_masks.get(token, 0)
+        xv = eq | vertical_neg
+        xh = ((((eq & vertical_pos) + vertical_pos) & full) ^ vertical_pos) | eq
+        horizontal_pos = vertical_neg | (~(xh | vertical_pos) & full)
+        horizontal_neg = vertical_pos & xh
+        if horizontal_pos & high_bit:
+            score += 1
+        elif horizontal_neg & high_bit:
+            score -= 1
+        horizontal_pos = ((horizontal_pos << 1) | 1) & full
+        horizontal_neg = (horizontal_neg << 1) & full
+        vertical_pos = horizontal_neg | (~(xv | horizontal_pos) & full)
+        vertical_neg = horizontal_pos & xv
+    return score
+
+
+def banded_levenshtein(reference: Sequence[int], hypothesis: Sequence[int], band: int) -> int:
+    """Ukkonen banded DP; the band doubles until the result fits inside it."""
+    rows, cols = len(reference), len(hypothesis)
+    band = max(1, band, abs(rows - cols))
+    while True:
+        band = min(band, max(rows, cols))
+        distance = _banded_pass(reference, hypothesis, band)
+        if distance <= band or band >= max(rows, cols):
+            return distance
+        band *= 2
+
+
+def _banded_pass(reference: Sequence[int], hypothesis: Sequence[int], band: int) -> int:
+    # Rows only keep the 2*band+1 cells of the diagonal strip: column j of
+    # row i lives at offset j - i + band.
+    rows, cols = len(reference), len(hypothesis)
+    width = 2 * band + 1
+    outside = rows + cols + 1
+    previous = [outside] * width
+    for offset in range(band, width):
+        column = offset - band
+        if column <= cols:
+            previous[offset] = column
+    for i in range(1, rows + 1):
+        current = [outside] * width
+        if i <= band:
+            current[band - i] = i
+        ref_token = reference[i - 1]
+        low = max(1, i - band)
+        high = min(cols, i + band)
+        offset = low - i + band
+        left = current[offset - 1] if offset > 0 else outside
+        best = left
+        for j in range(low, high + 1):
+            cost = 0 if ref_token == hypothesis[j - 1] else 1
+            upper = previous[offset + 1] if offset + 1 < width else outside
+            left = min(left + 1, upper + 1, previous[offset] + cost)
+            current[offset] = left
+            if left < best:
+                best = left
+            offset += 1
+        if best > band:
+            return outside
+        previous = current
+    return previous[cols - rows + band]
+
+
+def _trim_common_affixes(reference: List[int], hypothesis: List[int]) -> Tuple[List[int], List[int]]:
+    start = 0
+    limit = min(len(reference), len(hypothesis))
+    while start < limit and reference[start] == hypothesis[start]:
+        start += 1
+    end_ref, end_hyp = len(reference), len(hypothesis)
+    while end_ref > start and end_hyp > start and reference[end_ref - 1] == hypothesis[end_hyp - 1]:
+        end_ref -= 1
+        end_hyp -= 1
+    return reference[start:end_ref], hypothesis[start:end_hyp]
+
+
+__all__ = ["banded_levenshtein", "bit_parallel_levenshtein", "encode_tokens", "levenshtein"]
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+from domain.entities.job import Job
+from domain.entities.job_event import JobEvent
+from domain.entities.value_objects import JobEventType
+from domain.ports.services import JobEventPublisher, JobStatusPublisher
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[JobEvent], None]
+BatchHandler = Callable[[List[JobEvent]], None]
+
+
+@dataclass
+class _Subscriber:
+    name: str
+    handler: EventHandler
+    event_types: Optional[FrozenSet[JobEventType]]
+    batch_handler: Optional[BatchHandler] = None
+    queue: Deque[Union[JobEvent, List[JobEvent]]] = field(default_factory=deque)
+    scheduled: bool = False
+    dropped: int = 0
+
+
+class JobEventBus(JobEventPublisher, JobStatusPublisher):
+    """In-process bus that fans job events out to subscribers on a bounded thread pool.
+
+    ``emit`` only enqueues, so publishers never wait on a sink. Each subscriber has
+    its own queue of at most ``max_pending`` events, drained in order by one worker
+    at a time; when a slow subscriber's queue is full new events for it are
+    dropped (and counted) instead of piling up. ``publish(job)`` keeps the old
+    ``JobStatusPublisher`` contract by emitting ``STATUS_CHANGED``;
+    ``publish_many``/``emit_many`` hand a whole batch to subscribers registered
+    with a ``batch_handler`` (one sheet write for a bulk review) and single events
+    to the others. With ``max_workers=0`` handlers run inline, which is handy for
+    scripts and tests.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_pending: int = 1000,
+        metric_dispatcher: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> None:
+        self.max_pending = max(1, max_pending)
+        self.metric_dispatcher = metric_dispatcher
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job-events") if max_workers > 0 else None
+        )
+        self._subscribers: List[_Subscriber] = []
+        self._condition = threading.Condition()
+        self._active = 0
+        self._closed = False
+
+    def subscribe(
+        self,
+        handler: EventHandler,
+        event_types: Optional[Iterable[JobEventType]] = None,
+        name: Optional[str] = None,
+        batch_handler: Optional[BatchHandler] = None,
+    ) -> Callable[[], None]:
+        """Registers ``handler`` for ``event_types`` (all when None); returns a function that unsubscribes it.
+
+        ``batch_handler``, when given, receives the matching events of one ``emit_many`` call together.
+        """
+        subscriber = _Subscriber(
+            name=name or getattr(handler, "__name__", type(handler).__name__),
+            handler=handler,
+            event_types=frozenset(event_types) if event_types is not None else None,
+            batch_handler=batch_handler,
+        )
+        with self._condition:
+            self._subscribers.append(subscriber)
+
+        def unsubscribe() -> None:
+            with self._condition:
+                if subscriber in self._subscribers:
+                    self._subscribers.remove(subscriber)
+                subscriber.queue.clear()
+
+        return unsubscribe
+
+    def publish(self, job: Job) -> None:
+        self.emit(JobEvent.for_job(JobEventType.STATUS_CHANGED, job))
+
+    def publish_many(self, jobs: Iterable[Job]) -> None:
+        self.emit_many([JobEvent.for_job(JobEventType.STATUS_CHANGED, job) for job in jobs])
+
+    def emit(self, event: JobEvent) -> None:
+        self.emit_many([event])
+
+    def emit_many(self, events: List[JobEvent]) -> None:
+        to_schedule: List[Tuple[_Subscriber, List[Union[JobEvent, List[JobEvent]]]]] = []
+        dropped: List[Tuple[_Subscriber, JobEvent]] = []
+        with self._condition:
+            if self._closed or not events:
+                return
+            for subscriber in self._subscribers:
+                matching = [
+                    event
+                    for event in events
+                    if subscriber.event_types is None or event.type in subscriber.event_types
+                ]
+                if not matching:
+                    continue
+                items: List[Union[JobEvent, List[JobEvent]]] = (
+                    [matching] if subscriber.batch_handler and len(matching) > 1 else list(matching)
+                )
+                if self._executor is None:
+                    to_schedule.append((subscriber, items))
+                    continue
+                for item in items:
+                    if len(subscriber.queue) >= self.max_pending:
+                        for event in item if isinstance(item, list) else [item]:
+                            subscriber.dropped += 1
+                            dropped.append((subscriber, event))
+                        continue
+                    subscriber.queue.append(item)
+                if subscriber.queue and not subscriber.scheduled:
+                    subscriber.scheduled = True
+                    self._active += 1
+                    to_schedule.append((subscriber, []))
+        for subscriber, event in dropped:
+            self._report_drop(subscriber, event)
+        for subscriber, items in to_schedule:
+            if self._executor is None:
+                for item in items:
+                    self._call(subscriber, item)
+            else:
+                self._executor.submit(self._drain, subscriber)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every queued event was handled; returns False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._active == 0, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> bool:
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=flushed)
+        return flushed
+
+    def pending_count(self) -> int:
+        with self._condition:
+            return sum(len(subscriber.queue) for subscriber in self._subscribers)
+
+    def _drain(self, subscriber: _Subscriber) -> None:
+        while True:
+            with self._condition:
+                if not subscriber.queue:
+                    subscriber.scheduled = False
+                    self._active -= 1
+                    self._condition.notify_all()
+                    return
+                item = subscriber.queue.popleft()
+            self._call(subscriber, item)
+
+    def _call(self, subscriber: _Subscriber, item: Union[JobEvent, List[JobEvent]]) -> None:
+        try:
+            if isinstance(item, list):
+                subscriber.batch_handler(item)  # type: ignore[misc]
+            else:
+                subscriber.handler(item)
+        except Exception as exc:  # a failing sink must not affect the others
+            event = item[0] if isinstance(item, list) else item
+            logger.warning(
+                "Assinante %s falhou ao tratar %s do job %s: %s", subscriber.name, event.type.value, event.job_id, exc
+            )
+
+    def _report_drop(self, subscriber: _Subscriber, event: JobEvent) -> None:
+        logger.warning(
+            "Fila do assinante %s cheia; evento %s do job %s descartado",
+            subscriber.name,
+            event.type.value,
+            event.job_id,
+        )
+        if self.metric_dispatcher:
+            self.metric_dispatcher(
+                "events.dropped",
+                {
+                    "subscriber": subscriber.name,
+                    "event": event.type.value,
+                    "job_id": event.job_id,
+                    "dropped": subscriber.dropped,
+                },
+            )
+
+
+def metrics_subscriber(metric_dispatcher: Callable[[str, Dict[str, Any]], None]) -> EventHandler:
+    """Builds a handler that records every event as an ``events.<type>`` metric."""
+
+    def handle(event: JobEvent) -> None:
+        payload = {key: value for key, value in event.to_dict().items() if key != "type"}
+        metric_dispatcher(f"events.{event.type.value}", payload)
+
+    return handle
+
+
+__all__ = ["JobEventBus", "metrics_subscriber"]
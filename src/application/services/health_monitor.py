@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+Probe = Callable[[], Dict[str, Any]]
+
+
+class HealthMonitor:
+    """Runs health probes on a background thread and serves the latest result.
+
+    ``probe`` does the slow part (disk writes, HTTP checks) every ``interval_sec``;
+    ``snapshot`` only copies the cached result and adds ``checked_at``/``age_sec``.
+    ``needs_refresh`` tells callers when the cache cannot be trusted (nothing
+    probed yet, a different configuration ``key``, or a result older than
+    ``max_age_sec`` because the thread stalled) so they can ``refresh`` off the
+    request path. Concurrent refreshes share one probe run.
+    """
+
+    def __init__(self, probe: Probe, interval_sec: float = 15.0, max_age_sec: Optional[float] = None) -> None:
+        self.probe = probe
+        self.interval_sec = max(0.1, interval_sec)
+        self.max_age_sec = max_age_sec if max_age_sec is not None else self.interval_sec * 3
+        self._result: Optional[Dict[str, Any]] = None
+        self._key: Any = None
+        self._checked_at: Optional[datetime] = None
+        self._checked_monotonic = 0.0
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="health-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def needs_refresh(self, key: Any = None) -> bool:
+        if self._result is None or self._key != key:
+            return True
+        return time.monotonic() - self._checked_monotonic > self.max_age_sec
+
+    def refresh(self, key: Any = None, force: bool = False) -> None:
+        with self._refresh_lock:
+            if not force and not self.needs_refresh(key):
+                return  # another caller refreshed while we waited
+            try:
+                result = self.probe()
+            except Exception:
+                logger.warning("Falha ao executar probes de saude.", exc_info=True)
+                result = {"status": "unknown"}
+            self._result, self._key = result, key
+            self._checked_at = datetime.now(timezone.utc)
+            self._checked_monotonic = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        if self._result is None or self._checked_at is None:
+            return {"status": "unknown"}
+        data = dict(self._result)
+        data["checked_at"] = self._checked_at.isoformat()
+        data["age_sec"] = round(time.monotonic() - self._checked_monotonic, 3)
+        return data
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_sec):
+            self.refresh(self._key, force=True)
+
+
+__all__ = ["HealthMonitor"]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Optional, TextIO, Tuple
+
+try:  # Optional accelerator
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - orjson is not a hard dependency
+    orjson = None
+
+
+class StreamedArray:
+    """Marks a field whose items are serialized one by one instead of as a whole list."""
+
+    def __init__(self, items: Iterable[Any]) -> None:
+        self.items = items
+
+
+class JsonStreamWriter:
+    """Writes a top-level JSON object field by field to a text handle.
+
+    Pretty output is always produced by the stdlib encoder and is byte-identical
+    with ``json.dumps(..., ensure_ascii=False, indent=2)``. ``compact`` drops
+    whitespace entirely and uses orjson for each value when installed (falling
+    back to the stdlib for values it cannot encode); orjson output may differ in
+    number formatting (``1e-05`` vs ``1e-5``/``0.00001``, ``1e+16`` vs ``1e16``)
+    and writes non-finite floats as ``null`` instead of ``NaN``/``Infinity``.
+    """
+
+    def __init__(self, compact: bool = False, use_orjson: bool = True) -> None:
+        self.compact = compact
+        self.use_orjson = compact and use_orjson and orjson is not None
+
+    def write_object(self, handle: TextIO, fields: Iterable[Tuple[str, Any]]) -> None:
+        if self.compact:
+            opening, separator, closing, key_separator = "{", ",", "}", ":"
+        else:
+            opening, separator, closing, key_separator = "{\n  ", ",\n  ", "\n}", ": "
+        first = True
+        for key, value in fields:
+            handle.write(opening if first else separator)
+            first = False
+            handle.write(self._dumps(key, 0))
+            handle.write(key_separator)
+            if isinstance(value, StreamedArray):
+                self._write_array(handle, value.items)
+            else:
+                handle.write(self._dumps(value, 1))
+        handle.write("{}" if first else closing)
+
+    def _write_array(self, handle: TextIO, items: Iterable[Any]) -> None:
+        if self.compact:
+            opening, separator, closing = "[", ",", "]"
+        else:
+            opening, separator, closing = "[\n    ", ",\n    ", "\n  ]"
+        first = True
+        for item in items:
+            handle.write(opening if first else separator)
+            first = False
+            handle.write(self._dumps(item, 2))
+        handle.write("[]" if first else closing)
+
+    def _dumps(self, value: Any, depth: int) -> str:
+        encoded: Optional[str] = None
+        if self.use_orjson:
+            try:
+                encoded = orjson.dumps(value).decode("utf-8")
+            except TypeError:
+                encoded = None
+        if encoded is None:
+            if self.compact:
+                encoded = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+            else:
+                encoded = json.dumps(value, ensure_ascii=False, indent=2)
+        if depth and not self.compact and "\n" in encoded:
+            encoded = encoded.replace("\n", "\n" + "  " * depth)
+        return encoded
+
+
+__all__ = ["JsonStreamWriter", "StreamedArray"]
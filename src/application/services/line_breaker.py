@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+GREEDY = "greedy"
+BALANCED = "balanced"
+
+
+def break_lines(text: str, max_chars: int, strategy: str = GREEDY) -> List[str]:
+    """Splits subtitle text into lines of at most ``max_chars`` characters.
+
+    Words longer than a line are cut into ``max_chars`` pieces. ``greedy`` fills
+    each line as much as possible; ``balanced`` keeps the same number of lines
+    but evens out their lengths (minimum sum of squared trailing space).
+    """
+    max_chars = max(1, max_chars)
+    words = _split_words(text, max_chars)
+    if not words:
+        return []
+    lengths = [len(word) for word in words]
+    spans = _greedy_spans(lengths, max_chars)
+    if strategy == BALANCED and len(spans) > 1:
+        spans = _balanced_spans(lengths, max_chars)
+    return [" ".join(words[start:end]) for start, end in spans]
+
+
+def split_cues(lines: Sequence[str], max_lines: int, start: float, end: float) -> List[Tuple[float, float, List[str]]]:
+    """Groups lines into cues of ``max_lines`` and shares the duration by character count."""
+    max_lines = max(1, max_lines)
+    if len(lines) <= max_lines:
+        return [(start, end, list(lines) or [""])]
+    groups = [list(lines[index : index + max_lines]) for index in range(0, len(lines), max_lines)]
+    weights = [sum(len(line) for line in group) for group in groups]
+    total = sum(weights)
+    duration = end - start
+    cues: List[Tuple[float, float, List[str]]] = []
+    consumed = 0
+    cue_start = start
+    for group, weight in zip(groups, weights):
+        consumed += weight
+        cue_end = end if consumed == total else start + duration * consumed / total
+        cues.append((cue_start, cue_end, group))
+        cue_start = cue_end
+    return cues
+
+
+def _split_words(text: str, max_chars: int) -> List[str]:
+    words: List[str] = []
+    for word in text.split():
+        if len(word) <= max_chars:
+            words.append(word)
+        else:
+            words.extend(word[index : index + max_chars] for index in range(0, len(word), max_chars))
+    return words
+
+
+def _greedy_spans(lengths: Sequence[int], max_chars: int) -> List[Tuple[int, int]]:
+    spans: List[Tuple[int, int]] = []
+    line_start = 0
+    width = lengths[0]
+    for index in range(1, len(lengths)):
+        candidate = width + 1 + lengths[index]
+        if candidate <= max_chars:
+            width = candidate
+        else:
+            spans.append((line_start, index))
+            line_start = index
+            width = lengths[index]
+    spans.append((line_start, len(lengths)))
+    return spans
+
+
+def _balanced_spans(lengths: Sequence[int], max_chars: int) -> List[Tuple[int, int]]:
+    count = len(lengths)
+    # Cost = lines * line_weight + raggedness; the weight exceeds any possible
+    # raggedness, so the line count (and thus the cue count) matches greedy.
+    line_weight = (count + 1) * max_chars * max_chars + 1
+    unreachable = (count + 1) * line_weight
+    best = [0] + [unreachable] * count
+    previous = [0] * (count + 1)
+    for end in range(1, count + 1):
+        start = end - 1
+        width = lengths[start]
+        while width <= max_chars:
+            slack = max_chars - width
+            candidate = best[start] + line_weight + slack * slack
+            if candidate < best[end]:
+                best[end] = candidate
+                previous[end] = start
+            if start == 0:
+                break
+            start -= 1
+            width += lengths[start] + 1
+    spans: List[Tuple[int, int]] = []
+    end = count
+    while end > 0:
+        spans.append((previous[end], end))
+        end = previous[end]
+    spans.reverse()
+    return spans
+
+
+__all__ = ["BALANCED", "GREEDY", "break_lines", "split_cues"]
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+from domain.entities.job_event import JobEvent
+from domain.entities.log_entry import LogEntry
+from domain.ports.repositories import LogRepository
+
+logger = logging.getLogger(__name__)
+
+Listener = Callable[[], None]
+
+
+@dataclass(frozen=True)
+class LiveFeedEvent:
+    id: str
+    kind: str
+    data: Dict[str, Any]
+
+
+class LiveFeed:
+    """Replay buffer behind the dashboard event stream.
+
+    Every job event and log entry is serialized once into a bounded ring buffer
+    with ids of the form ``<epoch>-<sequence>``; connected streams read from the
+    shared buffer and are only woken by listeners, so N open dashboards cost one
+    append plus N wake-ups per change. ``since`` replays what a reconnecting
+    client missed (its ``Last-Event-ID``) and asks it to resync when that id was
+    evicted or belongs to a previous process.
+    """
+
+    def __init__(self, history: int = 500) -> None:
+        self._epoch = uuid4().hex[:8]
+        self._events: Deque[LiveFeedEvent] = deque(maxlen=max(1, history))
+        self._sequence = 0
+        self._listeners: List[Listener] = []
+        self._lock = threading.Lock()
+
+    @property
+    def last_event_id(self) -> str:
+        with self._lock:
+            return self._event_id(self._sequence)
+
+    def publish(self, kind: str, data: Dict[str, Any]) -> LiveFeedEvent:
+        with self._lock:
+            self._sequence += 1
+            event = LiveFeedEvent(id=self._event_id(self._sequence), kind=kind, data=data)
+            self._events.append(event)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener()
+            except Exception:  # a closed client must not affect the publisher
+                logger.debug("Ouvinte do feed ao vivo falhou.", exc_info=True)
+        return event
+
+    def since(self, last_event_id: Optional[str]) -> Tuple[List[LiveFeedEvent], bool]:
+        """Returns the events after ``last_event_id`` and whether the client must resync instead."""
+        with self._lock:
+            sequence = self._parse(last_event_id)
+            if sequence is None or sequence > self._sequence:
+                return [], True
+            oldest = self._sequence - len(self._events) + 1
+            if sequence < oldest - 1:
+                return [], True
+            skip = sequence - oldest + 1
+            return list(self._events)[skip:], False
+
+    def add_listener(self, listener: Listener) -> Callable[[], None]:
+        """Calls ``listener`` (from the publishing thread) after each event; returns a function that removes it."""
+        with self._lock:
+            self._listeners.append(listener)
+
+        def remove() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return remove
+
+    def handle_event(self, event: JobEvent) -> None:
+        self.publish("job", job_event_payload(event))
+
+    def handle_log(self, entry: LogEntry) -> None:
+        self.publish("incident", incident_payload(entry))
+
+    def _event_id(self, sequence: int) -> str:
+        return f"{self._epoch}-{sequence}"
+
+    def _parse(self, event_id: Optional[str]) -> Optional[int]:
+        epoch, _, sequence = (event_id or "").partition("-")
+        if epoch != self._epoch or not sequence.isdigit():
+            return None
+        return int(sequence)
+
+
+class ObservedLogRepository:
+    """Log repository decorator that reports every appended entry to ``on_append``."""
+
+    def __init__(self, inner: LogRepository, on_append: Callable[[LogEntry], None]) -> None:
+        self.inner = inner
+        self.on_append = on_append
+
+    def append(self, entry: LogEntry) -> None:
+        self.inner.append(entry)
+        self._notify([entry])
+
+    def append_many(self, entries: Iterable[LogEntry]) -> None:
+        entries = list(entries)
+        append_many = getattr(self.inner, "append_many", None)
+        if append_many:
+            append_many(entries)
+        else:
+            for entry in entries:
+                self.inner.append(entry)
+        self._notify(entries)
+
+    def list_by_job(self, job_id: str) -> List[LogEntry]:
+        return self.inner.list_by_job(job_id)
+
+    def list_recent(self, limit: int = 20) -> List[LogEntry]:
+        return self.inner.list_recent(limit)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+    def _notify(self, entries: List[LogEntry]) -> None:
+        for entry in entries:
+            try:
+                self.on_append(entry)
+            except Exception:  # observers never block the write path
+                logger.warning("Falha ao notificar log do job %s.", entry.job_id, exc_info=True)
+
+
+def job_event_payload(event: JobEvent) -> Dict[str, Any]:
+    payload = event.to_dict()
+    job = event.job
+    if job is not None:
+        payload["job"] = {
+            "id": job.id,
+            "source_name": job.source_path.name if job.source_path else "",
+            "profile_id": job.profile_id,
+            "status": job.status.value,
+            "updated_at": job.updated_at.isoformat(),
+        }
+    return payload
+
+
+def incident_payload(entry: LogEntry) -> Dict[str, Any]:
+    return {
+        "job_id": entry.job_id,
+        "event": entry.event,
+        "level": entry.level.value,
+        "message": entry.message or "",
+        "timestamp": entry.timestamp.isoformat(),
+        "timestamp_human": entry.timestamp.strftime("%d/%m %H:%M"),
+    }
+
+
+__all__ = ["LiveFeed", "LiveFeedEvent", "ObservedLogRepository", "incident_payload", "job_event_payload"]
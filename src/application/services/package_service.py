@@ -1,32 +1,140 @@
 from __future__ import annotations
 
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable, Optional
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from uuid import uuid4
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from domain.entities.artifact import Artifact
 from domain.entities.job import Job
 from domain.ports.services import PackageService, StorageClient
 
+from .zip_stream import StreamingZipWriter, ZipMember, fits_zip32, plan_members
+
 
 class ZipPackageService(PackageService):
-    """Creates delivery ZIPs and mirrors them to optional storage."""
+    """Creates delivery ZIPs and mirrors them to optional storage.
+
+    Members are streamed into a temp file that replaces the final ZIP once complete.
+    Small or already-compressed members are stored, the rest deflated at
+    ``compression_level``; with ``max_workers > 1`` members are compressed in parallel.
+    Archives too large for plain ZIP fall back to ``zipfile`` (ZIP64).
+    """
 
-    def __init__(self, backup_dir: Path, storage_client: Optional[StorageClient] = None) -> None:
+    def __init__(
+        self,
+        backup_dir: Path,
+        storage_client: Optional[StorageClient] = None,
+        compression_level: int = 6,
+        max_workers: int = 1,
+        metric_dispatcher: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> None:
         self.backup_dir = backup_dir
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         self.storage_client = storage_client
+        self.compression_level = max(0, min(9, compression_level))
+        self.max_workers = max(1, max_workers)
+        self.metric_dispatcher = metric_dispatcher
 
     def create_package(self, job: Job, artifacts: Iterable[Artifact]) -> Path:
+        package_path, members = self._plan(job, artifacts)
+        streamed, duration_ms = _write_archive(package_path, members, self.compression_level, self.max_workers)
+        return self._finish(job, package_path, members, streamed, duration_ms)
+
+    def create_packages(
+        self, items: Sequence[Tuple[Job, Iterable[Artifact]]], max_workers: int = 1
+    ) -> List[Union[Path, Exception]]:
+        """Builds several packages, one archive per worker process.
+
+        Returns the package path, or the exception that stopped it, for each item in
+        input order. Archives are written by the workers; metrics and uploads to
+        ``storage_client`` happen in this process once each archive is complete.
+        """
+        results: List[Union[Path, Exception]] = [ValueError("pacote nao gerado")] * len(items)
+        planned: List[Tuple[int, Job, Path, List[ZipMember]]] = []
+        for index, (job, artifacts) in enumerate(items):
+            try:
+                planned.append((index, job, *self._plan(job, artifacts)))
+            except OSError as exc:
+                results[index] = exc
+        if max_workers <= 1 or len(planned) < 2:
+            for index, job, package_path, members in planned:
+                try:
+                    streamed, duration_ms = _write_archive(
+                        package_path, members, self.compression_level, self.max_workers
+                    )
+                    results[index] = self._finish(job, package_path, members, streamed, duration_ms)
+                except Exception as exc:  # one broken package must not abort the batch
+                    results[index] = exc
+            return results
+        level = self.compression_level
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(planned))) as executor:
+            futures = [
+                (index, job, package_path, members, executor.submit(_write_archive, package_path, members, level, 1))
+                for index, job, package_path, members in planned
+            ]
+            for index, job, package_path, members, future in futures:
+                try:
+                    streamed, duration_ms = future.result()
+                    results[index] = self._finish(job, package_path, members, streamed, duration_ms)
+                except Exception as exc:  # one broken package must not abort the batch
+                    results[index] = exc
+        return results
+
+    def _plan(self, job: Job, artifacts: Iterable[Artifact]) -> Tuple[Path, List[ZipMember]]:
         job_backup_dir = self.backup_dir / job.id
         job_backup_dir.mkdir(parents=True, exist_ok=True)
         package_path = job_backup_dir / f"{job.id}_v{job.version}.zip"
-        with ZipFile(package_path, "w", compression=ZIP_DEFLATED) as zip_file:
-            for artifact in artifacts:
-                arcname = f"{job.id}/{artifact.path.name}"
-                zip_file.write(artifact.path, arcname=arcname)
+        members = plan_members((artifact.path, f"{job.id}/{artifact.path.name}") for artifact in artifacts)
+        return package_path, members
 
+    def _finish(
+        self, job: Job, package_path: Path, members: List[ZipMember], streamed: bool, duration_ms: float
+    ) -> Path:
+        if self.metric_dispatcher:
+            self.metric_dispatcher(
+                "package.created",
+                {
+                    "job_id": job.id,
+                    "members": len(members),
+                    "stored": sum(1 for member in members if member.method == ZIP_STORED),
+                    "input_bytes": sum(member.size for member in members),
+                    "bytes": package_path.stat().st_size,
+                    "duration_ms": duration_ms,
+                    "level": self.compression_level,
+                    "workers": self.max_workers,
+                    "streamed": streamed,
+                },
+            )
         if self.storage_client:
             remote_key = f"{job.id}/{package_path.name}"
             self.storage_client.upload(package_path, remote_key)
         return package_path
+
+
+def _write_archive(
+    package_path: Path, members: List[ZipMember], compression_level: int, max_workers: int
+) -> Tuple[bool, float]:
+    """Writes the archive through a temp file; module level so worker processes can run it."""
+    streamed = fits_zip32(members)
+    start = time.perf_counter()
+    # Unique per call so concurrent builds of the same package never write the same temp file.
+    tmp_path = package_path.with_name(f".{package_path.name}.{uuid4().hex}.tmp")
+    try:
+        if streamed:
+            with tmp_path.open("wb") as handle:
+                writer = StreamingZipWriter(handle, compression_level, max_workers)
+                writer.write_members(members)
+                writer.close()
+        else:
+            with ZipFile(tmp_path, "w", compression=ZIP_DEFLATED, compresslevel=compression_level) as zip_file:
+                for member in members:
+                    zip_file.write(member.path, arcname=member.arcname, compress_type=member.method)
+        os.replace(tmp_path, package_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return streamed, round((time.perf_counter() - start) * 1000, 3)
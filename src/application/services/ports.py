@@ -20,3 +20,5 @@ class SheetGateway(Protocol):
     """Abstracts persistence of rows into CSV or Google Sheets."""
 
     def append_row(self, row: Dict[str, Any]) -> None: ...
+
+    # Optional: ``append_rows(rows: List[Dict[str, Any]])`` writes several rows in one call.
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Row = Dict[str, str]
+RowWriter = Callable[[List[Row]], None]
+
+
+class SheetBatchWriter:
+    """Coalesces CSV/Sheets rows on a background thread.
+
+    Rows are written once ``max_rows`` are queued or ``max_delay_ms`` after the
+    first queued row, whichever comes first, with one ``write_csv`` call and one
+    ``write_sheet`` call (for rows submitted with ``mirror=True``) per batch.
+    Failed writes keep their rows in a bounded retry queue that is retried every
+    ``retry_interval_sec`` and on ``flush``/``close``; ``failed_rows`` exposes it.
+    """
+
+    def __init__(
+        self,
+        write_csv: RowWriter,
+        write_sheet: Optional[RowWriter] = None,
+        max_rows: int = 100,
+        max_delay_ms: int = 250,
+        retry_interval_sec: float = 30.0,
+        max_retry_rows: int = 10_000,
+        metric_dispatcher: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> None:
+        self.write_csv = write_csv
+        self.write_sheet = write_sheet
+        self.max_rows = max(1, max_rows)
+        self.max_delay = max(0, max_delay_ms) / 1000
+        self.retry_interval_sec = retry_interval_sec
+        self.metric_dispatcher = metric_dispatcher
+        self._queue: List[Tuple[Row, bool]] = []
+        self._retry: Deque[Tuple[str, Row]] = deque(maxlen=max(1, max_retry_rows))
+        self._first_queued_at: Optional[float] = None
+        self._next_retry_at = 0.0
+        self._in_flight = 0
+        self._closed = False
+        self._flush_requested = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="sheet-batch-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, rows: List[Row], mirror: bool = False) -> None:
+        if not rows:
+            return
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("SheetBatchWriter ja foi encerrado.")
+            if not self._queue:
+                # Wake the writer so it starts the ``max_delay_ms`` countdown.
+                self._first_queued_at = time.monotonic()
+                self._condition.notify_all()
+            self._queue.extend((row, mirror) for row in rows)
+            if len(self._queue) >= self.max_rows:
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Writes everything queued now; returns False if rows are still pending after ``timeout``."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            while self._queue or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            self._flush_requested = False
+        self.retry_failed()
+        return True
+
+    def close(self, timeout: Optional[float] = 5.0) -> bool:
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._queue) + self._in_flight
+
+    def failed_rows(self) -> List[Tuple[str, Row]]:
+        """Rows waiting for another attempt, as ``(target, row)`` with target ``csv`` or ``sheet``."""
+        with self._condition:
+            return list(self._retry)
+
+    def retry_failed(self) -> int:
+        """Retries the failed rows now; returns how many are still failing."""
+        with self._condition:
+            retry = list(self._retry)
+            self._retry.clear()
+            self._next_retry_at = time.monotonic() + self.retry_interval_sec
+        if retry:
+            self._write(
+                [row for target, row in retry if target == "csv"],
+                [row for target, row in retry if target == "sheet"],
+            )
+        with self._condition:
+            return len(self._retry)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._ready():
+                    if self._closed:
+                        return
+                    self._condition.wait(self._wait_time())
+                batch = self._queue
+                self._queue = []
+                self._first_queued_at = None
+                self._flush_requested = False
+                self._in_flight = len(batch)
+                retry_due = bool(self._retry) and time.monotonic() >= self._next_retry_at
+            try:
+                if batch:
+                    self._write([row for row, _ in batch], [row for row, mirror in batch if mirror])
+                if retry_due:
+                    self.retry_failed()
+            finally:
+                with self._condition:
+                    self._in_flight = 0
+                    self._condition.notify_all()
+
+    def _ready(self) -> bool:
+        if self._retry and time.monotonic() >= self._next_retry_at:
+            return True
+        if not self._queue:
+            return False
+        if self._flush_requested or self._closed or len(self._queue) >= self.max_rows:
+            return True
+        return time.monotonic() - (self._first_queued_at or 0.0) >= self.max_delay
+
+    def _wait_time(self) -> Optional[float]:
+        waits = []
+        if self._queue and self._first_queued_at is not None:
+            waits.append(self._first_queued_at + self.max_delay - time.monotonic())
+        if self._retry:
+            waits.append(self._next_retry_at - time.monotonic())
+        return max(0.0, min(waits)) if waits else None
+
+    def _write(self, csv_rows: List[Row], sheet_rows: List[Row]) -> None:
+        started = time.perf_counter()
+        failed = 0
+        for target, rows, writer in (("csv", csv_rows, self.write_csv), ("sheet", sheet_rows, self.write_sheet)):
+            if not rows or writer is None:
+                continue
+            try:
+                writer(rows)
+            except Exception as exc:  # kept for retry instead of losing the rows
+                failed += len(rows)
+                logger.warning("Falha ao gravar %s linhas em %s: %s", len(rows), target, exc)
+                with self._condition:
+                    if not self._retry:
+                        self._next_retry_at = time.monotonic() + self.retry_interval_sec
+                    self._retry.extend((target, row) for row in rows)
+        if self.metric_dispatcher:
+            self.metric_dispatcher(
+                "sheet.batch.flushed",
+                {
+                    "csv_rows": len(csv_rows),
+                    "sheet_rows": len(sheet_rows),
+                    "failed_rows": failed,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                },
+            )
+
+
+__all__ = ["SheetBatchWriter"]
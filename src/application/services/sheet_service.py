@@ -3,7 +3,7 @@ from __future__ import annotations
 import csv
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from filelock import FileLock
 
@@ -11,12 +11,25 @@ from domain.entities.job import Job
 from domain.ports.services import DeliveryLogger
 
 from .ports import SheetGateway
+from .sheet_batch_writer import SheetBatchWriter
 
 
 class CsvSheetService(DeliveryLogger):
-    """Logs job metadata to CSV and optionally mirrors to Google Sheets."""
+    """Logs job metadata to CSV and optionally mirrors to Google Sheets.
 
-    def __init__(self, csv_path: Path, sheet_gateway: Optional[SheetGateway] = None) -> None:
+    With ``buffer_max_rows > 0`` rows are handed to a ``SheetBatchWriter`` and written
+    in the background, so callers never wait on the file lock or the Sheets API;
+    call ``flush``/``close`` before reading the CSV or shutting down.
+    """
+
+    def __init__(
+        self,
+        csv_path: Path,
+        sheet_gateway: Optional[SheetGateway] = None,
+        buffer_max_rows: int = 0,
+        buffer_max_delay_ms: int = 250,
+        metric_dispatcher: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> None:
         self.csv_path = csv_path
         self.csv_path.parent.mkdir(parents=True, exist_ok=True)
         self.sheet_gateway = sheet_gateway
@@ -34,18 +47,66 @@ class CsvSheetService(DeliveryLogger):
             "version",
         ]
         self._ensure_header()
+        self._writer: Optional[SheetBatchWriter] = None
+        if buffer_max_rows > 0:
+            self._writer = SheetBatchWriter(
+                self._append_csv_rows,
+                self._append_sheet_rows if sheet_gateway else None,
+                max_rows=buffer_max_rows,
+                max_delay_ms=buffer_max_delay_ms,
+                metric_dispatcher=metric_dispatcher,
+            )
 
     def register(self, job: Job, package_path: Path) -> None:
         row = self._build_row(job, package_path)
+        if self._writer:
+            self._writer.submit([row], mirror=True)
+            return
         self._append_csv(row)
         if self.sheet_gateway:
             self.sheet_gateway.append_row(row)
 
+    def register_many(self, items: Iterable[Tuple[Job, Path]]) -> None:
+        """Registers several deliveries with one CSV write and one sheet call."""
+        rows = [self._build_row(job, package_path) for job, package_path in items]
+        if not rows:
+            return
+        if self._writer:
+            self._writer.submit(rows, mirror=True)
+            return
+        self._append_csv_rows(rows)
+        if self.sheet_gateway:
+            self._append_sheet_rows(rows)
+
     def record_job_status(self, job: Job, status: str) -> None:
         row = self._build_row(job, None)
         row["status"] = status
+        if self._writer:
+            self._writer.submit([row])
+            return
         self._append_csv(row)
 
+    def record_job_statuses(self, jobs: Iterable[Job]) -> None:
+        rows = [self._build_row(job, None) for job in jobs]
+        if not rows:
+            return
+        if self._writer:
+            self._writer.submit(rows)
+            return
+        self._append_csv_rows(rows)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return self._writer.flush(timeout) if self._writer else True
+
+    def close(self, timeout: Optional[float] = 5.0) -> bool:
+        return self._writer.close(timeout) if self._writer else True
+
+    def failed_rows(self) -> List[Tuple[str, Dict[str, str]]]:
+        return self._writer.failed_rows() if self._writer else []
+
+    def retry_failed(self) -> int:
+        return self._writer.retry_failed() if self._writer else 0
+
     def _build_row(self, job: Job, package_path: Optional[Path]) -> Dict[str, str]:
         return {
             "job_id": job.id,
@@ -69,7 +130,20 @@ class CsvSheetService(DeliveryLogger):
                 writer.writeheader()
 
     def _append_csv(self, row: Dict[str, str]) -> None:
+        self._append_csv_rows([row])
+
+    def _append_csv_rows(self, rows: List[Dict[str, str]]) -> None:
         with self._lock:
             with self.csv_path.open("a", newline="", encoding="utf-8") as handle:
                 writer = csv.DictWriter(handle, fieldnames=self.fieldnames)
-                writer.writerow(row)
+                writer.writerows(rows)
+
+    def _append_sheet_rows(self, rows: List[Dict[str, str]]) -> None:
+        if not self.sheet_gateway:
+            return
+        append_rows = getattr(self.sheet_gateway, "append_rows", None)
+        if append_rows:
+            append_rows(rows)
+        else:
+            for row in rows:
+                self.sheet_gateway.append_row(row)
@@ -3,8 +3,10 @@ from __future__ import annotations
 from __future__ import annotations
 
 import logging
+from typing import List
 
 from domain.entities.job import Job
+from domain.entities.job_event import JobEvent
 from domain.ports.services import JobStatusPublisher
 
 from .sheet_service import CsvSheetService
@@ -23,3 +25,18 @@ class SheetStatusPublisher(JobStatusPublisher):
             self.sheet_service.record_job_status(job, job.status.value)
         except Exception as exc:  # pragma: no cover - logged for operational visibility
             logger.warning("Falha ao registrar job %s na planilha: %s", job.id, exc)
+
+    def handle_event(self, event: JobEvent) -> None:
+        """Event bus entry point: records the job snapshot carried by the event."""
+        if event.job is not None:
+            self.publish(event.job)
+
+    def handle_events(self, events: List[JobEvent]) -> None:
+        """Batch entry point for the event bus: one sheet write for the whole batch."""
+        self.publish_many([event.job for event in events if event.job is not None])
+
+    def publish_many(self, jobs: List[Job]) -> None:
+        try:
+            self.sheet_service.record_job_statuses(jobs)
+        except Exception as exc:  # pragma: no cover - logged for operational visibility
+            logger.warning("Falha ao registrar %s jobs na planilha: %s", len(jobs), exc)
@@ -1,56 +1,72 @@
 from __future__ import annotations
 
-import textwrap
-from typing import Iterable, List
+import io
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Sequence, TextIO, Tuple
 
 from domain.entities.profile import Profile
 from domain.entities.transcription import Segment
 
+from .line_breaker import break_lines, split_cues
+
 
 class SubtitleFormatter:
-    """Builds subtitle strings (SRT/VTT) applying profile constraints."""
+    """Builds subtitle strings (SRT/VTT) applying profile constraints.
+
+    ``build_entries`` wraps text and formats timestamps once per segment; every
+    format registered in ``SUBTITLE_FORMATS`` is then rendered from those entries.
+    """
 
     def __init__(self, newline: str = "\n") -> None:
         self.newline = newline
 
     def to_srt(self, segments: Iterable[Segment], profile: Profile) -> str:
-        entries = self._build_entries(list(segments), profile)
-        blocks: List[str] = []
-        for idx, entry in enumerate(entries, start=1):
-            blocks.append(f"{idx}")
-            blocks.append(f"{self._format_timestamp(entry.start)} --> {self._format_timestamp(entry.end)}")
-            blocks.extend(entry.lines)
-            blocks.append("")  # blank line
-        return self.newline.join(blocks).strip() + self.newline
+        return self._render_to_string("srt", segments, profile)
 
     def to_vtt(self, segments: Iterable[Segment], profile: Profile) -> str:
+        return self._render_to_string("vtt", segments, profile)
+
+    def build_entries(self, segments: Iterable[Segment], profile: Profile) -> List["SubtitleEntry"]:
+        return self._build_entries(list(segments), profile)
+
+    def write(self, entries: Sequence["SubtitleEntry"], subtitle_format: str, handle: TextIO) -> None:
+        """Streams one format to ``handle``; blocks are separated by a blank line, as in the string API."""
+        preamble, render_cue = SUBTITLE_FORMATS[subtitle_format]
+        newline = self.newline
+        separator = newline + newline
+        pending = None
+        for block in _blocks(preamble, render_cue, entries, newline):
+            if pending is not None:
+                handle.write(pending)
+                handle.write(separator)
+            pending = block
+        if pending is not None:
+            handle.write(pending.rstrip())
+        handle.write(newline)
+
+    def write_all(self, segments: Iterable[Segment], profile: Profile, handles: Mapping[str, TextIO]) -> None:
+        """Renders every requested format from a single pass over the segments."""
         entries = self._build_entries(list(segments), profile)
-        blocks: List[str] = ["WEBVTT", ""]
-        for entry in entries:
-            blocks.append(f"{self._format_timestamp(entry.start)} --> {self._format_timestamp(entry.end)}")
-            blocks.extend(entry.lines)
-            blocks.append("")
-        return self.newline.join(blocks).strip() + self.newline
+        for subtitle_format, handle in handles.items():
+            self.write(entries, subtitle_format, handle)
+
+    def _render_to_string(self, subtitle_format: str, segments: Iterable[Segment], profile: Profile) -> str:
+        buffer = io.StringIO()
+        self.write(self._build_entries(list(segments), profile), subtitle_format, buffer)
+        return buffer.getvalue()
 
     def _build_entries(self, segments: List[Segment], profile: Profile) -> List["SubtitleEntry"]:
         rules = profile.subtitle_rules()
         entries: List[SubtitleEntry] = []
         for segment in segments:
-            wrapped = self._wrap_text(segment.text, rules.max_chars_per_line, rules.max_lines)
-            entries.append(SubtitleEntry(start=segment.start, end=segment.end, lines=wrapped))
+            wrapped = self._wrap_text(segment.text, rules.max_chars_per_line, rules.line_breaking)
+            # Segments longer than max_lines become extra cues instead of losing text.
+            for start, end, lines in split_cues(wrapped, rules.max_lines, segment.start, segment.end):
+                timing = f"{self._format_timestamp(start)} --> {self._format_timestamp(end)}"
+                entries.append(SubtitleEntry(start=start, end=end, lines=lines, timing=timing))
         return entries
 
-    def _wrap_text(self, text: str, max_chars: int, max_lines: int) -> List[str]:
-        wrapped = textwrap.wrap(text, width=max_chars)
-        if not wrapped:
-            return [""]
-        if len(wrapped) <= max_lines:
-            return wrapped
-        # Merge extra lines respecting total lines permitted.
-        merged = wrapped[: max_lines - 1]
-        remaining = " ".join(wrapped[max_lines - 1 :])
-        merged.append(remaining[: max_chars])
-        return merged
+    def _wrap_text(self, text: str, max_chars: int, strategy: str = "greedy") -> List[str]:
+        return break_lines(text, max_chars, strategy) or [""]
 
     @staticmethod
     def _format_timestamp(seconds: float) -> str:
@@ -65,7 +81,38 @@ class SubtitleFormatter:
 
 
 class SubtitleEntry:
-    def __init__(self, start: float, end: float, lines: List[str]) -> None:
+    __slots__ = ("start", "end", "lines", "timing")
+
+    def __init__(self, start: float, end: float, lines: List[str], timing: str = "") -> None:
         self.start = start
         self.end = end
         self.lines = lines
+        self.timing = timing or (
+            f"{SubtitleFormatter._format_timestamp(start)} --> {SubtitleFormatter._format_timestamp(end)}"
+        )
+
+
+CueRenderer = Callable[[int, SubtitleEntry, str], str]
+
+
+def _srt_cue(index: int, entry: SubtitleEntry, newline: str) -> str:
+    return newline.join([str(index), entry.timing, *entry.lines])
+
+
+def _vtt_cue(index: int, entry: SubtitleEntry, newline: str) -> str:
+    return newline.join([entry.timing, *entry.lines])
+
+
+# format -> (preamble blocks, cue renderer); register new formats here.
+SUBTITLE_FORMATS: Dict[str, Tuple[Tuple[str, ...], CueRenderer]] = {
+    "srt": ((), _srt_cue),
+    "vtt": (("WEBVTT",), _vtt_cue),
+}
+
+
+def _blocks(
+    preamble: Tuple[str, ...], render_cue: CueRenderer, entries: Sequence[SubtitleEntry], newline: str
+) -> Iterator[str]:
+    yield from preamble
+    for index, entry in enumerate(entries, start=1):
+        yield render_cue(index, entry, newline)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from domain.entities.job import Job
+from domain.entities.transcription import PostEditResult
+from domain.entities.value_objects import ArtifactType
+from domain.ports.repositories import JobRepository, ProfileProvider, TranscriptionStore
+
+from .artifact_builder import FilesystemArtifactBuilder
+
+
+@dataclass(frozen=True)
+class TemplateRenderRequest:
+    job_id: str
+    template_id: Optional[str] = None
+    locale: Optional[str] = None
+
+
+class BulkTemplateRenderer:
+    """Renders the TXT delivery of many jobs under other templates/locales without writing anything.
+
+    Rendering goes through the artifact builder, so each preview matches the TXT that
+    would be produced after switching the job's template. The post-edit text comes
+    from the stage checkpoint, falling back to the job's JSON artifact. The requested
+    jobs are loaded with one repository lookup up front; results are yielded in
+    request order while a thread pool works ahead.
+    """
+
+    def __init__(
+        self,
+        job_repository: JobRepository,
+        profile_provider: ProfileProvider,
+        artifact_builder: FilesystemArtifactBuilder,
+        transcription_store: TranscriptionStore | None = None,
+        max_workers: int = 4,
+    ) -> None:
+        self.job_repository = job_repository
+        self.profile_provider = profile_provider
+        self.artifact_builder = artifact_builder
+        self.transcription_store = transcription_store
+        self.max_workers = max(1, max_workers)
+
+    def render_many(self, requests: Iterable[TemplateRenderRequest]) -> Iterator[Dict[str, Any]]:
+        requests = list(requests)
+        try:
+            jobs = self._load_jobs(list(dict.fromkeys(request.job_id for request in requests)))
+        except (OSError, ValueError, KeyError) as exc:
+            for request in requests:
+                yield {**_request_fields(request), "error": f"{type(exc).__name__}: {exc}"}
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="template-render") as executor:
+            yield from executor.map(lambda request: self._render(request, jobs.get(request.job_id)), requests)
+
+    def render_one(self, request: TemplateRenderRequest) -> Dict[str, Any]:
+        return self._render(request, self.job_repository.find_by_id(request.job_id))
+
+    def _load_jobs(self, job_ids: List[str]) -> Dict[str, Job]:
+        find_many = getattr(self.job_repository, "find_many", None)
+        if find_many:
+            return {job.id: job for job in find_many(job_ids)}
+        jobs = (self.job_repository.find_by_id(job_id) for job_id in job_ids)
+        return {job.id: job for job in jobs if job}
+
+    def _render(self, request: TemplateRenderRequest, job: Optional[Job]) -> Dict[str, Any]:
+        result = _request_fields(request)
+        if not job:
+            return {**result, "error": "job_not_found"}
+        try:
+            post_edit_result = self._load_post_edit(job)
+            if post_edit_result is None:
+                return {**result, "error": "post_edit_result_missing"}
+            profile = self.profile_provider.get(job.profile_id)
+            result["rendered"] = self.artifact_builder.render_txt(
+                job, profile, post_edit_result, template_id=request.template_id, locale=request.locale
+            )
+        except (OSError, ValueError, KeyError) as exc:
+            return {**result, "error": f"{type(exc).__name__}: {exc}"}
+        return result
+
+    def _load_post_edit(self, job: Job) -> Optional[PostEditResult]:
+        if self.transcription_store:
+            stored = self.transcription_store.load_post_edit(job.id, job.version)
+            if stored is not None:
+                return stored
+        json_path = job.output_paths.get(ArtifactType.STRUCTURED_JSON)
+        if not json_path or not Path(json_path).exists():
+            return None
+        payload = json.loads(Path(json_path).read_text(encoding="utf-8"))
+        return PostEditResult(
+            text=payload.get("text", ""),
+            segments=[],
+            flags=payload.get("flags", []),
+            language=payload.get("language"),
+        )
+
+
+def _request_fields(request: TemplateRenderRequest) -> Dict[str, Any]:
+    return {"job_id": request.job_id, "template_id": request.template_id, "locale": request.locale}
+
+
+__all__ = ["BulkTemplateRenderer", "TemplateRenderRequest"]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import unicodedata
+from typing import Dict, List, Optional
+
+_KEPT_ASCII = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+
+class _TokenTranslation(dict):
+    """Lazily filled ``str.translate`` table for folded text.
+
+    Combining marks are deleted, ASCII letters/digits and whitespace are kept
+    and every other code point becomes a space, mirroring the old
+    ``[^a-z0-9\\s]`` substitution.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        value: Optional[int]
+        if char in _KEPT_ASCII or char.isspace():
+            value = codepoint
+        elif unicodedata.combining(char):
+            value = None
+        else:
+            value = 0x20
+        self[codepoint] = value
+        return value
+
+
+_TRANSLATION = _TokenTranslation()
+# ASCII input skips normalization entirely: one byte table lowercases letters,
+# keeps digits/whitespace and blanks out punctuation.
+_ASCII_TABLE = bytes(
+    (code | 0x20) if chr(code).isalpha() else code if chr(code).isdigit() or chr(code).isspace() else 0x20
+    for code in range(128)
+) + bytes([0x20]) * 128
+
+
+def tokenize(text: str) -> List[str]:
+    """Accent/case-insensitive word tokens used by the accuracy guard."""
+    if not text:
+        return []
+    if text.isascii():
+        return text.encode("ascii").translate(_ASCII_TABLE).decode("ascii").split()
+    folded = unicodedata.normalize("NFKD", text).casefold()
+    return folded.translate(_TRANSLATION).split()
+
+
+class TokenCache:
+    """Per-evaluation memo so each distinct text is tokenized only once."""
+
+    def __init__(self) -> None:
+        self._tokens: Dict[str, List[str]] = {}
+
+    def tokens(self, text: str) -> List[str]:
+        key = text or ""
+        cached = self._tokens.get(key)
+        if cached is None:
+            cached = tokenize(key)
+            self._tokens[key] = cached
+        return cached
+
+
+__all__ = ["TokenCache", "tokenize"]
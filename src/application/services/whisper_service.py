@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from domain.entities.job import Job
 from domain.entities.profile import Profile
@@ -36,7 +36,14 @@ class WhisperService(AsrService):
         self.response_format = response_format
         self.chunking_strategy = chunking_strategy
 
-    def run(self, job: Job, profile: Profile, task: str = "transcribe") -> TranscriptionResult:
+    def run(
+        self,
+        job: Job,
+        profile: Profile,
+        task: str = "transcribe",
+        on_chunk: Optional[Callable[[TranscriptionResult], None]] = None,
+    ) -> TranscriptionResult:
+        """Transcribes the job audio; ``on_chunk`` receives each chunk result as soon as it is ready."""
         engine_key = job.engine.value
         client = self.engine_clients.get(engine_key)
         if not client:
@@ -47,9 +54,12 @@ class WhisperService(AsrService):
         file_path = Path(job.source_path)
 
         if job.engine == EngineType.OPENAI and self.chunker and self._should_chunk(file_path):
-            return self._run_chunked(job, profile, task, language, client)
+            return self._run_chunked(job, profile, task, language, client, on_chunk)
 
-        return self._run_single(file_path, language, task, engine_key, client)
+        result = self._run_single(file_path, language, task, engine_key, client)
+        if on_chunk:
+            on_chunk(result)
+        return result
 
     def _run_single(
         self,
@@ -80,6 +90,7 @@ class WhisperService(AsrService):
         task: str,
         language: Optional[str],
         client: AsrEngineClient,
+        on_chunk: Optional[Callable[[TranscriptionResult], None]] = None,
     ) -> TranscriptionResult:
         assert self.chunker
         chunks = self.chunker.split(job.source_path)
@@ -88,7 +99,7 @@ class WhisperService(AsrService):
         language_detected = language or self.default_language
         duration = 0.0
         try:
-            for chunk in chunks:
+            for index, chunk in enumerate(chunks):
                 raw = self.retry_executor.run(
                     lambda p=chunk.path: client.transcribe(
                         file_path=p,
@@ -102,8 +113,8 @@ class WhisperService(AsrService):
                 texts.append(chunk_result.text)
                 duration = max(duration, chunk.start_sec + (chunk_result.duration_sec or 0))
 
-                for segment in chunk_result.segments:
-                    adjusted = Segment(
+                adjusted = [
+                    Segment(
                         id=segment.id,
                         start=segment.start + chunk.start_sec,
                         end=segment.end + chunk.start_sec,
@@ -111,8 +122,14 @@ class WhisperService(AsrService):
                         speaker=segment.speaker,
                         confidence=segment.confidence,
                     )
-                    aggregated_segments.append(adjusted)
+                    for segment in chunk_result.segments
+                ]
+                aggregated_segments.extend(adjusted)
                 language_detected = chunk_result.language or language_detected
+                if on_chunk:
+                    chunk_result.segments = adjusted
+                    chunk_result.metadata["chunk_index"] = index
+                    on_chunk(chunk_result)
         finally:
             for chunk in chunks:
                 try:
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import struct
+import tempfile
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable, List, Optional, Tuple
+from zipfile import ZIP_DEFLATED, ZIP_STORED
+
+CHUNK_SIZE = 1024 * 1024
+# Members whose payload is already compressed; deflating them only burns CPU.
+INCOMPRESSIBLE_SUFFIXES = frozenset(
+    {
+        ".zip", ".gz", ".tgz", ".bz2", ".xz", ".7z", ".zst",
+        ".mp3", ".m4a", ".aac", ".ogg", ".opus", ".flac", ".mp4", ".mkv", ".webm",
+        ".png", ".jpg", ".jpeg", ".webp", ".pdf", ".docx", ".xlsx",
+    }
+)
+MIN_DEFLATE_BYTES = 512
+# Without ZIP64 records sizes and offsets must stay below 4 GiB and entries below 65535.
+ZIP32_LIMIT = 0xFFFFFFFF
+ZIP32_MAX_ENTRIES = 0xFFFF
+
+_FLAG_DATA_DESCRIPTOR = 0x08
+_LOCAL_HEADER_CRC_OFFSET = 14  # signature, version, flags, method, time, date precede crc/sizes
+_FLAG_UTF8 = 0x800
+_VERSION = 20
+_VERSION_MADE_BY = (3 << 8) | _VERSION  # unix attributes
+_EXTERNAL_ATTR = 0o100644 << 16
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ZipMember:
+    path: Path
+    arcname: str
+    method: int
+    size: int
+    mtime: float
+
+
+@dataclass
+class _Entry:
+    arcname: bytes
+    method: int
+    flags: int
+    dos_time: int
+    dos_date: int
+    crc: int
+    compressed_size: int
+    size: int
+    offset: int
+
+
+def choose_method(path: Path, size: int) -> int:
+    """Stores tiny or already-compressed members and deflates everything else."""
+    if size < MIN_DEFLATE_BYTES or path.suffix.lower() in INCOMPRESSIBLE_SUFFIXES:
+        return ZIP_STORED
+    return ZIP_DEFLATED
+
+
+def plan_members(entries: Iterable[Tuple[Path, str]]) -> List[ZipMember]:
+    members: List[ZipMember] = []
+    for path, arcname in entries:
+        stat = path.stat()
+        members.append(ZipMember(path, arcname, choose_method(path, stat.st_size), stat.st_size, stat.st_mtime))
+    return members
+
+
+def fits_zip32(members: List[ZipMember]) -> bool:
+    # Deflate never grows data by more than ~0.1%; headers add at most a few hundred bytes each.
+    worst_case = sum(member.size + member.size // 500 + 512 + len(member.arcname) * 2 for member in members)
+    return len(members) < ZIP32_MAX_ENTRIES and worst_case < ZIP32_LIMIT
+
+
+class StreamingZipWriter:
+    """Writes a ZIP archive front to back, one member at a time, reading each source once.
+
+    Deflated members are streamed chunk by chunk with a trailing data descriptor.
+    Stored members are streamed too; on a seekable handle their CRC and sizes are
+    then patched into the local header (readers that ignore data descriptors still
+    handle them), otherwise they also get a data descriptor. With ``max_workers > 1`` deflated members are
+    compressed concurrently (zlib releases the GIL) into spooled buffers and then
+    appended in order. ZIP64 is not produced: check ``fits_zip32`` first.
+    """
+
+    def __init__(self, handle: BinaryIO, compression_level: int = 6, max_workers: int = 1) -> None:
+        self.handle = handle
+        self.compression_level = compression_level
+        self.max_workers = max(1, max_workers)
+        self._entries: List[_Entry] = []
+        self._offset = 0
+
+    def write_members(self, members: List[ZipMember]) -> None:
+        deflated = [member for member in members if member.method == ZIP_DEFLATED]
+        if self.max_workers == 1 or len(deflated) < 2:
+            for member in members:
+                self.write_member(member)
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(deflated)), thread_name_prefix="zip") as executor:
+            futures = {id(member): executor.submit(self._compress, member) for member in deflated}
+            for member in members:
+                future = futures.get(id(member))
+                if future is None:
+                    self.write_member(member)
+                    continue
+                crc, size, compressed_size, spool = future.result()
+                with spool:
+                    spool.seek(0)
+                    self._write_known(member, crc, size, compressed_size, _iter_chunks(spool))
+
+    def write_member(self, member: ZipMember) -> None:
+        if member.method == ZIP_STORED:
+            self._write_stored(member)
+            return
+
+        entry = self._start_entry(member, _FLAG_DATA_DESCRIPTOR, 0, 0, 0)
+        compressor = zlib.compressobj(self.compression_level, zlib.DEFLATED, -15)
+        crc = size = compressed_size = 0
+        with member.path.open("rb") as source:
+            for chunk in _iter_chunks(source):
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                compressed_size += self._write(compressor.compress(chunk))
+        compressed_size += self._write(compressor.flush())
+        entry.crc, entry.compressed_size, entry.size = crc, compressed_size, size
+        self._write(struct.pack("<IIII", 0x08074B50, crc, compressed_size, size))
+
+    def close(self) -> None:
+        central_offset = self._offset
+        for entry in self._entries:
+            self._write(
+                struct.pack(
+                    "<IHHHHHHIIIHHHHHII",
+                    0x02014B50,
+                    _VERSION_MADE_BY,
+                    _VERSION,
+                    entry.flags,
+                    entry.method,
+                    entry.dos_time,
+                    entry.dos_date,
+                    entry.crc,
+                    entry.compressed_size,
+                    entry.size,
+                    len(entry.arcname),
+                    0,
+                    0,
+                    0,
+                    0,
+                    _EXTERNAL_ATTR,
+                    entry.offset,
+                )
+                + entry.arcname
+            )
+        central_size = self._offset - central_offset
+        count = len(self._entries)
+        self._write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, count, count, central_size, central_offset, 0))
+
+    def _compress(self, member: ZipMember) -> Tuple[int, int, int, BinaryIO]:
+        spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES)
+        compressor = zlib.compressobj(self.compression_level, zlib.DEFLATED, -15)
+        crc = size = compressed_size = 0
+        try:
+            with member.path.open("rb") as source:
+                for chunk in _iter_chunks(source):
+                    crc = zlib.crc32(chunk, crc)
+                    size += len(chunk)
+                    data = compressor.compress(chunk)
+                    spool.write(data)
+                    compressed_size += len(data)
+            data = compressor.flush()
+            spool.write(data)
+            compressed_size += len(data)
+        except BaseException:
+            spool.close()
+            raise
+        return crc, size, compressed_size, spool  # type: ignore[return-value]
+
+    def _write_stored(self, member: ZipMember) -> None:
+        header_position = self.handle.tell() if self._seekable() else None
+        flags = 0 if header_position is not None else _FLAG_DATA_DESCRIPTOR
+        entry = self._start_entry(member, flags, 0, 0, 0)
+        crc = size = 0
+        with member.path.open("rb") as source:
+            for chunk in _iter_chunks(source):
+                crc = zlib.crc32(chunk, crc)
+                size += self._write(chunk)
+        entry.crc, entry.compressed_size, entry.size = crc, size, size
+        if header_position is None:
+            self._write(struct.pack("<IIII", 0x08074B50, crc, size, size))
+            return
+        end = self.handle.tell()
+        self.handle.seek(header_position + _LOCAL_HEADER_CRC_OFFSET)
+        self.handle.write(struct.pack("<III", crc, size, size))
+        self.handle.seek(end)
+
+    def _seekable(self) -> bool:
+        try:
+            return bool(self.handle.seekable())
+        except (AttributeError, OSError, ValueError):
+            return False
+
+    def _write_known(
+        self, member: ZipMember, crc: int, size: int, compressed_size: int, chunks: Iterable[bytes]
+    ) -> None:
+        self._start_entry(member, 0, crc, compressed_size, size)
+        for chunk in chunks:
+            self._write(chunk)
+
+    def _start_entry(self, member: ZipMember, flags: int, crc: int, compressed_size: int, size: int) -> _Entry:
+        arcname = member.arcname.encode("utf-8")
+        flags |= _FLAG_UTF8
+        dos_time, dos_date = _dos_datetime(member.mtime)
+        entry = _Entry(arcname, member.method, flags, dos_time, dos_date, crc, compressed_size, size, self._offset)
+        self._entries.append(entry)
+        self._write(
+            struct.pack(
+                "<IHHHHHIIIHH",
+                0x04034B50,
+                _VERSION,
+                flags,
+                member.method,
+                dos_time,
+                dos_date,
+                crc,
+                compressed_size,
+                size,
+                len(arcname),
+                0,
+            )
+            + arcname
+        )
+        return entry
+
+    def _write(self, data: bytes) -> int:
+        if data:
+            self.handle.write(data)
+            self._offset += len(data)
+        return len(data)
+
+
+def _iter_chunks(source: BinaryIO) -> Iterable[bytes]:
+    while True:
+        chunk = source.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _dos_datetime(timestamp: Optional[float]) -> Tuple[int, int]:
+    year, month, day, hour, minute, second = time.localtime(timestamp)[:6]
+    if year < 1980:
+        year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+__all__ = [
+    "INCOMPRESSIBLE_SUFFIXES",
+    "StreamingZipWriter",
+    "ZipMember",
+    "choose_method",
+    "fits_zip32",
+    "plan_members",
+]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from .job import Job
+from .value_objects import JobEventType
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass(frozen=True)
+class JobEvent:
+    """Something that happened to a job, as delivered to event bus subscribers.
+
+    ``job`` is a snapshot taken when the event was created, so subscribers running
+    later see the job as it was at that moment.
+    """
+
+    type: JobEventType
+    job_id: str
+    status: Optional[str] = None
+    stage: Optional[str] = None
+    payload: Dict[str, Any] = field(default_factory=dict)
+    job: Optional[Job] = None
+    occurred_at: datetime = field(default_factory=_utcnow)
+
+    @classmethod
+    def for_job(cls, event_type: JobEventType, job: Job, **kwargs: Any) -> "JobEvent":
+        return cls(type=event_type, job_id=job.id, status=job.status.value, job=copy.deepcopy(job), **kwargs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "type": self.type.value,
+            "job_id": self.job_id,
+            "occurred_at": self.occurred_at.isoformat(),
+        }
+        if self.status is not None:
+            data["status"] = self.status
+        if self.stage is not None:
+            data["stage"] = self.stage
+        if self.payload:
+            data["payload"] = self.payload
+        return data
+
+
+__all__ = ["JobEvent"]
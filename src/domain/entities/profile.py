@@ -9,6 +9,7 @@ class SubtitleConfig:
     max_chars_per_line: int
     max_lines: int
     reading_speed_cps: int
+    line_breaking: str = "greedy"
 
 
 @dataclass
@@ -28,6 +29,7 @@ class Profile:
             max_chars_per_line=int(subtitle_meta.get("max_chars_per_line", 42)),
             max_lines=int(subtitle_meta.get("max_lines", 2)),
             reading_speed_cps=int(subtitle_meta.get("reading_speed_cps", 17)),
+            line_breaking=str(subtitle_meta.get("line_breaking", "greedy")),
         )
 
     def requires_translation(self) -> bool:
@@ -37,3 +37,12 @@ class LogLevel(str, Enum):
     INFO = "info"
     WARNING = "warning"
     ERROR = "error"
+
+
+class JobEventType(str, Enum):
+    CREATED = "job.created"
+    STATUS_CHANGED = "job.status_changed"
+    STAGE_STARTED = "job.stage_started"
+    STAGE_COMPLETED = "job.stage_completed"
+    FAILED = "job.failed"
+    ARTIFACTS_READY = "job.artifacts_ready"
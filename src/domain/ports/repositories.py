@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Iterable, List, Optional, Protocol
 
 from ..entities.artifact import Artifact
 from ..entities.job import Job
 from ..entities.log_entry import LogEntry
 from ..entities.profile import Profile
+from ..entities.transcription import PostEditResult, TranscriptionResult
 from ..entities.user_review import UserReview
 
 
@@ -18,6 +20,9 @@ class JobRepository(Protocol):
 
     def list_recent(self, limit: int = 50) -> List[Job]: ...
 
+    # Optional: ``revision() -> str`` changes whenever any job is written (also by other
+    # processes); the dashboard uses it as an ETag and skips the listing when it is unchanged.
+
 
 class ArtifactRepository(Protocol):
     def save_many(self, artifacts: Iterable[Artifact]) -> None: ...
@@ -32,6 +37,8 @@ class LogRepository(Protocol):
 
     def list_recent(self, limit: int = 20) -> List[LogEntry]: ...
 
+    # Optional: ``revision() -> str``, same contract as ``JobRepository.revision``.
+
 
 class ReviewRepository(Protocol):
     def save(self, review: UserReview) -> UserReview: ...
@@ -39,5 +46,27 @@ class ReviewRepository(Protocol):
     def find_latest(self, job_id: str) -> Optional[UserReview]: ...
 
 
+class UploadIndex(Protocol):
+    """Maps an upload content key (digest, profile, engine) to the job created for it."""
+
+    def find(self, key: str) -> Optional[str]: ...
+
+    def register(self, key: str, job_id: str) -> None: ...
+
+
 class ProfileProvider(Protocol):
     def get(self, profile_id: str) -> Profile: ...
+
+
+class TranscriptionStore(Protocol):
+    def save(self, job_id: str, version: int, result: TranscriptionResult) -> Path: ...
+
+    def load(self, job_id: str, version: int) -> Optional[TranscriptionResult]: ...
+
+    def load_text(self, job_id: str, version: int) -> Optional[str]: ...
+
+    def save_post_edit(self, job_id: str, version: int, result: PostEditResult) -> Path: ...
+
+    def load_post_edit(self, job_id: str, version: int) -> Optional[PostEditResult]: ...
+
+    def carry_forward(self, job_id: str, from_version: int, to_version: int, stages: Iterable[str]) -> List[str]: ...
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Iterable, Protocol
+from typing import Callable, Dict, Iterable, Optional, Protocol
 
 from ..entities.artifact import Artifact
 from ..entities.delivery_record import DeliveryRecord
 from ..entities.job import Job
+from ..entities.job_event import JobEvent
 from ..entities.profile import Profile
 from ..entities.transcription import PostEditResult, TranscriptionResult
 
@@ -13,7 +14,13 @@ from ..entities.transcription import PostEditResult, TranscriptionResult
 class AsrService(Protocol):
     """Abstracts an ASR engine (OpenAI or local)."""
 
-    def run(self, job: Job, profile: Profile, task: str = "transcribe") -> TranscriptionResult: ...
+    def run(
+        self,
+        job: Job,
+        profile: Profile,
+        task: str = "transcribe",
+        on_chunk: Optional[Callable[[TranscriptionResult], None]] = None,
+    ) -> TranscriptionResult: ...
 
 
 class PostEditingService(Protocol):
@@ -58,7 +65,16 @@ class JobStatusPublisher(Protocol):
     def publish(self, job: Job) -> None: ...
 
 
+class JobEventPublisher(Protocol):
+    """Publishes typed job events (see ``JobEvent``) without blocking the caller."""
+
+    def emit(self, event: JobEvent) -> None: ...
+
+
 class DeliveryClient(Protocol):
     """Integrates with external delivery endpoints (GoTranscript/clients)."""
 
     def submit_package(self, job: Job, package_path: Path) -> DeliveryRecord: ...
+
+    # Optional: ``submit_batch(items: Sequence[Tuple[Job, Path]]) -> List[DeliveryRecord]``
+    # submits many packages at once; RegisterDelivery falls back to submit_package.
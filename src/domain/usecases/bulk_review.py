@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import uuid4
+
+from ..entities.delivery_record import DeliveryRecord
+from ..entities.job import Job
+from ..entities.log_entry import LogEntry
+from ..entities.user_review import UserReview
+from ..entities.value_objects import JobStatus, LogLevel, ReviewDecision
+from ..ports.repositories import JobRepository, LogRepository, ReviewRepository
+from ..ports.services import JobStatusPublisher
+from .register_delivery import RegisterDelivery
+
+
+@dataclass
+class BulkReviewInput:
+    job_ids: Sequence[str]
+    reviewer: str
+    approved: bool = True
+    notes: Optional[str] = None
+    deliver: bool = True
+
+
+@dataclass
+class BulkReviewOutcome:
+    job_id: str
+    status: Optional[str] = None
+    package_path: Optional[Path] = None
+    delivery: Optional[DeliveryRecord] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"job_id": self.job_id, "status": self.status}
+        if self.package_path:
+            payload["package_path"] = str(self.package_path)
+        if self.delivery:
+            payload["delivery"] = {
+                "integration": self.delivery.integration,
+                "status": self.delivery.status,
+                "external_id": self.delivery.external_id,
+                "message": self.delivery.message,
+            }
+        if self.error:
+            payload["error"] = self.error
+        return payload
+
+
+@dataclass
+class BulkReviewSummary:
+    outcomes: List[BulkReviewOutcome] = field(default_factory=list)
+
+    @property
+    def failed(self) -> List[BulkReviewOutcome]:
+        return [outcome for outcome in self.outcomes if outcome.error]
+
+
+class BulkReviewDelivery:
+    """Applies one review decision to many jobs and delivers the approved ones.
+
+    Jobs are loaded with one repository call and their new statuses, reviews and
+    log entries are persisted with one write each (``find_many``/``update_many``/
+    ``save_many``/``append_many`` when the repositories offer them). Approved jobs
+    are packaged and registered through ``RegisterDelivery.package_many`` and
+    submitted through ``RegisterDelivery.submit_batch``. A job that fails never
+    stops the others.
+    """
+
+    def __init__(
+        self,
+        job_repository: JobRepository,
+        review_repository: ReviewRepository,
+        log_repository: LogRepository,
+        status_publisher: JobStatusPublisher | None = None,
+        register_delivery: RegisterDelivery | None = None,
+        package_workers: int = 1,
+    ) -> None:
+        self.job_repository = job_repository
+        self.review_repository = review_repository
+        self.log_repository = log_repository
+        self.status_publisher = status_publisher
+        self.register_delivery = register_delivery
+        self.package_workers = max(1, package_workers)
+
+    def execute(self, data: BulkReviewInput) -> BulkReviewSummary:
+        job_ids = list(dict.fromkeys(data.job_ids))
+        outcomes = {job_id: BulkReviewOutcome(job_id=job_id) for job_id in job_ids}
+        jobs = self._load(job_ids)
+        for job_id in job_ids:
+            if job_id not in jobs:
+                outcomes[job_id].error = f"Job {job_id} nao encontrado"
+
+        reviewed = [jobs[job_id] for job_id in job_ids if job_id in jobs]
+        self._apply_decision(reviewed, data)
+        for job in reviewed:
+            outcomes[job.id].status = job.status.value
+
+        if data.approved and data.deliver and self.register_delivery and reviewed:
+            self._deliver(self.register_delivery, reviewed, outcomes)
+        return BulkReviewSummary(outcomes=[outcomes[job_id] for job_id in job_ids])
+
+    def _load(self, job_ids: List[str]) -> Dict[str, Job]:
+        find_many = getattr(self.job_repository, "find_many", None)
+        if find_many:
+            return {job.id: job for job in find_many(job_ids)}
+        jobs = (self.job_repository.find_by_id(job_id) for job_id in job_ids)
+        return {job.id: job for job in jobs if job}
+
+    def _apply_decision(self, jobs: List[Job], data: BulkReviewInput) -> None:
+        if not jobs:
+            return
+        decision = ReviewDecision.APPROVED if data.approved else ReviewDecision.NEEDS_ADJUSTMENT
+        status = JobStatus.APPROVED if data.approved else JobStatus.ADJUSTMENTS_REQUIRED
+        reviews: List[UserReview] = []
+        entries: List[LogEntry] = []
+        for job in jobs:
+            job.set_status(status, notes=data.notes)
+            reviews.append(
+                UserReview(id=uuid4().hex, job_id=job.id, reviewer=data.reviewer, decision=decision, notes=data.notes)
+            )
+            entries.append(
+                LogEntry(
+                    job_id=job.id,
+                    event="review_completed",
+                    level=LogLevel.INFO,
+                    message=f"Decisao: {decision.value} (lote)",
+                )
+            )
+
+        update_many = getattr(self.job_repository, "update_many", None)
+        if update_many:
+            update_many(jobs)
+        else:
+            for job in jobs:
+                self.job_repository.update(job)
+        if self.status_publisher:
+            publish_many = getattr(self.status_publisher, "publish_many", None)
+            if publish_many:
+                publish_many(jobs)
+            else:
+                for job in jobs:
+                    self.status_publisher.publish(job)
+        save_many = getattr(self.review_repository, "save_many", None)
+        if save_many:
+            save_many(reviews)
+        else:
+            for review in reviews:
+                self.review_repository.save(review)
+        self._append_logs(entries)
+
+    def _deliver(
+        self, delivery: RegisterDelivery, jobs: List[Job], outcomes: Dict[str, BulkReviewOutcome]
+    ) -> None:
+        packaged, errors = delivery.package_many(jobs, max_workers=self.package_workers)
+        for job_id, error in errors.items():
+            outcomes[job_id].error = error
+        for job, package_path in packaged:
+            outcomes[job.id].package_path = package_path
+        if packaged and delivery.delivery_client:
+            for record in delivery.submit_batch(packaged):
+                outcomes[record.job_id].delivery = record
+
+    def _append_logs(self, entries: List[LogEntry]) -> None:
+        append_many = getattr(self.log_repository, "append_many", None)
+        if append_many:
+            append_many(entries)
+        else:
+            for entry in entries:
+                self.log_repository.append(entry)
+
+
+__all__ = ["BulkReviewDelivery", "BulkReviewInput", "BulkReviewOutcome", "BulkReviewSummary"]
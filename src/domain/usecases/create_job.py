@@ -7,7 +7,8 @@ from uuid import uuid4
 from datetime import datetime, timezone
 
 from ..entities.job import Job
-from ..entities.value_objects import EngineType, JobStatus
+from ..entities.job_event import JobEvent
+from ..entities.value_objects import EngineType, JobEventType, JobStatus
 from ..ports.repositories import JobRepository, LogRepository, ProfileProvider
 from ..entities.log_entry import LogEntry
 from ..entities.value_objects import LogLevel
@@ -82,7 +83,11 @@ class CreateJobFromInbox:
             )
         )
         if self.status_publisher:
-            self.status_publisher.publish(job)
+            emit = getattr(self.status_publisher, "emit", None)
+            if emit:
+                emit(JobEvent.for_job(JobEventType.CREATED, job))
+            else:
+                self.status_publisher.publish(job)
         return job
 
 
@@ -4,10 +4,12 @@ import time
 from typing import Any, Callable, Dict, List, Optional, Protocol, TypeVar
 
 from ..entities.artifact import Artifact
+from ..entities.job_event import JobEvent
 from ..entities.transcription import PostEditResult, TranscriptionResult
 from ..ports.repositories import LogRepository
 from ..entities.log_entry import LogEntry
-from ..entities.value_objects import LogLevel
+from ..entities.value_objects import JobEventType, LogLevel
+from ..ports.services import JobEventPublisher
 from .generate_artifacts import GenerateArtifacts
 from .post_edit import PostEditTranscript
 from .retry_or_reject import RetryDecision, RetryOrRejectJob
@@ -41,6 +43,9 @@ class ProcessJobPipeline:
         retry_handler: Optional[RetryOrRejectJob] = None,
         accuracy_guard: Optional[AccuracyGuard] = None,
         allow_retry: bool = False,
+        resume: bool = False,
+        streaming: bool = False,
+        event_publisher: Optional[JobEventPublisher] = None,
     ) -> None:
         self.asr_use_case = asr_use_case
         self.post_edit_use_case = post_edit_use_case
@@ -49,18 +54,38 @@ class ProcessJobPipeline:
         self.retry_handler = retry_handler
         self.accuracy_guard = accuracy_guard
         self.allow_retry = allow_retry
+        self.resume = resume
+        self.streaming = streaming
+        self.event_publisher = event_publisher
 
-    def execute(self, job_id: str) -> List[Artifact]:
+    def execute(self, job_id: str, resume: Optional[bool] = None) -> List[Artifact]:
+        """Runs the pipeline; in resume mode stages with a checkpoint for the current job version are skipped."""
+        resume = self.resume if resume is None else resume
         transcription: Optional[TranscriptionResult] = None
         post_edit: Optional[PostEditResult] = None
+        session: Any = None
         current_stage = "asr"
         try:
-            transcription = self._run_stage("asr", lambda: self.asr_use_case.execute(job_id), job_id)
-            self._record_asr_metrics(job_id, transcription)
+            if resume:
+                transcription = self._resume_stage("asr", self.asr_use_case, job_id)
+            if transcription is None:
+                session = self._start_session(job_id)
+                asr_kwargs = {"on_chunk": session.submit} if session is not None else {}
+                transcription = self._run_stage(
+                    "asr", lambda: self.asr_use_case.execute(job_id, **asr_kwargs), job_id
+                )
+                self._record_asr_metrics(job_id, transcription)
+            else:
+                # A post-edit checkpoint is only valid on top of the ASR result it came from.
+                post_edit = self._resume_stage("post_edit", self.post_edit_use_case, job_id)
             current_stage = "post_edit"
-            post_edit = self._run_stage(
-                "post_edit", lambda: self.post_edit_use_case.execute(job_id, transcription), job_id
-            )
+            if post_edit is None:
+                post_edit_kwargs = {"session": session} if session is not None else {}
+                post_edit = self._run_stage(
+                    "post_edit",
+                    lambda: self.post_edit_use_case.execute(job_id, transcription, **post_edit_kwargs),
+                    job_id,
+                )
             if self.accuracy_guard:
                 self.accuracy_guard.evaluate(job_id, transcription, post_edit)
             current_stage = "artifacts"
@@ -70,8 +95,15 @@ class ProcessJobPipeline:
             artifacts = list(artifact_result)
             self._record_artifact_metrics(job_id, artifacts)
             record_metric("pipeline.completed", {"job_id": job_id, "artifact_count": len(artifacts)})
+            self._emit(
+                JobEventType.ARTIFACTS_READY,
+                job_id,
+                payload={"artifacts": {artifact.artifact_type.value: str(artifact.path) for artifact in artifacts}},
+            )
             return artifacts
         except Exception as exc:
+            if session is not None:
+                session.cancel()
             self.log_repository.append(
                 LogEntry(
                     job_id=job_id,
@@ -80,6 +112,12 @@ class ProcessJobPipeline:
                     message=str(exc),
                 )
             )
+            self._emit(
+                JobEventType.FAILED,
+                job_id,
+                stage=current_stage,
+                payload={"error": exc.__class__.__name__, "message": str(exc)},
+            )
             notify_alert(
                 "pipeline.failed",
                 {
@@ -118,6 +156,7 @@ class ProcessJobPipeline:
             raise
 
     def _run_stage(self, stage_name: str, fn: Callable[[], T], job_id: str) -> T:
+        self._emit(JobEventType.STAGE_STARTED, job_id, stage=stage_name)
         start = time.perf_counter()
         success = False
         try:
@@ -133,6 +172,12 @@ class ProcessJobPipeline:
                 "success": success,
             }
             record_metric("pipeline.stage.duration", payload)
+            self._emit(
+                JobEventType.STAGE_COMPLETED,
+                job_id,
+                stage=stage_name,
+                payload={"duration_ms": payload["duration_ms"], "success": success},
+            )
             record_histogram(
                 "pipeline.stage.latency",
                 duration_ms,
@@ -140,6 +185,26 @@ class ProcessJobPipeline:
                 tags={"stage": stage_name, "success": success},
             )
 
+    def _emit(self, event_type: JobEventType, job_id: str, **kwargs: Any) -> None:
+        if self.event_publisher:
+            self.event_publisher.emit(JobEvent(type=event_type, job_id=job_id, **kwargs))
+
+    def _start_session(self, job_id: str) -> Any:
+        """In streaming mode post-edit runs per ASR chunk, overlapping with the next chunk's ASR."""
+        start_session = getattr(self.post_edit_use_case, "start_session", None)
+        if not self.streaming or start_session is None:
+            return None
+        return start_session(job_id)
+
+    def _resume_stage(self, stage_name: str, use_case: Any, job_id: str) -> Any:
+        resume = getattr(use_case, "resume", None)
+        if resume is None:
+            return None
+        result = resume(job_id)
+        if result is not None:
+            record_metric("pipeline.stage.resumed", {"job_id": job_id, "stage": stage_name})
+        return result
+
     def _record_asr_metrics(self, job_id: str, transcription: TranscriptionResult) -> None:
         metadata_chunk_count = transcription.metadata.get("chunk_count")
         record_metric(
@@ -1,12 +1,73 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from ..entities.job import Job
 from ..entities.log_entry import LogEntry
-from ..entities.transcription import PostEditResult, TranscriptionResult
+from ..entities.profile import Profile
+from ..entities.transcription import PostEditResult, Segment, TranscriptionResult
 from ..entities.value_objects import JobStatus, LogLevel
-from ..ports.repositories import JobRepository, LogRepository, ProfileProvider
+from ..ports.repositories import JobRepository, LogRepository, ProfileProvider, TranscriptionStore
 from ..ports.services import JobStatusPublisher, PostEditingService
 
 
+class ChunkedPostEditSession:
+    """Post-edits ASR chunks on a background worker while later chunks are still being transcribed.
+
+    Chunks are edited one at a time and in arrival order; ``result`` waits for the
+    pending windows and stitches them back into a single ``PostEditResult``.
+    """
+
+    def __init__(self, post_edit_service: PostEditingService, job: Job, profile: Profile) -> None:
+        self.post_edit_service = post_edit_service
+        self.job = job
+        self.profile = profile
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"post-edit-{job.id}")
+        self._windows: List[Future] = []
+
+    def submit(self, chunk: TranscriptionResult) -> None:
+        self._windows.append(self._executor.submit(self.post_edit_service.run, self.job, self.profile, chunk))
+
+    def result(self, transcription: TranscriptionResult) -> PostEditResult:
+        try:
+            parts = [window.result() for window in self._windows]
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if not parts:
+            return self.post_edit_service.run(self.job, self.profile, transcription)
+        if len(parts) == 1:
+            return parts[0]
+        return merge_post_edit_results(parts, fallback_language=transcription.language)
+
+    def cancel(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def merge_post_edit_results(parts: List[PostEditResult], fallback_language: Optional[str] = None) -> PostEditResult:
+    segments: List[Segment] = []
+    flags: List[Dict[str, str]] = []
+    for part in parts:
+        for segment in part.segments:
+            segments.append(
+                Segment(
+                    id=len(segments),
+                    start=segment.start,
+                    end=segment.end,
+                    text=segment.text,
+                    speaker=segment.speaker,
+                    confidence=segment.confidence,
+                )
+            )
+        flags.extend(part.flags or [])
+    return PostEditResult(
+        text=" ".join(part.text.strip() for part in parts if part.text).strip(),
+        segments=segments,
+        flags=flags,
+        language=next((part.language for part in parts if part.language), fallback_language),
+    )
+
+
 class PostEditTranscript:
     """Runs the post-editing stage with GPT models."""
 
@@ -17,14 +78,29 @@ class PostEditTranscript:
         post_edit_service: PostEditingService,
         log_repository: LogRepository,
         status_publisher: JobStatusPublisher | None = None,
+        transcription_store: TranscriptionStore | None = None,
     ) -> None:
         self.job_repository = job_repository
         self.profile_provider = profile_provider
         self.post_edit_service = post_edit_service
         self.log_repository = log_repository
         self.status_publisher = status_publisher
+        self.transcription_store = transcription_store
 
-    def execute(self, job_id: str, transcription: TranscriptionResult) -> PostEditResult:
+    def start_session(self, job_id: str) -> ChunkedPostEditSession:
+        """Opens a session that post-edits ASR chunks as they arrive (see ``execute(session=...)``)."""
+        job = self.job_repository.find_by_id(job_id)
+        if not job:
+            raise ValueError(f"Job {job_id} nao encontrado")
+        profile = self.profile_provider.get(job.profile_id)
+        return ChunkedPostEditSession(self.post_edit_service, job, profile)
+
+    def execute(
+        self,
+        job_id: str,
+        transcription: TranscriptionResult,
+        session: Optional[ChunkedPostEditSession] = None,
+    ) -> PostEditResult:
         job = self.job_repository.find_by_id(job_id)
         if not job:
             raise ValueError(f"Job {job_id} nao encontrado")
@@ -45,7 +121,11 @@ class PostEditTranscript:
         )
 
         try:
-            result = self.post_edit_service.run(job, profile, transcription)
+            if session is not None:
+                result = session.result(transcription)
+            else:
+                result = self.post_edit_service.run(job, profile, transcription)
+            self._persist_result(job.id, job.version, result)
             self.log_repository.append(
                 LogEntry(
                     job_id=job.id,
@@ -69,3 +149,46 @@ class PostEditTranscript:
                 )
             )
             raise
+
+    def resume(self, job_id: str) -> Optional[PostEditResult]:
+        """Reuses the post-edit checkpoint of the job's current version instead of calling the model.
+
+        The pipeline only asks for it after ``RunAsrPipeline.resume`` reused the ASR checkpoint.
+        """
+        if not self.transcription_store:
+            return None
+        job = self.job_repository.find_by_id(job_id)
+        if not job:
+            raise ValueError(f"Job {job_id} nao encontrado")
+        result = self.transcription_store.load_post_edit(job.id, job.version)
+        if result is None:
+            return None
+
+        job.set_status(JobStatus.POST_EDITING)
+        self.job_repository.update(job)
+        if self.status_publisher:
+            self.status_publisher.publish(job)
+        self.log_repository.append(
+            LogEntry(
+                job_id=job.id,
+                event="post_edit_resumed",
+                level=LogLevel.INFO,
+                message=f"Checkpoint v{job.version} reutilizado",
+            )
+        )
+        return result
+
+    def _persist_result(self, job_id: str, version: int, result: PostEditResult) -> None:
+        if not self.transcription_store:
+            return
+        try:
+            self.transcription_store.save_post_edit(job_id, version, result)
+        except OSError as exc:
+            self.log_repository.append(
+                LogEntry(
+                    job_id=job_id,
+                    event="post_edit_result_persist_failed",
+                    level=LogLevel.WARNING,
+                    message=str(exc),
+                )
+            )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from ..entities.artifact import Artifact
 from ..entities.delivery_record import DeliveryRecord
@@ -32,12 +32,123 @@ class RegisterDelivery:
         self.delivery_client = delivery_client
 
     def execute(self, job_id: str) -> Path:
+        job = self._load_approved(job_id)
+        package_path = self._package(job)
+        if self.delivery_client:
+            record = self._submit_external(job, package_path)
+            self._log_external_submission(job.id, record)
+        return package_path
+
+    def execute_many(self, job_ids: Sequence[str]) -> List[DeliveryRecord]:
+        """Packages every job, then hands all packages to the delivery client as one batch.
+
+        Returns one record per job id in order. Jobs that cannot be packaged get a
+        ``failed`` record from the ``package`` integration instead of aborting the rest.
+        """
+        records: Dict[str, DeliveryRecord] = {}
+        packaged: List[Tuple[Job, Path]] = []
+        for job_id in job_ids:
+            try:
+                job = self._load_approved(job_id)
+                packaged.append((job, self._package(job)))
+            except (ValueError, OSError) as exc:
+                records[job_id] = DeliveryRecord(job_id=job_id, integration="package", status="failed", message=str(exc))
+        if self.delivery_client:
+            for record in self.submit_batch(packaged):
+                records[record.job_id] = record
+        else:
+            for job, package_path in packaged:
+                records[job.id] = DeliveryRecord(
+                    job_id=job.id, integration="package", status="packaged", message=str(package_path)
+                )
+        return [records[job_id] for job_id in job_ids]
+
+    def package_many(
+        self, jobs: Sequence[Job], max_workers: int = 1
+    ) -> Tuple[List[Tuple[Job, Path]], Dict[str, str]]:
+        """Packages already-loaded jobs together and registers them in one sheet write.
+
+        Uses ``package_service.create_packages`` (worker processes) and
+        ``delivery_logger.register_many`` when available. Returns the packaged
+        ``(job, path)`` pairs and an error message per job that could not be packaged.
+        """
+        errors: Dict[str, str] = {}
+        to_package: List[Tuple[Job, List[Artifact]]] = []
+        for job in jobs:
+            artifacts = list(self.artifact_repository.list_by_job(job.id))
+            if artifacts:
+                to_package.append((job, artifacts))
+            else:
+                errors[job.id] = "Nenhum artefato disponivel para empacotar."
+
+        create_packages = getattr(self.package_service, "create_packages", None)
+        if create_packages:
+            results = create_packages(to_package, max_workers=max_workers)
+        else:
+            results = []
+            for job, artifacts in to_package:
+                try:
+                    results.append(self.package_service.create_package(job, artifacts))
+                except (OSError, ValueError) as exc:
+                    results.append(exc)
+
+        packaged: List[Tuple[Job, Path]] = []
+        entries: List[LogEntry] = []
+        for (job, _), result in zip(to_package, results):
+            if isinstance(result, Exception):
+                errors[job.id] = f"{type(result).__name__}: {result}"
+                entries.append(
+                    LogEntry(
+                        job_id=job.id, event="delivery_package_failed", level=LogLevel.ERROR, message=errors[job.id]
+                    )
+                )
+                continue
+            packaged.append((job, result))
+            entries.append(
+                LogEntry(
+                    job_id=job.id,
+                    event="delivery_package_created",
+                    level=LogLevel.INFO,
+                    message=f"Pacote gerado em {result}",
+                )
+            )
+        if packaged:
+            register_many = getattr(self.delivery_logger, "register_many", None)
+            if register_many:
+                register_many(packaged)
+            else:
+                for job, package_path in packaged:
+                    self.delivery_logger.register(job, package_path)
+        append_many = getattr(self.log_repository, "append_many", None)
+        if append_many:
+            append_many(entries)
+        else:
+            for entry in entries:
+                self.log_repository.append(entry)
+        return packaged, errors
+
+    def submit_batch(self, items: Sequence[Tuple[Job, Path]]) -> List[DeliveryRecord]:
+        """Submits already-built packages, batched when the client supports it."""
+        if not self.delivery_client:
+            raise RuntimeError("delivery_client not configured.")
+        submit_batch = getattr(self.delivery_client, "submit_batch", None)
+        if submit_batch:
+            records = list(submit_batch(items))
+        else:
+            records = [self.delivery_client.submit_package(job, package_path) for job, package_path in items]
+        for record in records:
+            self._log_external_submission(record.job_id, record)
+        return records
+
+    def _load_approved(self, job_id: str) -> Job:
         job = self.job_repository.find_by_id(job_id)
         if not job:
             raise ValueError(f"Job {job_id} nao encontrado")
         if job.status != JobStatus.APPROVED:
             raise ValueError("Job precisa estar aprovado para gerar pacote de entrega.")
+        return job
 
+    def _package(self, job: Job) -> Path:
         artifacts: Iterable[Artifact] = self.artifact_repository.list_by_job(job.id)
         artifacts_list = list(artifacts)
         if not artifacts_list:
@@ -53,9 +164,6 @@ class RegisterDelivery:
                 message=f"Pacote gerado em {package_path}",
             )
         )
-        if self.delivery_client:
-            record = self._submit_external(job, package_path)
-            self._log_external_submission(job.id, record)
         return package_path
 
     def _submit_external(self, job: Job, package_path: Path) -> DeliveryRecord:
@@ -64,11 +172,15 @@ class RegisterDelivery:
         return self.delivery_client.submit_package(job, package_path)
 
     def _log_external_submission(self, job_id: str, record: DeliveryRecord) -> None:
+        failed = record.status == "failed"
+        message = f"{record.integration} status={record.status}"
+        if failed and record.message:
+            message = f"{message}: {record.message}"
         self.log_repository.append(
             LogEntry(
                 job_id=job_id,
-                event="delivery_external_submitted",
-                level=LogLevel.INFO,
-                message=f"{record.integration} status={record.status}",
+                event="delivery_external_failed" if failed else "delivery_external_submitted",
+                level=LogLevel.ERROR if failed else LogLevel.INFO,
+                message=message,
             )
         )
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..entities.job import Job
 from ..entities.log_entry import LogEntry
 from ..entities.value_objects import JobStatus, LogLevel
-from ..ports.repositories import JobRepository, LogRepository
+from ..ports.repositories import JobRepository, LogRepository, TranscriptionStore
 from ..ports.services import JobStatusPublisher, RejectedJobLogger
 
+# Stage checkpoints that stay valid when a job fails at the given stage.
+REUSABLE_CHECKPOINTS: Dict[str, Tuple[str, ...]] = {
+    "post_edit": ("asr",),
+    "artifacts": ("asr", "post_edit"),
+}
+# Job metadata key naming the version whose carried checkpoints the next run may reuse.
+RESUME_METADATA_KEY = "resume_version"
+
 
 @dataclass
 class RetryDecision:
@@ -28,22 +36,32 @@ class RetryOrRejectJob:
         log_repository: LogRepository,
         rejected_logger: Optional[RejectedJobLogger] = None,
         status_publisher: Optional[JobStatusPublisher] = None,
+        transcription_store: Optional[TranscriptionStore] = None,
     ) -> None:
         self.job_repository = job_repository
         self.log_repository = log_repository
         self.rejected_logger = rejected_logger
         self.status_publisher = status_publisher
+        self.transcription_store = transcription_store
 
     def execute(self, decision: RetryDecision) -> Job:
         job = self.job_repository.find_by_id(decision.job_id)
         if not job:
             raise ValueError(f"Job {decision.job_id} nao encontrado")
 
+        carried: List[str] = []
         if decision.retryable:
+            previous_version = job.version
             job.bump_version()
+            carried = self._carry_checkpoints(job, previous_version, decision.stage)
+            if carried:
+                job.metadata[RESUME_METADATA_KEY] = str(job.version)
+            else:
+                job.metadata.pop(RESUME_METADATA_KEY, None)
             job.set_status(JobStatus.PENDING, notes=decision.error_message)
             event = "job_requeued"
         else:
+            job.metadata.pop(RESUME_METADATA_KEY, None)
             job.set_status(JobStatus.REJECTED, notes=decision.error_message)
             event = "job_rejected"
             if self.rejected_logger:
@@ -55,4 +73,25 @@ class RetryOrRejectJob:
         self.log_repository.append(
             LogEntry(job_id=job.id, event=event, level=LogLevel.WARNING, message=decision.error_message)
         )
+        if carried:
+            self.log_repository.append(
+                LogEntry(
+                    job_id=job.id,
+                    event="stage_checkpoints_carried",
+                    level=LogLevel.INFO,
+                    message=f"v{job.version}: {', '.join(carried)}",
+                )
+            )
         return job
+
+    def _carry_checkpoints(self, job: Job, previous_version: int, failed_stage: str) -> List[str]:
+        stages = REUSABLE_CHECKPOINTS.get(failed_stage)
+        if not self.transcription_store or not stages:
+            return []
+        try:
+            return self.transcription_store.carry_forward(job.id, previous_version, job.version, stages)
+        except OSError as exc:
+            self.log_repository.append(
+                LogEntry(job_id=job.id, event="stage_checkpoints_failed", level=LogLevel.WARNING, message=str(exc))
+            )
+            return []
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from typing import Callable, Optional
+
 from ..entities.log_entry import LogEntry
 from ..entities.transcription import TranscriptionResult
 from ..entities.value_objects import JobStatus, LogLevel
-from ..ports.repositories import JobRepository, LogRepository, ProfileProvider
+from ..ports.repositories import JobRepository, LogRepository, ProfileProvider, TranscriptionStore
 from ..ports.services import AsrService, JobStatusPublisher
+from .retry_or_reject import RESUME_METADATA_KEY
 
 
 class RunAsrPipeline:
@@ -17,14 +20,20 @@ class RunAsrPipeline:
         asr_service: AsrService,
         log_repository: LogRepository,
         status_publisher: JobStatusPublisher | None = None,
+        transcription_store: TranscriptionStore | None = None,
     ) -> None:
         self.job_repository = job_repository
         self.profile_provider = profile_provider
         self.asr_service = asr_service
         self.log_repository = log_repository
         self.status_publisher = status_publisher
+        self.transcription_store = transcription_store
 
-    def execute(self, job_id: str) -> TranscriptionResult:
+    def execute(
+        self,
+        job_id: str,
+        on_chunk: Optional[Callable[[TranscriptionResult], None]] = None,
+    ) -> TranscriptionResult:
         job = self.job_repository.find_by_id(job_id)
         if not job:
             raise ValueError(f"Job {job_id} nao encontrado")
@@ -32,6 +41,7 @@ class RunAsrPipeline:
         profile = self.profile_provider.get(job.profile_id)
         task = "translate" if profile.requires_translation() else "transcribe"
 
+        job.metadata.pop(RESUME_METADATA_KEY, None)  # a fresh run supersedes carried checkpoints
         job.set_status(JobStatus.PROCESSING)
         self.job_repository.update(job)
         if self.status_publisher:
@@ -46,7 +56,11 @@ class RunAsrPipeline:
         )
 
         try:
-            result = self.asr_service.run(job, profile, task=task)
+            if on_chunk:
+                result = self.asr_service.run(job, profile, task=task, on_chunk=on_chunk)
+            else:
+                result = self.asr_service.run(job, profile, task=task)
+            self._persist_result(job.id, job.version, result)
             job.language = result.language
             job.duration_sec = result.duration_sec
             job.set_status(JobStatus.ASR_COMPLETED)
@@ -76,3 +90,58 @@ class RunAsrPipeline:
                 )
             )
             raise
+
+    def resume(self, job_id: str) -> Optional[TranscriptionResult]:
+        """Reuses the ASR checkpoint of the job's current version instead of calling the engine.
+
+        Only a version requeued by ``RetryOrRejectJob`` with carried checkpoints is
+        resumed, and only once; re-processing any other job runs the engine again.
+        """
+        if not self.transcription_store:
+            return None
+        job = self.job_repository.find_by_id(job_id)
+        if not job:
+            raise ValueError(f"Job {job_id} nao encontrado")
+        if job.metadata.get(RESUME_METADATA_KEY) != str(job.version):
+            return None
+        result = self.transcription_store.load(job.id, job.version)
+        if result is None:
+            return None
+
+        job.metadata.pop(RESUME_METADATA_KEY, None)
+        job.language = result.language
+        job.duration_sec = result.duration_sec
+        job.set_status(JobStatus.ASR_COMPLETED)
+        self.job_repository.update(job)
+        if self.status_publisher:
+            self.status_publisher.publish(job)
+        self.log_repository.append(
+            LogEntry(
+                job_id=job.id,
+                event="asr_resumed",
+                level=LogLevel.INFO,
+                message=f"Checkpoint v{job.version} reutilizado",
+            )
+        )
+        return result
+
+    def load_result(self, job_id: str, version: int) -> Optional[TranscriptionResult]:
+        """Returns the persisted raw ASR output for a job version, if any."""
+        if not self.transcription_store:
+            return None
+        return self.transcription_store.load(job_id, version)
+
+    def _persist_result(self, job_id: str, version: int, result: TranscriptionResult) -> None:
+        if not self.transcription_store:
+            return
+        try:
+            self.transcription_store.save(job_id, version, result)
+        except OSError as exc:
+            self.log_repository.append(
+                LogEntry(
+                    job_id=job_id,
+                    event="asr_result_persist_failed",
+                    level=LogLevel.WARNING,
+                    message=str(exc),
+                )
+            )
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+import logging
+import time
+from typing import Iterable, List, Optional
+
+import requests
+
+from domain.entities.job_event import JobEvent
+
+logger = logging.getLogger(__name__)
+
+
+class JobEventWebhookSubscriber:
+    """Event bus subscriber that POSTs each job event as JSON to external URLs.
+
+    With a ``secret`` the body is signed the same way inbound webhooks are checked
+    (``X-Signature`` = HMAC-SHA256 of the body, plus ``X-Signature-Timestamp``).
+    Failures are logged and never raised back into the bus.
+    """
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        secret: str = "",
+        timeout: float = 5.0,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        self.urls: List[str] = [url.strip() for url in urls if url and url.strip()]
+        self.secret = secret
+        self.timeout = timeout
+        self.session = session or requests.Session()
+
+    def __call__(self, event: JobEvent) -> None:
+        body = json.dumps(event.to_dict(), ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json", "X-Event-Type": event.type.value}
+        if self.secret:
+            headers["X-Signature"] = hmac.new(self.secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+            headers["X-Signature-Timestamp"] = str(int(time.time()))
+        for url in self.urls:
+            try:
+                response = self.session.post(url, data=body, headers=headers, timeout=self.timeout)
+                response.raise_for_status()
+            except requests.RequestException as exc:
+                logger.warning("Webhook de eventos falhou para %s (%s): %s", url, event.type.value, exc)
+
+
+__all__ = ["JobEventWebhookSubscriber"]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from domain.entities.delivery_record import DeliveryRecord
 from domain.entities.job import Job
@@ -13,13 +15,18 @@ from domain.ports.services import DeliveryClient
 class GoTranscriptClient(DeliveryClient):
     """HTTP client responsible for sending ZIP packages to GoTranscript endpoints."""
 
-    def __init__(self, base_url: str, api_key: str, timeout: int = 30) -> None:
+    def __init__(self, base_url: str, api_key: str, timeout: int = 30, max_concurrency: int = 4) -> None:
         if not api_key:
             raise ValueError("GOTRANSCRIPT_API_KEY nao configurado.")
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
         self.session = requests.Session()
+        # One pooled connection per concurrent submission so batches reuse keep-alive sockets.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def submit_package(self, job: Job, package_path: Path) -> DeliveryRecord:
         url = f"{self.base_url}/deliveries"
@@ -48,6 +55,29 @@ class GoTranscriptClient(DeliveryClient):
             message=body.get("message"),
         )
 
+    def submit_batch(self, items: Sequence[Tuple[Job, Path]]) -> List[DeliveryRecord]:
+        """Submits many packages over the shared session, at most ``max_concurrency`` at a time.
+
+        Returns one record per item in input order; items that fail come back with
+        status ``failed`` and the error in ``message`` instead of aborting the batch.
+        """
+        if not items:
+            return []
+        workers = min(self.max_concurrency, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gotranscript") as executor:
+            return list(executor.map(lambda item: self._submit_or_fail(*item), items))
+
+    def _submit_or_fail(self, job: Job, package_path: Path) -> DeliveryRecord:
+        try:
+            return self.submit_package(job, package_path)
+        except (requests.RequestException, OSError, ValueError) as exc:
+            return DeliveryRecord(
+                job_id=job.id,
+                integration="gotranscript",
+                status="failed",
+                message=f"{type(exc).__name__}: {exc}",
+            )
+
 
 def _extract_external_id(body: Dict[str, Any]) -> Optional[str]:
     for key in ("id", "delivery_id", "reference"):
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from application.services.ports import SheetGateway
 
@@ -27,3 +27,7 @@ class GoogleSheetsGateway(SheetGateway):
     def append_row(self, row: Dict[str, Any]) -> None:
         values = list(row.values())
         self.worksheet.append_row(values, value_input_option="USER_ENTERED")
+
+    def append_rows(self, rows: List[Dict[str, Any]]) -> None:
+        if rows:
+            self.worksheet.append_rows([list(row.values()) for row in rows], value_input_option="USER_ENTERED")
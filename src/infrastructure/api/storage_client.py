@@ -1,25 +1,157 @@
 from __future__ import annotations
 
+import errno
+import hashlib
+import itertools
+import json
+import logging
+import math
+import os
 import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
 
 from domain.ports.services import StorageClient
 
+try:  # POSIX only
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# FICLONE from linux/fs.h; exposed by fcntl only from Python 3.12.
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl is not None else 0
+COPY_STRATEGIES = ("reflink", "hardlink", "copy_file_range", "copy")
+# Errors meaning "this strategy cannot work between these devices"; anything else
+# (ENOSPC, EIO, ...) may be transient, so the strategy is retried on the next copy.
+UNSUPPORTED_ERRNOS = frozenset(
+    code
+    for code in (
+        errno.EOPNOTSUPP,
+        getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+        errno.EXDEV,
+        errno.ENOSYS,
+        errno.EPERM,
+        errno.EINVAL,
+        getattr(errno, "ENOTTY", None),
+    )
+    if code is not None
+)
+
+MIB = 1024 * 1024
+MIN_PART_SIZE = 5 * MIB  # S3 rejects smaller parts except the last one
+MAX_PARTS = 10_000
+
 
 class LocalStorageClient(StorageClient):
-    """Stores backups locally (e.g., backup/ folder)."""
+    """Stores backups locally (e.g., backup/ folder).
 
-    def __init__(self, base_dir: Path) -> None:
+    Copies try the cheapest strategy first: a reflink (copy-on-write clone), a
+    hardlink when ``allow_hardlinks`` says sources are never modified in place
+    (artifacts and packages are replaced atomically, so their inodes are
+    immutable), ``os.copy_file_range`` (in-kernel copy), and finally
+    ``shutil.copyfile``. A strategy the filesystem does not support for a pair of
+    devices (see ``UNSUPPORTED_ERRNOS``) is skipped for that pair afterwards. The result always lands through a temp file and
+    ``os.replace``.
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        allow_hardlinks: bool = False,
+        strategies: Sequence[str] = COPY_STRATEGIES,
+        metric_dispatcher: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> None:
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.strategies = [name for name in strategies if name != "hardlink" or allow_hardlinks]
+        if "copy" not in self.strategies:
+            self.strategies.append("copy")
+        self.metric_dispatcher = metric_dispatcher
+        self.last_strategy: Optional[str] = None
+        self._unsupported: Dict[Tuple[int, int], set] = {}
 
     def upload(self, local_path: Path, remote_key: str) -> str:
         destination = self.base_dir / remote_key
         destination.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(local_path, destination)
+        devices = (local_path.stat().st_dev, destination.parent.stat().st_dev)
+        unsupported = self._unsupported.setdefault(devices, set())
+        # Unique per call so concurrent backups of the same key never share a temp file.
+        tmp_path = destination.with_name(f".{destination.name}.{uuid4().hex}.tmp")
+        start = time.perf_counter()
+        self.last_strategy = None
+        for name in self.strategies:
+            if name in unsupported and name != "copy":
+                continue
+            tmp_path.unlink(missing_ok=True)
+            try:
+                _COPY_FUNCTIONS[name](local_path, tmp_path)
+                if name != "hardlink":
+                    shutil.copystat(local_path, tmp_path)
+                os.replace(tmp_path, destination)
+            except OSError as exc:
+                tmp_path.unlink(missing_ok=True)
+                if name == "copy":
+                    raise
+                if exc.errno in UNSUPPORTED_ERRNOS:
+                    unsupported.add(name)
+                continue
+            self.last_strategy = name
+            break
+        if self.metric_dispatcher:
+            self.metric_dispatcher(
+                "storage.backup.copied",
+                {
+                    "key": remote_key,
+                    "strategy": self.last_strategy,
+                    "bytes": destination.stat().st_size,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                },
+            )
         return str(destination)
 
 
+def _reflink(source: Path, target: Path) -> None:
+    if fcntl is None:
+        raise OSError(errno.ENOTSUP, "reflink indisponivel nesta plataforma")
+    with source.open("rb") as src, target.open("wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+
+def _hardlink(source: Path, target: Path) -> None:
+    os.link(source, target)
+
+
+def _copy_file_range(source: Path, target: Path) -> None:
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        raise OSError(errno.ENOSYS, "copy_file_range indisponivel")
+    with source.open("rb") as src, target.open("wb") as dst:
+        remaining = os.fstat(src.fileno()).st_size
+        while remaining > 0:
+            copied = copy_range(src.fileno(), dst.fileno(), min(remaining, 1 << 30))
+            if copied == 0:
+                break
+            remaining -= copied
+
+
+def _plain_copy(source: Path, target: Path) -> None:
+    shutil.copyfile(source, target)
+
+
+_COPY_FUNCTIONS: Dict[str, Callable[[Path, Path], None]] = {
+    "reflink": _reflink,
+    "hardlink": _hardlink,
+    "copy_file_range": _copy_file_range,
+    "copy": _plain_copy,
+}
+
+
 class S3StorageClient(StorageClient):
     """Uploads files to an S3-compatible bucket (AWS, MinIO)."""
 
@@ -32,6 +164,11 @@ class S3StorageClient(StorageClient):
         secret_key: str = "",
         region: str = "",
         session_kwargs: dict | None = None,
+        multipart_threshold: int = 64 * MIB,
+        multipart_chunksize: int = 16 * MIB,
+        max_concurrency: int = 8,
+        resume_dir: Optional[Path] = None,
+        metric_dispatcher: Optional[Callable[[str, Dict[str, Any]], None]] = None,
     ) -> None:
         try:
             import boto3  # type: ignore
@@ -49,8 +186,232 @@ class S3StorageClient(StorageClient):
             client_kwargs["aws_access_key_id"] = access_key
             client_kwargs["aws_secret_access_key"] = secret_key
         self.client = boto3.client("s3", **client_kwargs)
+        self.multipart_threshold = multipart_threshold
+        self.multipart_chunksize = max(MIN_PART_SIZE, multipart_chunksize)
+        self.max_concurrency = max(1, max_concurrency)
+        self.resume_dir = resume_dir
+        if resume_dir:
+            resume_dir.mkdir(parents=True, exist_ok=True)
+        self.metric_dispatcher = metric_dispatcher
+
+    def upload(self, local_path: Path, remote_key: str) -> str:
+        """Uploads one file.
+
+        Files below ``multipart_threshold`` go up in a single request. Larger files
+        use multipart with ``max_concurrency`` parts in flight. When ``resume_dir``
+        is set, the upload id and finished parts are persisted there, so a later
+        call (or ``resume_pending`` after a restart) only sends the missing parts.
+        """
+        key = self.object_key(remote_key)
+        size = local_path.stat().st_size
+        start = time.perf_counter()
+        reused_parts = 0
+        if size < self.multipart_threshold:
+            self.client.upload_file(str(local_path), self.bucket, key)
+        elif self.resume_dir:
+            reused_parts = self._resumable_upload(local_path, key, size)
+        else:
+            from boto3.s3.transfer import TransferConfig  # type: ignore
+
+            config = TransferConfig(
+                multipart_threshold=self.multipart_threshold,
+                multipart_chunksize=self.multipart_chunksize,
+                max_concurrency=self.max_concurrency,
+            )
+            self.client.upload_file(str(local_path), self.bucket, key, Config=config)
+        self._report(key, size, start, size >= self.multipart_threshold, reused_parts)
+        return self.remote_uri(remote_key)
+
+    def object_key(self, remote_key: str) -> str:
+        return f"{self.prefix}/{remote_key}".strip("/") if self.prefix else remote_key
+
+    def remote_uri(self, remote_key: str) -> str:
+        return f"s3://{self.bucket}/{self.object_key(remote_key)}"
+
+    def resume_pending(self) -> List[str]:
+        """Finishes multipart uploads interrupted by a previous process, returning their URIs."""
+        if not self.resume_dir:
+            return []
+        finished: List[str] = []
+        for state_path in sorted(self.resume_dir.glob("*.json")):
+            try:
+                state = json.loads(state_path.read_text(encoding="utf-8"))
+                local_path = Path(state["path"])
+                key = state["key"]
+            except (OSError, ValueError, KeyError):
+                state_path.unlink(missing_ok=True)
+                continue
+            if not local_path.exists():
+                self._abort(key, state.get("upload_id"))
+                state_path.unlink(missing_ok=True)
+                continue
+            start = time.perf_counter()
+            size = local_path.stat().st_size
+            reused_parts = self._resumable_upload(local_path, key, size)
+            self._report(key, size, start, True, reused_parts)
+            finished.append(f"s3://{self.bucket}/{key}")
+        return finished
+
+    def _report(self, key: str, size: int, start: float, multipart: bool, reused_parts: int) -> None:
+        if self.metric_dispatcher:
+            self.metric_dispatcher(
+                "storage.upload.completed",
+                {
+                    "key": key,
+                    "bytes": size,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 3),
+                    "multipart": multipart,
+                    "reused_parts": reused_parts,
+                },
+            )
+
+    def _resumable_upload(self, local_path: Path, key: str, size: int) -> int:
+        state_path = self.resume_dir / f"{hashlib.sha1(f'{self.bucket}/{key}'.encode('utf-8')).hexdigest()}.json"
+        stat = local_path.stat()
+        part_size = max(self.multipart_chunksize, math.ceil(size / MAX_PARTS))
+        signature = {"path": str(local_path), "size": size, "mtime_ns": stat.st_mtime_ns, "part_size": part_size}
+        state = self._read_state(state_path)
+        parts: Dict[int, str] = {}
+        if state and state.get("key") == key and all(state.get(name) == value for name, value in signature.items()):
+            parts = self._uploaded_parts(key, state["upload_id"])
+        elif state:
+            self._abort(state.get("key", key), state.get("upload_id"))
+            state = None
+        if state is None or parts is None:
+            upload_id = self.client.create_multipart_upload(Bucket=self.bucket, Key=key)["UploadId"]
+            state = {"key": key, "upload_id": upload_id, **signature}
+            parts = {}
+            self._write_state(state_path, state)
+        upload_id = state["upload_id"]
+        reused = len(parts)
+        total_parts = max(1, math.ceil(size / part_size))
+        missing = [number for number in range(1, total_parts + 1) if number not in parts]
+
+        lock = threading.Lock()
+
+        def send(number: int) -> None:
+            with local_path.open("rb") as handle:
+                handle.seek((number - 1) * part_size)
+                body = handle.read(part_size)
+            response = self.client.upload_part(
+                Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=number, Body=body
+            )
+            with lock:
+                parts[number] = response["ETag"]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, max(1, len(missing)))) as executor:
+            for future in [executor.submit(send, number) for number in missing]:
+                future.result()
+
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": [{"ETag": parts[number], "PartNumber": number} for number in sorted(parts)]},
+        )
+        state_path.unlink(missing_ok=True)
+        return reused
+
+    def _uploaded_parts(self, key: str, upload_id: str) -> Optional[Dict[int, str]]:
+        """Asks the bucket which parts it already holds; None when the upload no longer exists."""
+        parts: Dict[int, str] = {}
+        marker = 0
+        while True:
+            try:
+                response = self.client.list_parts(
+                    Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumberMarker=marker
+                )
+            except Exception as exc:  # botocore ClientError (NoSuchUpload) and stub equivalents
+                logger.info("Upload multipart %s nao pode ser retomado: %s", upload_id, exc)
+                return None
+            for part in response.get("Parts", []):
+                parts[int(part["PartNumber"])] = part["ETag"]
+            if not response.get("IsTruncated"):
+                return parts
+            marker = int(response.get("NextPartNumberMarker", 0))
+
+    def _abort(self, key: str, upload_id: Optional[str]) -> None:
+        if not upload_id:
+            return
+        try:
+            self.client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+        except Exception as exc:  # already completed or expired on the server
+            logger.info("Falha ao abortar upload multipart %s: %s", upload_id, exc)
+
+    @staticmethod
+    def _read_state(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return state if isinstance(state, dict) and state.get("upload_id") else None
+
+    @staticmethod
+    def _write_state(path: Path, state: Dict[str, Any]) -> None:
+        tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+
+class BackgroundStorageClient(StorageClient):
+    """Runs another client's uploads on a worker pool so callers return immediately.
+
+    ``upload`` returns the URI the object will have. Failures are logged and reported
+    as ``storage.upload.failed``; clients with ``resume_pending`` get their
+    interrupted uploads restarted when the wrapper is created.
+    """
+
+    def __init__(
+        self,
+        inner: StorageClient,
+        max_workers: int = 2,
+        metric_dispatcher: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> None:
+        self.inner = inner
+        self.metric_dispatcher = metric_dispatcher
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="storage-upload")
+        self._pending: Dict[int, Future] = {}
+        self._tokens = itertools.count()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        resume_pending = getattr(inner, "resume_pending", None)
+        if resume_pending:
+            self._track("__resume__", self._executor.submit(resume_pending))
 
     def upload(self, local_path: Path, remote_key: str) -> str:
-        key = f"{self.prefix}/{remote_key}".strip("/") if self.prefix else remote_key
-        self.client.upload_file(str(local_path), self.bucket, key)
-        return f"s3://{self.bucket}/{key}"
+        self._track(remote_key, self._executor.submit(self.inner.upload, local_path, remote_key))
+        remote_uri = getattr(self.inner, "remote_uri", None)
+        return remote_uri(remote_key) if remote_uri else remote_key
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits for queued uploads, failures included; returns False if some are still running after ``timeout``."""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout=timeout)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def _track(self, remote_key: str, future: Future) -> None:
+        # Uploads are keyed by a token, not the remote key: the same key may be queued twice.
+        with self._lock:
+            token = next(self._tokens)
+            self._pending[token] = future
+        future.add_done_callback(lambda done: self._finished(token, remote_key, done))
+
+    def _finished(self, token: int, remote_key: str, future: Future) -> None:
+        # Report before leaving the pending set so flush() returns only after failures are visible.
+        try:
+            exc = future.exception()
+            if exc is not None:
+                logger.error("Upload em background falhou para %s: %s", remote_key, exc)
+                if self.metric_dispatcher:
+                    self.metric_dispatcher("storage.upload.failed", {"key": remote_key, "error": str(exc)})
+        finally:
+            with self._idle:
+                self._pending.pop(token, None)
+                self._idle.notify_all()
@@ -3,10 +3,12 @@ from __future__ import annotations
 from pathlib import Path
 
 from application.services.artifact_builder import FilesystemArtifactBuilder
+from application.services.cue_optimizer import CueOptimizer
 from application.services.subtitle_formatter import SubtitleFormatter
 from application.services.validator_service import TranscriptValidator
 from application.services.delivery_template_service import DeliveryTemplateRegistry
 from config import Settings
+from infrastructure.telemetry.metrics_logger import record_metric
 from domain.usecases.generate_artifacts import GenerateArtifacts
 
 
@@ -16,6 +18,11 @@ def build_default_builder(settings: Settings, template_registry: DeliveryTemplat
         SubtitleFormatter(),
         TranscriptValidator(),
         template_registry=template_registry,
+        cue_optimizer=CueOptimizer(),
+        parallel_writes=getattr(settings, "artifact_parallel_writes", True),
+        compact_json=getattr(settings, "artifact_json_compact", False),
+        incremental=getattr(settings, "artifact_incremental_builds", True),
+        metric_dispatcher=record_metric,
     )
 
 
@@ -7,6 +7,7 @@ from application.services.chatgpt_service import ChatGptPostEditingService
 from application.services.ports import AsrEngineClient
 from application.services.whisper_service import WhisperService
 from config import Settings
+from domain.ports.repositories import TranscriptionStore
 from domain.ports.services import RejectedJobLogger
 from domain.usecases.create_job import CreateJobFromInbox
 from domain.usecases.handle_review import HandleReviewDecision
@@ -28,6 +29,7 @@ def build_core_usecases(
     sheet_service,
     status_publisher,
     rejected_logger: RejectedJobLogger,
+    transcription_store: TranscriptionStore | None = None,
 ):
     engine_clients = _build_asr_clients(settings)
     chunker = AudioChunker(settings.openai_chunk_duration_sec)
@@ -53,6 +55,7 @@ def build_core_usecases(
         asr_service=asr_service,
         log_repository=log_repository,
         status_publisher=status_publisher,
+        transcription_store=transcription_store,
     )
     post_edit = PostEditTranscript(
         job_repository=job_repository,
@@ -60,12 +63,14 @@ def build_core_usecases(
         post_edit_service=post_edit_service,
         log_repository=log_repository,
         status_publisher=status_publisher,
+        transcription_store=transcription_store,
     )
     retry = RetryOrRejectJob(
         job_repository=job_repository,
         log_repository=log_repository,
         rejected_logger=rejected_logger,
         status_publisher=status_publisher,
+        transcription_store=transcription_store,
     )
     handle_review = HandleReviewDecision(
         job_repository=job_repository,
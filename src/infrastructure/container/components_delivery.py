@@ -1,30 +1,81 @@
 from __future__ import annotations
 
+import atexit
 from pathlib import Path
 
+from application.services.event_bus import JobEventBus, metrics_subscriber
+from application.services.live_feed import LiveFeed
 from application.services.package_service import ZipPackageService
 from application.services.rejected_logger import FilesystemRejectedLogger
 from application.services.sheet_service import CsvSheetService
 from application.services.status_publisher import SheetStatusPublisher
 from config import Settings
+from domain.entities.value_objects import JobEventType
 from domain.usecases.register_delivery import RegisterDelivery
+from infrastructure.api.event_webhooks import JobEventWebhookSubscriber
 from infrastructure.api.gotranscript_client import GoTranscriptClient
 from infrastructure.api.sheets_client import GoogleSheetsGateway
-from infrastructure.api.storage_client import S3StorageClient
+from infrastructure.api.storage_client import MIB, BackgroundStorageClient, LocalStorageClient, S3StorageClient
+from infrastructure.telemetry.metrics_logger import record_metric
 
 
 def build_logging_and_sheet(settings: Settings):
     sheet_gateway = _build_sheet_gateway(settings)
-    sheet_service = CsvSheetService(Path(settings.csv_log_path), sheet_gateway=sheet_gateway)
-    status_publisher = SheetStatusPublisher(sheet_service)
+    sheet_service = CsvSheetService(
+        Path(settings.csv_log_path),
+        sheet_gateway=sheet_gateway,
+        buffer_max_rows=getattr(settings, "sheet_buffer_max_rows", 100),
+        buffer_max_delay_ms=getattr(settings, "sheet_buffer_max_delay_ms", 250),
+        metric_dispatcher=record_metric,
+    )
+    # Buffered rows must reach the CSV/Sheets before the process exits.
+    atexit.register(sheet_service.close)
+    status_publisher = build_event_bus(settings, SheetStatusPublisher(sheet_service))
     rejected_logger = FilesystemRejectedLogger(Path(settings.base_rejected_dir))
     return sheet_service, status_publisher, rejected_logger
 
 
+def build_event_bus(settings: Settings, sheet_publisher: SheetStatusPublisher) -> JobEventBus:
+    event_bus = JobEventBus(
+        max_workers=getattr(settings, "event_bus_workers", 4),
+        max_pending=getattr(settings, "event_bus_max_pending", 1000),
+        metric_dispatcher=record_metric,
+    )
+    event_bus.subscribe(
+        sheet_publisher.handle_event,
+        (JobEventType.CREATED, JobEventType.STATUS_CHANGED),
+        name="sheet",
+        batch_handler=sheet_publisher.handle_events,
+    )
+    event_bus.subscribe(metrics_subscriber(record_metric), name="metrics")
+    webhook_urls = getattr(settings, "job_events_webhook_url", "").split(",")
+    if any(url.strip() for url in webhook_urls):
+        event_bus.subscribe(
+            JobEventWebhookSubscriber(webhook_urls, secret=getattr(settings, "job_events_webhook_secret", "")),
+            name="webhooks",
+        )
+    atexit.register(event_bus.close)
+    return event_bus
+
+
+def build_live_feed(settings: Settings, event_bus) -> LiveFeed:
+    live_feed = LiveFeed(history=getattr(settings, "dashboard_stream_history", 500))
+    subscribe = getattr(event_bus, "subscribe", None)
+    if subscribe:
+        subscribe(live_feed.handle_event, name="dashboard-stream")
+    return live_feed
+
+
 def build_delivery_services(settings: Settings, job_repository, artifact_repository, sheet_service, log_repository):
     storage_client = _build_storage_client(settings)
     delivery_client = _build_delivery_client(settings)
-    package_service = ZipPackageService(Path(settings.base_backup_dir), storage_client=storage_client)
+    package_service = ZipPackageService(
+        Path(settings.base_backup_dir),
+        storage_client=storage_client,
+        compression_level=getattr(settings, "package_compression_level", 6),
+        max_workers=getattr(settings, "package_compression_workers", 4),
+        metric_dispatcher=record_metric,
+    )
     register_delivery = RegisterDelivery(
         job_repository=job_repository,
         artifact_repository=artifact_repository,
@@ -50,15 +101,32 @@ def _build_sheet_gateway(settings: Settings):
 
 def _build_storage_client(settings: Settings):
     if not settings.s3_enabled:
+        if getattr(settings, "local_backup_enabled", False):
+            return LocalStorageClient(
+                Path(settings.local_backup_dir),
+                allow_hardlinks=getattr(settings, "local_backup_allow_hardlinks", False),
+                metric_dispatcher=record_metric,
+            )
         return None
-    return S3StorageClient(
+    resume_dir = None
+    if getattr(settings, "s3_resumable_uploads", True):
+        resume_dir = Path(settings.base_processing_dir) / "uploads"
+    client = S3StorageClient(
         bucket=settings.s3_bucket,
         prefix=settings.s3_prefix,
         endpoint_url=settings.s3_endpoint_url,
         access_key=settings.s3_access_key,
         secret_key=settings.s3_secret_key,
         region=settings.s3_region,
+        multipart_threshold=getattr(settings, "s3_multipart_threshold_mb", 64) * MIB,
+        multipart_chunksize=getattr(settings, "s3_multipart_chunk_mb", 16) * MIB,
+        max_concurrency=getattr(settings, "s3_max_concurrency", 8),
+        resume_dir=resume_dir,
+        metric_dispatcher=record_metric,
     )
+    if getattr(settings, "s3_background_uploads", False):
+        return BackgroundStorageClient(client, metric_dispatcher=record_metric)
+    return client
 
 
 def _build_delivery_client(settings: Settings):
@@ -68,4 +136,5 @@ def _build_delivery_client(settings: Settings):
         base_url=settings.gotranscript_base_url,
         api_key=settings.gotranscript_api_key,
         timeout=settings.gotranscript_timeout_sec,
+        max_concurrency=getattr(settings, "gotranscript_max_concurrency", 4),
     )
@@ -7,6 +7,8 @@ from infrastructure.database.job_repository import FileJobRepository
 from infrastructure.database.log_repository import FileLogRepository
 from infrastructure.database.profile_provider import FilesystemProfileProvider
 from infrastructure.database.review_repository import FileReviewRepository
+from infrastructure.database.transcription_store import FilesystemTranscriptionStore
+from infrastructure.database.upload_index import FileUploadIndex
 from infrastructure.database import sqlite_repositories
 
 
@@ -24,3 +26,15 @@ def build_repositories(processing_dir: Path, settings: Settings):
         review_repo = FileReviewRepository(processing_dir / "reviews.json")
     profile_provider = FilesystemProfileProvider(settings.profiles_dir)
     return job_repo, artifact_repo, log_repo, review_repo, profile_provider
+
+
+def build_transcription_store(processing_dir: Path) -> FilesystemTranscriptionStore:
+    return FilesystemTranscriptionStore(processing_dir / "checkpoints")
+
+
+def build_upload_index(processing_dir: Path, settings: Settings):
+    if not getattr(settings, "upload_dedupe_enabled", True):
+        return None
+    if getattr(settings, "persistence_backend", "file") == "sqlite":
+        return sqlite_repositories.SqlUploadIndex(Path(settings.database_url.replace("sqlite:///", "")))
+    return FileUploadIndex(processing_dir / "upload_index.json")
@@ -8,6 +8,7 @@ from application.logging_config import configure_logging
 from config import Settings, get_settings
 from domain.entities.job import Job
 from domain.ports.services import ArtifactBuilder
+from domain.usecases.bulk_review import BulkReviewDelivery
 from domain.usecases.generate_artifacts import GenerateArtifacts
 from domain.usecases.pipeline import ProcessJobPipeline
 from domain.usecases.register_delivery import RegisterDelivery
@@ -15,6 +16,7 @@ from domain.usecases.register_delivery import RegisterDelivery
 from application.services.oauth_service import OAuthService
 from application.services.delivery_template_service import DeliveryTemplateRegistry
 from application.services.accuracy_service import TranscriptionAccuracyGuard
+from application.services.live_feed import ObservedLogRepository
 from infrastructure.telemetry.metrics_logger import notify_alert, record_metric
 from . import components_artifacts, components_asr, components_delivery, components_storage
 
@@ -38,12 +40,17 @@ class ServiceContainer:
             self.review_repository,
             self.profile_provider,
         ) = components_storage.build_repositories(processing_dir, self.settings)
+        self.transcription_store = components_storage.build_transcription_store(processing_dir)
+        self.upload_index = components_storage.build_upload_index(processing_dir, self.settings)
 
         (
             self.sheet_service,
             self.status_publisher,
             self.rejected_logger,
         ) = components_delivery.build_logging_and_sheet(self.settings)
+        # The dashboard stream sees job events from the bus and incidents as they are logged.
+        self.live_feed = components_delivery.build_live_feed(self.settings, self.status_publisher)
+        self.log_repository = ObservedLogRepository(self.log_repository, self.live_feed.handle_log)
 
         templates_dir = Path(self.settings.profiles_dir) / "templates"
         self.template_registry = DeliveryTemplateRegistry(templates_dir)
@@ -57,6 +64,7 @@ class ServiceContainer:
             sheet_service=self.sheet_service,
             status_publisher=self.status_publisher,
             rejected_logger=self.rejected_logger,
+            transcription_store=self.transcription_store,
         )
         (
             self.create_job_use_case,
@@ -103,6 +111,9 @@ class ServiceContainer:
             log_repository=self.log_repository,
             retry_handler=self.retry_use_case,
             accuracy_guard=self.accuracy_guard,
+            resume=getattr(self.settings, "pipeline_resume_enabled", False),
+            streaming=getattr(self.settings, "pipeline_streaming_enabled", False),
+            event_publisher=self.status_publisher if hasattr(self.status_publisher, "emit") else None,
         )
 
     def _wire_artifacts_pipeline(self) -> None:
@@ -115,6 +126,14 @@ class ServiceContainer:
             self.sheet_service,
             self.log_repository,
         )
+        self.bulk_review_use_case = BulkReviewDelivery(
+            job_repository=self.job_repository,
+            review_repository=self.review_repository,
+            log_repository=self.log_repository,
+            status_publisher=self.status_publisher,
+            register_delivery=self.register_delivery_use_case,
+            package_workers=getattr(self.settings, "bulk_review_package_workers", 4),
+        )
 
     def _load_reference_transcript(self, job: Job) -> Optional[str]:
         metadata = job.metadata or {}
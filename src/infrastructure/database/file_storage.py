@@ -24,3 +24,12 @@ def write_json_list(path: Path, data: List[Any]) -> None:
     lock = _lock_for(path)
     with lock:
         path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def revision(path: Path) -> str:
+    """Cheap change token for ``path``: every write replaces the content and bumps the mtime."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return "0"
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
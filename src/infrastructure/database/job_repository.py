@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from domain.entities.job import Job
 from domain.ports.repositories import JobRepository
@@ -38,6 +38,18 @@ class FileJobRepository(JobRepository):
         self._save_all(jobs)
         return job
 
+    def update_many(self, updated_jobs: Iterable[Job]) -> None:
+        pending = {job.id: job for job in updated_jobs}
+        if not pending:
+            return
+        jobs = self._load_all()
+        for idx, existing in enumerate(jobs):
+            job = pending.pop(existing["id"], None)
+            if job is not None:
+                jobs[idx] = job_to_dict(job)
+        jobs.extend(job_to_dict(job) for job in pending.values())
+        self._save_all(jobs)
+
     def find_by_id(self, job_id: str) -> Optional[Job]:
         jobs = self._load_all()
         for data in jobs:
@@ -45,11 +57,20 @@ class FileJobRepository(JobRepository):
                 return job_from_dict(data)
         return None
 
+    def find_many(self, job_ids: Iterable[str]) -> List[Job]:
+        wanted = set(job_ids)
+        if not wanted:
+            return []
+        return [job_from_dict(data) for data in self._load_all() if data["id"] in wanted]
+
     def list_recent(self, limit: int = 50) -> List[Job]:
         jobs = self._load_all()
         sorted_jobs = sorted(jobs, key=lambda item: item["updated_at"], reverse=True)
         return [job_from_dict(item) for item in sorted_jobs[:limit]]
 
+    def revision(self) -> str:
+        return file_storage.revision(self.storage_path)
+
     def _load_all(self) -> List[Dict]:
         return file_storage.read_json_list(self.storage_path)
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
 
 from domain.entities.log_entry import LogEntry
 from domain.ports.repositories import LogRepository
@@ -22,6 +22,14 @@ class FileLogRepository(LogRepository):
         data.append(logentry_to_dict(entry))
         self._save_all(data)
 
+    def append_many(self, entries: Iterable[LogEntry]) -> None:
+        new_items = [logentry_to_dict(entry) for entry in entries]
+        if not new_items:
+            return
+        data = self._load_all()
+        data.extend(new_items)
+        self._save_all(data)
+
     def list_by_job(self, job_id: str) -> List[LogEntry]:
         data = self._load_all()
         return [logentry_from_dict(item) for item in data if item["job_id"] == job_id]
@@ -32,6 +40,9 @@ class FileLogRepository(LogRepository):
         entries.sort(key=lambda entry: entry.timestamp, reverse=True)
         return entries[:limit]
 
+    def revision(self) -> str:
+        return file_storage.revision(self.storage_path)
+
     def _load_all(self) -> List[dict]:
         return file_storage.read_json_list(self.storage_path)
 
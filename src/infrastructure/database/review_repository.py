@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from domain.entities.user_review import UserReview
 from domain.ports.repositories import ReviewRepository
@@ -23,6 +23,14 @@ class FileReviewRepository(ReviewRepository):
         self._save_all(data)
         return review
 
+    def save_many(self, reviews: Iterable[UserReview]) -> None:
+        new_items = [review_to_dict(review) for review in reviews]
+        if not new_items:
+            return
+        data = self._load_all()
+        data.extend(new_items)
+        self._save_all(data)
+
     def find_latest(self, job_id: str) -> Optional[UserReview]:
         data = self._load_all()
         filtered = [review_from_dict(item) for item in data if item["job_id"] == job_id]
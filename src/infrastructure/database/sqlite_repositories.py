@@ -9,7 +9,7 @@ from domain.entities.artifact import Artifact
 from domain.entities.job import Job
 from domain.entities.log_entry import LogEntry
 from domain.entities.user_review import UserReview
-from domain.ports.repositories import ArtifactRepository, JobRepository, LogRepository, ReviewRepository
+from domain.ports.repositories import ArtifactRepository, JobRepository, LogRepository, ReviewRepository, UploadIndex
 
 from .serializers import (
     artifact_from_dict,
@@ -31,10 +31,23 @@ def _connect(db_path: Path) -> sqlite3.Connection:
     return conn
 
 
+def _track_revisions(conn: sqlite3.Connection, table: str) -> None:
+    """Keeps a per-table write counter in ``revisions``, bumped by triggers so writers in other processes count too."""
+    conn.execute("CREATE TABLE IF NOT EXISTS revisions (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+    conn.execute("INSERT OR IGNORE INTO revisions (name, value) VALUES (?, 0)", (table,))
+    for operation in ("INSERT", "UPDATE", "DELETE"):
+        conn.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_revision_{operation.lower()} AFTER {operation} ON {table} "
+            f"BEGIN UPDATE revisions SET value = value + 1 WHERE name = '{table}'; END"
+        )
+    conn.commit()
+
+
 class SqlJobRepository(JobRepository):
     def __init__(self, db_path: Path) -> None:
         self.conn = _connect(db_path)
         self.conn.execute("CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY, payload TEXT NOT NULL)")
+        _track_revisions(self.conn, "jobs")
 
     def create(self, job: Job) -> Job:
         payload = json.dumps(job_to_dict(job), ensure_ascii=False)
@@ -48,15 +61,35 @@ class SqlJobRepository(JobRepository):
         self.conn.commit()
         return job
 
+    def update_many(self, jobs: Iterable[Job]) -> None:
+        rows = [(job.id, json.dumps(job_to_dict(job), ensure_ascii=False)) for job in jobs]
+        self.conn.executemany("INSERT OR REPLACE INTO jobs (id, payload) VALUES (?, ?)", rows)
+        self.conn.commit()
+
     def find_by_id(self, job_id: str) -> Optional[Job]:
         cur = self.conn.execute("SELECT payload FROM jobs WHERE id = ?", (job_id,))
         row = cur.fetchone()
         return job_from_dict(json.loads(row[0])) if row else None
 
+    def find_many(self, job_ids: Iterable[str]) -> List[Job]:
+        ids = list(dict.fromkeys(job_ids))
+        jobs: List[Job] = []
+        # Stay well below SQLite's bound-parameter limit.
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            placeholders = ",".join("?" for _ in chunk)
+            cur = self.conn.execute(f"SELECT payload FROM jobs WHERE id IN ({placeholders})", chunk)
+            jobs.extend(job_from_dict(json.loads(row[0])) for row in cur.fetchall())
+        return jobs
+
     def list_recent(self, limit: int = 50) -> List[Job]:
         cur = self.conn.execute("SELECT payload FROM jobs ORDER BY json_extract(payload, '$.updated_at') DESC LIMIT ?", (limit,))
         return [job_from_dict(json.loads(row[0])) for row in cur.fetchall()]
 
+    def revision(self) -> str:
+        row = self.conn.execute("SELECT value FROM revisions WHERE name = 'jobs'").fetchone()
+        return str(row[0] if row else 0)
+
 
 class SqlArtifactRepository(ArtifactRepository):
     def __init__(self, db_path: Path) -> None:
@@ -102,6 +135,11 @@ class SqlLogRepository(LogRepository):
         self.conn.execute("INSERT INTO logs (job_id, payload) VALUES (?, ?)", (entry.job_id, payload))
         self.conn.commit()
 
+    def append_many(self, entries: Iterable[LogEntry]) -> None:
+        rows = [(entry.job_id, json.dumps(logentry_to_dict(entry), ensure_ascii=False)) for entry in entries]
+        self.conn.executemany("INSERT INTO logs (job_id, payload) VALUES (?, ?)", rows)
+        self.conn.commit()
+
     def list_by_job(self, job_id: str) -> List[LogEntry]:
         cur = self.conn.execute("SELECT payload FROM logs WHERE job_id = ? ORDER BY id DESC", (job_id,))
         return [logentry_from_dict(json.loads(row[0])) for row in cur.fetchall()]
@@ -110,6 +148,11 @@ class SqlLogRepository(LogRepository):
         cur = self.conn.execute("SELECT payload FROM logs ORDER BY id DESC LIMIT ?", (limit,))
         return [logentry_from_dict(json.loads(row[0])) for row in cur.fetchall()]
 
+    def revision(self) -> str:
+        # Logs are append-only, so the newest autoincrement id already orders every write.
+        row = self.conn.execute("SELECT MAX(id) FROM logs").fetchone()
+        return str(row[0] or 0)
+
 
 class SqlReviewRepository(ReviewRepository):
     def __init__(self, db_path: Path) -> None:
@@ -129,7 +172,26 @@ class SqlReviewRepository(ReviewRepository):
         self.conn.commit()
         return review
 
+    def save_many(self, reviews: Iterable[UserReview]) -> None:
+        rows = [(review.job_id, json.dumps(review_to_dict(review), ensure_ascii=False)) for review in reviews]
+        self.conn.executemany("INSERT OR REPLACE INTO reviews (job_id, payload) VALUES (?, ?)", rows)
+        self.conn.commit()
+
     def find_latest(self, job_id: str) -> Optional[UserReview]:
         cur = self.conn.execute("SELECT payload FROM reviews WHERE job_id = ?", (job_id,))
         row = cur.fetchone()
         return review_from_dict(json.loads(row[0])) if row else None
+
+
+class SqlUploadIndex(UploadIndex):
+    def __init__(self, db_path: Path) -> None:
+        self.conn = _connect(db_path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS upload_index (key TEXT PRIMARY KEY, job_id TEXT NOT NULL)")
+
+    def find(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT job_id FROM upload_index WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def register(self, key: str, job_id: str) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO upload_index (key, job_id) VALUES (?, ?)", (key, job_id))
+        self.conn.commit()
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import uuid4
+
+from domain.entities.transcription import PostEditResult, Segment, TranscriptionResult
+from domain.ports.repositories import TranscriptionStore
+
+STORE_FORMAT = "asr-columnar/1"
+STAGE_ASR = "asr"
+STAGE_POST_EDIT = "post_edit"
+
+
+class StoredTranscription:
+    """Lazy handle over a persisted ASR or post-edit result.
+
+    Line 1 of the file is the header, line 2 the full text and lines 3-4 the
+    segment columns, so callers only pay for the parts they touch.
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any]) -> None:
+        self.path = path
+        self.header = header
+        self._text: Optional[str] = None
+        self._segments: Optional[List[Segment]] = None
+
+    @property
+    def language(self) -> str:
+        return self.header.get("language") or ""
+
+    @property
+    def duration_sec(self) -> Optional[float]:
+        return self.header.get("duration_sec")
+
+    @property
+    def engine(self) -> str:
+        return self.header.get("engine") or "openai"
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return dict(self.header.get("metadata") or {})
+
+    @property
+    def flags(self) -> List[Dict[str, str]]:
+        return list(self.header.get("flags") or [])
+
+    @property
+    def segment_count(self) -> int:
+        return int(self.header.get("segment_count") or 0)
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = json.loads(self._read_lines(2)[1])
+        return self._text
+
+    @property
+    def segments(self) -> List[Segment]:
+        if self._segments is None:
+            lines = self._read_lines(4)
+            columns = json.loads(lines[2])
+            texts = json.loads(lines[3])
+            self._segments = [
+                Segment(id=seg_id, start=start, end=end, text=text, speaker=speaker, confidence=confidence)
+                for seg_id, start, end, confidence, speaker, text in zip(
+                    columns["id"], columns["start"], columns["end"], columns["confidence"], columns["speaker"], texts
+                )
+            ]
+        return self._segments
+
+    def to_result(self) -> TranscriptionResult:
+        return TranscriptionResult(
+            text=self.text,
+            segments=list(self.segments),
+            language=self.language,
+            duration_sec=self.duration_sec,
+            engine=self.engine,
+            metadata=self.metadata,
+        )
+
+    def to_post_edit(self) -> PostEditResult:
+        return PostEditResult(
+            text=self.text,
+            segments=list(self.segments),
+            flags=self.flags,
+            language=self.header.get("language"),
+        )
+
+    def _read_lines(self, count: int) -> List[str]:
+        lines: List[str] = []
+        with self.path.open("r", encoding="utf-8") as cursor:
+            for line in cursor:
+                lines.append(line)
+                if len(lines) == count:
+                    break
+        if len(lines) < count:
+            raise ValueError(f"Arquivo de ASR incompleto: {self.path}")
+        return lines
+
+
+class FilesystemTranscriptionStore(TranscriptionStore):
+    """Persists ASR and post-edit stage results per job/version as compact columnar JSONL."""
+
+    def __init__(self, root_dir: Path) -> None:
+        self.root_dir = root_dir
+
+    def path_for(self, job_id: str, version: int, stage: str = STAGE_ASR) -> Path:
+        return self.root_dir / job_id / f"{job_id}_v{version}.{stage}.jsonl"
+
+    def save(self, job_id: str, version: int, result: TranscriptionResult) -> Path:
+        header = {
+            "language": result.language,
+            "duration_sec": result.duration_sec,
+            "engine": result.engine,
+            "metadata": result.metadata,
+        }
+        return self._write(job_id, version, STAGE_ASR, header, result.text, result.segments)
+
+    def save_post_edit(self, job_id: str, version: int, result: PostEditResult) -> Path:
+        header = {"language": result.language, "flags": result.flags}
+        return self._write(job_id, version, STAGE_POST_EDIT, header, result.text, result.segments)
+
+    def open(self, job_id: str, version: int, stage: str = STAGE_ASR) -> Optional[StoredTranscription]:
+        path = self.path_for(job_id, version, stage)
+        if not path.is_file():
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as cursor:
+                header = json.loads(cursor.readline())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(header, dict) or header.get("format") != STORE_FORMAT:
+            return None
+        return StoredTranscription(path, header)
+
+    def load(self, job_id: str, version: int) -> Optional[TranscriptionResult]:
+        stored = self.open(job_id, version)
+        if stored is None:
+            return None
+        try:
+            return stored.to_result()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def load_text(self, job_id: str, version: int) -> Optional[str]:
+        stored = self.open(job_id, version)
+        if stored is None:
+            return None
+        try:
+            return stored.text
+        except (OSError, ValueError):
+            return None
+
+    def load_post_edit(self, job_id: str, version: int) -> Optional[PostEditResult]:
+        stored = self.open(job_id, version, STAGE_POST_EDIT)
+        if stored is None:
+            return None
+        try:
+            return stored.to_post_edit()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def carry_forward(self, job_id: str, from_version: int, to_version: int, stages: Iterable[str]) -> List[str]:
+        """Re-saves the given stage results of one version under another, returning the stages copied."""
+        carried: List[str] = []
+        for stage in stages:
+            if stage == STAGE_ASR:
+                transcription = self.load(job_id, from_version)
+                if transcription is None:
+                    continue
+                self.save(job_id, to_version, transcription)
+            elif stage == STAGE_POST_EDIT:
+                post_edit = self.load_post_edit(job_id, from_version)
+                if post_edit is None:
+                    continue
+                self.save_post_edit(job_id, to_version, post_edit)
+            else:
+                continue
+            carried.append(stage)
+        return carried
+
+    def _write(
+        self,
+        job_id: str,
+        version: int,
+        stage: str,
+        extra_header: Dict[str, Any],
+        text: str,
+        segments: Optional[List[Segment]],
+    ) -> Path:
+        path = self.path_for(job_id, version, stage)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        segments = segments or []
+        header = {
+            "format": STORE_FORMAT,
+            "stage": stage,
+            "job_id": job_id,
+            "version": version,
+            **extra_header,
+            "segment_count": len(segments),
+        }
+        columns = {
+            "id": [segment.id for segment in segments],
+            "start": [segment.start for segment in segments],
+            "end": [segment.end for segment in segments],
+            "confidence": [segment.confidence for segment in segments],
+            "speaker": [segment.speaker for segment in segments],
+        }
+        lines = [
+            _dumps(header),
+            _dumps(text or ""),
+            _dumps(columns),
+            _dumps([segment.text for segment in segments]),
+        ]
+        # Unique per call so concurrent writers of the same checkpoint never share a temp file.
+        tmp_path = path.with_name(f"{path.name}.{uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return path
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+__all__ = ["FilesystemTranscriptionStore", "StoredTranscription", "STORE_FORMAT", "STAGE_ASR", "STAGE_POST_EDIT"]
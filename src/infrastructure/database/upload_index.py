@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from domain.ports.repositories import UploadIndex
+
+from . import file_storage
+
+
+class FileUploadIndex(UploadIndex):
+    """JSON-file index from upload content keys to the job created for them."""
+
+    def __init__(self, storage_path: Path) -> None:
+        self.storage_path = storage_path
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.storage_path.exists():
+            self.storage_path.write_text("[]", encoding="utf-8")
+
+    def find(self, key: str) -> Optional[str]:
+        for item in self._load_all():
+            if item["key"] == key:
+                return item["job_id"]
+        return None
+
+    def register(self, key: str, job_id: str) -> None:
+        data = [item for item in self._load_all() if item["key"] != key]
+        data.append({"key": key, "job_id": job_id})
+        self._save_all(data)
+
+    def _load_all(self) -> List[Dict[str, str]]:
+        return file_storage.read_json_list(self.storage_path)
+
+    def _save_all(self, data: List[Dict[str, str]]) -> None:
+        file_storage.write_json_list(self.storage_path, data)
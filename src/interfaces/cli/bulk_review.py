@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from domain.usecases.bulk_review import BulkReviewInput
+from infrastructure.container import get_container
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Aprovar (ou devolver) varios jobs revisados e gerar as entregas")
+    parser.add_argument("job_ids", nargs="*", help="IDs dos jobs")
+    parser.add_argument("--from-file", help="Arquivo com um ID de job por linha")
+    parser.add_argument("--reviewer", required=True, help="Nome do revisor")
+    parser.add_argument("--adjust", action="store_true", help="Marca como precisando de ajustes em vez de aprovar")
+    parser.add_argument("--notes", default=None, help="Observacoes registradas em todos os jobs")
+    parser.add_argument("--no-deliver", action="store_true", help="So registra a decisao, sem gerar pacotes")
+    parser.add_argument("--workers", type=int, default=None, help="Processos para gerar pacotes")
+    args = parser.parse_args()
+
+    job_ids = list(args.job_ids)
+    if args.from_file:
+        lines = Path(args.from_file).read_text(encoding="utf-8").splitlines()
+        job_ids.extend(line.strip() for line in lines if line.strip())
+    if not job_ids:
+        raise SystemExit("Informe ao menos um job (argumentos ou --from-file).")
+
+    use_case = get_container().bulk_review_use_case
+    if args.workers is not None:
+        use_case.package_workers = max(1, args.workers)
+    summary = use_case.execute(
+        BulkReviewInput(
+            job_ids=job_ids,
+            reviewer=args.reviewer,
+            approved=not args.adjust,
+            notes=args.notes,
+            deliver=not args.no_deliver,
+        )
+    )
+    for outcome in summary.outcomes:
+        print(json.dumps(outcome.to_dict(), ensure_ascii=False))
+    print(f"{len(summary.outcomes) - len(summary.failed)} de {len(summary.outcomes)} jobs processados sem erro")
+    if summary.failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import List
+
+from application.services.accuracy_rescore import AccuracyBatchRescorer
+from domain.entities.job import Job
+from domain.ports.repositories import JobRepository
+from infrastructure.container import get_container
+
+DEFAULT_REPORT_PATH = Path("docs/accuracy_rescore_summary.md")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reavaliar a acuracia de jobs existentes em lote")
+    parser.add_argument("--job-id", action="append", dest="job_ids", help="ID do job (pode repetir)")
+    parser.add_argument("--limit", type=int, default=100_000, help="Quantidade maxima de jobs recentes (sem --job-id)")
+    parser.add_argument("--threshold", type=float, default=None, help="Limiar de acuracia (padrao: ACCURACY_THRESHOLD)")
+    parser.add_argument("--workers", type=int, default=None, help="Processos de pontuacao (1 = sem pool)")
+    parser.add_argument("--dry-run", action="store_true", help="Calcula sem gravar metadados")
+    parser.add_argument("--report", default=str(DEFAULT_REPORT_PATH), help="Arquivo Markdown do resumo")
+    args = parser.parse_args()
+
+    container = get_container()
+    if args.job_ids:
+        job_ids = list(dict.fromkeys(args.job_ids))
+        jobs = _find_jobs(container.job_repository, job_ids)
+        missing = set(job_ids) - {job.id for job in jobs}
+        if missing:
+            raise SystemExit(f"Jobs nao encontrados: {', '.join(sorted(missing))}")
+    else:
+        jobs = container.job_repository.list_recent(args.limit)
+
+    rescorer = AccuracyBatchRescorer(
+        container.job_repository,
+        container.accuracy_guard,
+        max_workers=args.workers,
+        transcription_store=getattr(container, "transcription_store", None),
+    )
+    summary = rescorer.run(jobs, threshold=args.threshold, dry_run=args.dry_run)
+
+    report = summary.to_markdown()
+    report_path = Path(args.report)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(report, encoding="utf-8")
+    print(report)
+    print(f"Resumo salvo em {report_path}")
+
+
+def _find_jobs(job_repository: JobRepository, job_ids: List[str]) -> List[Job]:
+    find_many = getattr(job_repository, "find_many", None)
+    if find_many:
+        return list(find_many(job_ids))
+    jobs = (job_repository.find_by_id(job_id) for job_id in job_ids)
+    return [job for job in jobs if job]
+
+
+if __name__ == "__main__":
+    main()
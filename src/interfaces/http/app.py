@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import csv
 import hashlib
 import hmac
@@ -20,15 +21,20 @@ from typing import Any, Deque, Dict, List, Optional, TypedDict
 import requests
 
 from fastapi import Depends, FastAPI, Form, HTTPException, Request, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse, Response
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from application.controllers.job_controller import JobController
 from application.controllers.review_controller import ReviewController
+from application.services.health_monitor import HealthMonitor
 from application.services.job_log_service import JobLogService
+from application.services.live_feed import LiveFeed, incident_payload
 from application.services.delivery_template_service import DeliveryTemplateRegistry
+from application.services.template_bulk_render import BulkTemplateRenderer, TemplateRenderRequest
+from domain.usecases.bulk_review import BulkReviewDelivery, BulkReviewInput
 from config import get_settings, get_runtime_store, reload_settings, get_feature_flags, profile_loader
 import yaml
 from domain.entities.job import Job
@@ -36,9 +42,16 @@ from domain.entities.log_entry import LogEntry
 from domain.entities.value_objects import ArtifactType, EngineType, JobStatus, LogLevel
 from infrastructure.container import get_container
 from infrastructure.telemetry.metrics_logger import record_metric, notify_alert, load_entries, summarize_metrics
+
+try:  # Optional accelerator for upload digests
+    from blake3 import blake3 as _blake3  # type: ignore
+except ImportError:  # pragma: no cover - blake3 is not a hard dependency
+    _blake3 = None
 from . import auth_routes, webhook_routes
 from .dependencies import require_active_session
 from .schemas import (
+    BulkReviewRequest,
+    BulkTemplateRenderRequest,
     DashboardSummaryResponse,
     DashboardIncidentsResponse,
     JobsFeedResponse,
@@ -106,6 +119,7 @@ _download_tracker: Dict[str, Deque[float]] = {}
 _API_RATE_WINDOW_SEC = 60
 _API_RATE_LIMIT = 60
 _api_rate_tracker: Dict[str, Deque[float]] = {}
+_health_monitor: Optional[HealthMonitor] = None
 UPLOAD_TOKEN_TTL_MINUTES = 10
 
 # Fail-fast: em produção não aceitamos CORS wildcard
@@ -138,7 +152,9 @@ async def add_request_context(request: Request, call_next):
 
 def _reload_template_registry() -> None:
     global _template_registry
-    _template_registry = DeliveryTemplateRegistry(_templates_dir)
+    if _template_registry.base_dir != _templates_dir:
+        _template_registry = DeliveryTemplateRegistry(_templates_dir)
+    _template_registry.refresh(force=True)
 
 
 def _get_template_registry() -> DeliveryTemplateRegistry:
@@ -201,7 +217,8 @@ def _validate_upload_mime(content_type: Optional[str]) -> None:
         raise HTTPException(status_code=400, detail="Tipo de arquivo nao permitido.")
 
 
-async def _persist_upload_file(file: UploadFile, profile: str, max_bytes: int) -> tuple[Path, int]:
+async def _persist_upload_file(file: UploadFile, profile: str, max_bytes: int) -> tuple[Path, int, str]:
+    """Streams the upload to the inbox, hashing each chunk as it is written; returns path, size and digest."""
     sanitized_name = _sanitize_upload_filename(file.filename or "")
     _validate_upload_mime(file.content_type)
     suffix = Path(sanitized_name).suffix.lower()
@@ -211,6 +228,7 @@ async def _persist_upload_file(file: UploadFile, profile: str, max_bytes: int) -
     if target.exists():
         target = target_dir / f"{Path(sanitized_name).stem}_{int(time.time())}{suffix}"
     total_read = 0
+    hasher = _blake3() if _blake3 is not None else hashlib.sha256()
     chunk_size = max(1024 * 1024, min(4 * 1024 * 1024, max_bytes // 4 or max_bytes))
     try:
         with target.open("wb") as dest:
@@ -224,9 +242,26 @@ async def _persist_upload_file(file: UploadFile, profile: str, max_bytes: int) -
                     target.unlink(missing_ok=True)
                     raise HTTPException(status_code=400, detail="Arquivo excede limite configurado.")
                 dest.write(chunk)
+                hasher.update(chunk)
     finally:
         await file.close()
-    return target, total_read
+    algorithm = "blake3" if _blake3 is not None else "sha256"
+    return target, total_read, f"{algorithm}:{hasher.hexdigest()}"
+
+
+def _ingest_upload(
+    job_controller: JobController, target: Path, profile: str, engine: EngineType, digest: str
+) -> tuple[Job, bool]:
+    """Creates the job for a persisted upload; a repeated upload reuses the existing job and drops its copy."""
+    ingest_upload = getattr(job_controller, "ingest_upload", None)
+    if ingest_upload is None:
+        return job_controller.ingest_file(target, profile, engine), False
+    job, deduplicated = ingest_upload(target, profile, engine, digest)
+    if deduplicated:
+        target.unlink(missing_ok=True)
+        logger.info("Upload repetido reaproveitou job existente", extra={"job_id": job.id})
+        record_metric("upload.deduplicated", {"job_id": job.id, "profile": profile, "engine": engine.value})
+    return job, deduplicated
 
 
 def _sign_download(path: str, ttl_minutes: int = ARTIFACT_TOKEN_TTL_MINUTES) -> tuple[str, str]:
@@ -256,6 +291,7 @@ _FLASH_MESSAGES: Dict[str, FlashPayload] = {
     "process-started": {"text": "Processamento assincrono iniciado para este job.", "variant": "info"},
     "process-error": {"text": "Falha ao iniciar o processamento. Verifique os logs.", "variant": "error"},
     "upload-success": {"text": "Upload recebido e job criado.", "variant": "success"},
+    "upload-duplicate": {"text": "Arquivo identico ja enviado; exibindo o job existente.", "variant": "info"},
     "flags-updated": {"text": "Feature flags atualizadas.", "variant": "success"},
     "api-settings-saved": {"text": "Credenciais atualizadas com sucesso.", "variant": "success"},
     "template-updated": {"text": "Formato de entrega atualizado.", "variant": "success"},
@@ -299,6 +335,7 @@ def get_job_controller_dep() -> JobController:
         create_job_use_case=container.create_job_use_case,
         pipeline_use_case=container.pipeline_use_case,
         retry_use_case=container.retry_use_case,
+        upload_index=getattr(container, "upload_index", None),
     )
 
 
@@ -312,11 +349,36 @@ def get_review_controller_dep() -> ReviewController:
     )
 
 
+def get_bulk_review_use_case() -> BulkReviewDelivery:
+    return get_container().bulk_review_use_case
+
+
+def get_live_feed() -> LiveFeed:
+    live_feed = getattr(get_container(), "live_feed", None)
+    if live_feed is None:
+        raise HTTPException(status_code=503, detail="Atualizacao em tempo real indisponivel.")
+    return live_feed
+
+
 def get_job_log_service() -> JobLogService:
     container = get_container()
     return JobLogService(container.log_repository)
 
 
+def get_bulk_template_renderer() -> BulkTemplateRenderer:
+    container = get_container()
+    builder = container.artifact_builder
+    if not hasattr(builder, "render_txt"):
+        raise HTTPException(status_code=503, detail="Renderizacao em lote indisponivel.")
+    return BulkTemplateRenderer(
+        job_repository=container.job_repository,
+        profile_provider=container.profile_provider,
+        artifact_builder=builder,
+        transcription_store=getattr(container, "transcription_store", None),
+        max_workers=getattr(_app_settings, "template_bulk_render_workers", 4),
+    )
+
+
 def _feature_flags_snapshot() -> Dict[str, bool]:
     provider = get_feature_flags()
     return provider.snapshot()
@@ -381,7 +443,7 @@ async def list_jobs(
         "csrf_token": (session or {}).get("csrf_token", ""),
         "accuracy_summary": accuracy_summary,
         "max_audio_size_mb": getattr(_app_settings, "max_audio_size_mb", 0),
-        "health_status": _health_snapshot(),
+        "health_status": await _health_snapshot(),
         "branding_logo_url": _branding_logo_url(),
         "template_preview": template_preview,
         "template_preview_default": template_default_id,
@@ -394,56 +456,39 @@ async def list_jobs(
 async def healthcheck() -> JSONResponse:
     """
     Health endpoint com sinais básicos e probes externos opcionais.
+
+    Os probes rodam em segundo plano (``HealthMonitor``); a resposta traz o último
+    resultado e sua idade em ``age_sec``.
     """
     settings = get_settings()
-    assets_ok = Path("src/interfaces/web/static").exists() and Path("src/interfaces/web/templates").exists()
-    external = {}
-    # Probes leves: evitam levantar exceção; apenas anotam estado
-    try:
-        external["asr_ready"] = bool(settings.openai_api_key)
-    except Exception:
-        external["asr_ready"] = False
-    try:
-        external["chat_ready"] = bool(settings.chatgpt_api_key or settings.openai_api_key)
-    except Exception:
-        external["chat_ready"] = False
-    try:
-        # Storage dir writeable
-        probe_path = Path(settings.base_output_dir) / ".health_probe"
-        probe_path.parent.mkdir(parents=True, exist_ok=True)
-        probe_path.write_text("ok", encoding="utf-8")
-        probe_path.unlink(missing_ok=True)
-        external["storage_ready"] = True
-    except Exception:
-        external["storage_ready"] = False
-
+    health = await _health_snapshot()
     payload = {
-        "status": "ok",
+        "status": health.get("status", "unknown"),
         "env": settings.app_env,
         "chunking_mb": settings.openai_chunk_trigger_mb,
         "max_audio_mb": settings.max_audio_size_mb,
         "downloads_signature": _feature_flags_snapshot().get("downloads.signature_required", True),
-        "static_assets": assets_ok,
-        "external": external,
+        "static_assets": health.get("static_assets", False),
+        "external": health.get("external", {}),
+        "checked_at": health.get("checked_at"),
+        "age_sec": health.get("age_sec"),
     }
-    degraded = False
-    probe_openai = os.getenv("HEALTH_PROBE_OPENAI") == "1"
-    if probe_openai:
-        external["openai_probe"] = _probe_http(settings.openai_base_url or "", timeout_sec=2)
-        degraded = degraded or not external["openai_probe"]
-    degraded = degraded or not all(external.values())
-    payload["status"] = "degraded" if degraded else "ok"
+    degraded = payload["status"] != "ok"
     return JSONResponse(payload, status_code=200 if not degraded else 206)
 
 
 @app.get("/api/dashboard/summary", response_class=JSONResponse, response_model=DashboardSummaryResponse)
 async def api_dashboard_summary(
+    request: Request,
     job_controller: JobController = Depends(get_job_controller_dep),
     limit: int = 100,
     _: dict | None = Depends(require_active_session),
-) -> JSONResponse:
+) -> Response:
     _enforce_api_rate("summary")
     limit = max(1, min(limit, 200))
+    etag = _dashboard_etag("summary", getattr(job_controller, "job_repository", None), limit)
+    if _matches_etag(request, etag):
+        return _not_modified(etag)
     jobs, _ = job_controller.list_jobs(limit, page=1)
     summary = _compute_summary(jobs)
     accuracy_summary = _compute_accuracy_summary(jobs)
@@ -456,38 +501,64 @@ async def api_dashboard_summary(
         "dashboard.summary.requested",
         {"total": summary["total"], "awaiting_review": summary["awaiting_review"], "limit": limit},
     )
-    return JSONResponse(payload)
+    return _json_with_etag(payload, etag)
 
 
 @app.get("/api/dashboard/incidents", response_class=JSONResponse, response_model=DashboardIncidentsResponse)
 async def api_dashboard_incidents(
+    request: Request,
     limit: int = 5,
     _: dict | None = Depends(require_active_session),
-) -> JSONResponse:
+) -> Response:
     _enforce_api_rate("incidents")
+    etag = _dashboard_etag("incidents", _incidents_log_repository(), limit)
+    if _matches_etag(request, etag):
+        return _not_modified(etag)
     incidents = _get_recent_incidents(limit=limit)
     payload = {
         "items": incidents,
         "generated_at": datetime.now(timezone.utc).isoformat(),
     }
     record_metric("dashboard.incidents.requested", {"count": len(incidents), "limit": limit})
-    return JSONResponse(payload)
+    return _json_with_etag(payload, etag)
+
+
+@app.get("/api/dashboard/stream")
+async def api_dashboard_stream(
+    request: Request,
+    last_event_id: Optional[str] = None,
+    live_feed: LiveFeed = Depends(get_live_feed),
+    _: dict | None = Depends(require_active_session),
+) -> StreamingResponse:
+    # EventSource resends the header on reconnect; the query parameter covers a fresh page load.
+    resume_from = request.headers.get("last-event-id") or last_event_id
+    heartbeat = max(1, getattr(_app_settings, "dashboard_stream_heartbeat_sec", 15))
+    record_metric("dashboard.stream.opened", {"resumed": bool(resume_from)})
+    return StreamingResponse(
+        _live_event_stream(live_feed, request, resume_from, heartbeat),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.get("/api/dashboard/jobs", response_class=JSONResponse, response_model=JobsFeedResponse)
 async def api_dashboard_jobs(
+    request: Request,
     status: Optional[str] = None,
     profile: Optional[str] = None,
     accuracy: Optional[str] = None,
     page: int = 1,
     limit: int = 20,
     _: dict | None = Depends(require_active_session),
-) -> JSONResponse:
+) -> Response:
     _enforce_api_rate("jobs")
     limit = max(1, min(limit, 200))
     page = max(page, 1)
     window = limit * page + limit
     container = get_container()
+    etag = _dashboard_etag("jobs", container.job_repository, status, profile, accuracy, page, limit)
+    if _matches_etag(request, etag):
+        return _not_modified(etag)
     jobs = container.job_repository.list_recent(window)
     filtered = _apply_filters(jobs, status=status, profile=profile, accuracy=accuracy)
     start = (page - 1) * limit
@@ -503,7 +574,7 @@ async def api_dashboard_jobs(
         "generated_at": datetime.now(timezone.utc).isoformat(),
     }
     record_metric("dashboard.jobs.requested", {"limit": limit, "page": page, "status": status or "", "profile": profile or ""})
-    return JSONResponse(payload)
+    return _json_with_etag(payload, etag)
 
 
 @app.get("/settings/api", response_class=HTMLResponse)
@@ -775,6 +846,44 @@ async def api_templates_preview(
     return JSONResponse({"rendered": rendered})
 
 
+@app.post("/api/templates/render-bulk")
+async def api_templates_render_bulk(
+    payload: BulkTemplateRenderRequest,
+    renderer: BulkTemplateRenderer = Depends(get_bulk_template_renderer),
+    _: dict | None = Depends(require_active_session),
+) -> StreamingResponse:
+    if not payload.items:
+        raise HTTPException(status_code=400, detail="Informe ao menos um job para renderizar.")
+    limit = getattr(_app_settings, "template_bulk_render_max_items", 1000)
+    if len(payload.items) > limit:
+        raise HTTPException(status_code=400, detail=f"Limite de {limit} itens por requisicao excedido.")
+    render_requests = [
+        TemplateRenderRequest(
+            job_id=item.job_id,
+            template_id=item.template_id or None,
+            locale=_normalize_locale_code(item.locale or "") or None,
+        )
+        for item in payload.items
+    ]
+
+    def stream_lines():
+        started = time.perf_counter()
+        errors = 0
+        for result in renderer.render_many(render_requests):
+            errors += 1 if "error" in result else 0
+            yield json.dumps(result, ensure_ascii=False) + "\n"
+        record_metric(
+            "templates.bulk_render",
+            {
+                "items": len(render_requests),
+                "errors": errors,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+            },
+        )
+
+    return StreamingResponse(stream_lines(), media_type="application/x-ndjson")
+
+
 @app.delete("/settings/templates/{template_id}")
 async def delete_template_definition(
     template_id: str,
@@ -830,7 +939,7 @@ async def upload_job(
 ) -> Response:
     settings = get_settings()
     max_bytes = settings.max_audio_size_mb * 1024 * 1024
-    target, total_read = await _persist_upload_file(file, profile, max_bytes)
+    target, total_read, digest = await _persist_upload_file(file, profile, max_bytes)
 
     if total_read == 0:
         target.unlink(missing_ok=True)
@@ -839,7 +948,9 @@ async def upload_job(
         engine_value = EngineType(engine)
     except Exception:
         engine_value = EngineType.OPENAI
-    job = job_controller.ingest_file(target, profile, engine_value)
+    job, deduplicated = _ingest_upload(job_controller, target, profile, engine_value, digest)
+    if deduplicated:
+        return RedirectResponse(url=f"/jobs/{job.id}?flash=upload-duplicate", status_code=303)
     flash_token = "upload-success"
     if auto_process:
         try:
@@ -884,7 +995,7 @@ async def api_upload_job(
     _validate_upload_token(token, expires, profile or "geral", engine or EngineType.OPENAI.value)
     settings = get_settings()
     max_bytes = settings.max_audio_size_mb * 1024 * 1024
-    target, total_read = await _persist_upload_file(file, profile, max_bytes)
+    target, total_read, digest = await _persist_upload_file(file, profile, max_bytes)
     if total_read == 0:
         target.unlink(missing_ok=True)
         raise HTTPException(status_code=400, detail="Arquivo vazio.")
@@ -892,9 +1003,9 @@ async def api_upload_job(
         engine_value = EngineType(engine)
     except ValueError:
         engine_value = EngineType.OPENAI
-    job = job_controller.ingest_file(target, profile or "geral", engine_value)
+    job, deduplicated = _ingest_upload(job_controller, target, profile or "geral", engine_value, digest)
     auto_processed = False
-    if auto_process:
+    if auto_process and not deduplicated:
         try:
             job_controller.process_job(job.id)
             auto_processed = True
@@ -907,6 +1018,7 @@ async def api_upload_job(
             "status": job.status.value,
             "profile_id": job.profile_id,
             "auto_processed": auto_processed,
+            "deduplicated": deduplicated,
         }
     )
 
@@ -1173,6 +1285,51 @@ async def review_job(
     return RedirectResponse(url=f"/jobs/{job_id}?flash={flash}", status_code=303)
 
 
+@app.post("/api/jobs/review-bulk", response_class=JSONResponse)
+async def review_jobs_bulk(
+    payload: BulkReviewRequest,
+    use_case: BulkReviewDelivery = Depends(get_bulk_review_use_case),
+    _: dict | None = Depends(require_active_session),
+) -> JSONResponse:
+    job_ids = [job_id.strip() for job_id in payload.job_ids if job_id.strip()]
+    if not job_ids:
+        raise HTTPException(status_code=400, detail="Informe ao menos um job para revisar.")
+    limit = getattr(_app_settings, "bulk_review_max_jobs", 500)
+    if len(job_ids) > limit:
+        raise HTTPException(status_code=400, detail=f"Limite de {limit} jobs por requisicao excedido.")
+    if payload.decision not in ("approve", "adjust"):
+        raise HTTPException(status_code=400, detail="Decisao invalida.")
+    started = time.perf_counter()
+    # Packaging, sheet writes and external submission can take minutes for a large batch.
+    summary = await run_in_threadpool(
+        use_case.execute,
+        BulkReviewInput(
+            job_ids=job_ids,
+            reviewer=payload.reviewer,
+            approved=payload.decision == "approve",
+            notes=payload.notes or None,
+            deliver=payload.deliver,
+        ),
+    )
+    record_metric(
+        "review.bulk",
+        {
+            "jobs": len(summary.outcomes),
+            "failed": len(summary.failed),
+            "approved": payload.decision == "approve",
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+        },
+    )
+    logger.info("Revisao em lote registrada", extra={"jobs": len(summary.outcomes), "failed": len(summary.failed)})
+    return JSONResponse(
+        {
+            "total": len(summary.outcomes),
+            "failed": len(summary.failed),
+            "items": [outcome.to_dict() for outcome in summary.outcomes],
+        }
+    )
+
+
 @app.get("/artifacts", response_model=None)
 async def download_artifact(
     request: Request,
@@ -1458,13 +1615,17 @@ def _compute_accuracy_summary(jobs: List[Job]) -> Dict[str, Any]:
     }
 
 
-def _get_recent_incidents(limit: int = 5) -> List[Dict[str, Any]]:
+def _incidents_log_repository() -> Any:
     try:
         container = get_container()
     except Exception:
         logger.warning("Falha ao instanciar container para incidentes.", exc_info=True)
-        return []
-    log_repo = getattr(container, 'log_repository', None)
+        return None
+    return getattr(container, 'log_repository', None)
+
+
+def _get_recent_incidents(limit: int = 5) -> List[Dict[str, Any]]:
+    log_repo = _incidents_log_repository()
     if not log_repo or not hasattr(log_repo, 'list_recent'):
         return []
     try:
@@ -1472,48 +1633,134 @@ def _get_recent_incidents(limit: int = 5) -> List[Dict[str, Any]]:
     except Exception:
         logger.warning("Falha ao recuperar incidentes recentes.", exc_info=True)
         return []
-    incidents: List[Dict[str, Any]] = []
-    for entry in entries:
-        incidents.append(
-            {
-                'job_id': entry.job_id,
-                'event': entry.event,
-                'level': entry.level.value,
-                'message': entry.message or '',
-                'timestamp': entry.timestamp.isoformat(),
-                'timestamp_human': entry.timestamp.strftime('%d/%m %H:%M'),
-                'icon': _LEVEL_ICON_MAP.get(entry.level.value, ''),
-            }
+    return [_incident_with_icon(incident_payload(entry)) for entry in entries]
+
+
+_DASHBOARD_CACHE_CONTROL = "private, no-cache"
+
+
+def _dashboard_etag(view: str, repository: Any, *params: Any) -> Optional[str]:
+    """Weak ETag for a dashboard view: the store revision plus the query that shaped the payload."""
+    revision = getattr(repository, "revision", None)
+    if revision is None:
+        return None
+    try:
+        token = revision()
+    except Exception:
+        logger.debug("Revisao indisponivel para %s.", view, exc_info=True)
+        return None
+    digest = hashlib.sha256(json.dumps([view, token, *params], default=str).encode("utf-8")).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def _matches_etag(request: Request, etag: Optional[str]) -> bool:
+    if not etag:
+        return False
+    header = request.headers.get("if-none-match", "")
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored on both sides.
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _DASHBOARD_CACHE_CONTROL})
+
+
+def _json_with_etag(payload: Dict[str, Any], etag: Optional[str]) -> JSONResponse:
+    response = JSONResponse(payload)
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = _DASHBOARD_CACHE_CONTROL
+    return response
+
+
+def _incident_with_icon(incident: Dict[str, Any]) -> Dict[str, Any]:
+    return {**incident, "icon": _LEVEL_ICON_MAP.get(incident.get("level", ""), "")}
+
+
+_STREAM_RETRY_MS = 3000
+
+
+def _format_sse(event: str, data: Dict[str, Any], event_id: Optional[str] = None) -> str:
+    lines = [f"id: {event_id}"] if event_id else []
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def _live_event_stream(live_feed: LiveFeed, request: Request, resume_from: Optional[str], heartbeat_sec: float):
+    """Yields feed events as SSE frames, replaying from ``resume_from`` and sending keepalives while idle."""
+    loop = asyncio.get_running_loop()
+    wakeup = asyncio.Event()
+    remove_listener = live_feed.add_listener(lambda: loop.call_soon_threadsafe(wakeup.set))
+    cursor = resume_from or live_feed.last_event_id
+    try:
+        yield f"retry: {_STREAM_RETRY_MS}\n\n"
+        while True:
+            wakeup.clear()
+            events, resync = live_feed.since(cursor)
+            if resync:
+                cursor = live_feed.last_event_id
+                yield _format_sse("resync", {"last_event_id": cursor}, cursor)
+            for event in events:
+                cursor = event.id
+                data = _incident_with_icon(event.data) if event.kind == "incident" else event.data
+                yield _format_sse(event.kind, data, event.id)
+            if await request.is_disconnected():
+                return
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=heartbeat_sec)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+    finally:
+        remove_listener()
+
+
+def _get_health_monitor() -> HealthMonitor:
+    global _health_monitor
+    if _health_monitor is None:
+        _health_monitor = HealthMonitor(
+            _run_health_probes, interval_sec=getattr(_app_settings, "health_refresh_interval_sec", 15)
         )
-    return incidents
+        _health_monitor.start()
+    return _health_monitor
 
 
-def _health_snapshot() -> Dict[str, Any]:
+async def _health_snapshot() -> Dict[str, Any]:
+    monitor = _get_health_monitor()
+    # Settings reloads and HEALTH_PROBE_OPENAI change what is probed, so they invalidate the cache.
+    key = (get_settings(), os.getenv("HEALTH_PROBE_OPENAI"))
+    if monitor.needs_refresh(key):
+        await run_in_threadpool(monitor.refresh, key)
+    return monitor.snapshot()
+
+
+def _run_health_probes() -> Dict[str, Any]:
+    settings = get_settings()
+    assets_ok = Path("src/interfaces/web/static").exists() and Path("src/interfaces/web/templates").exists()
+    external: Dict[str, bool] = {}
+    # Probes leves: evitam levantar exceção; apenas anotam estado
+    external["asr_ready"] = bool(getattr(settings, "openai_api_key", ""))
+    external["chat_ready"] = bool(getattr(settings, "chatgpt_api_key", "") or getattr(settings, "openai_api_key", ""))
     try:
-        # Reusa lógica interna sem depender do endpoint async
-        settings = get_settings()
-        assets_ok = Path("src/interfaces/web/static").exists() and Path("src/interfaces/web/templates").exists()
-        external: Dict[str, object] = {}
-        external["asr_ready"] = bool(settings.openai_api_key)
-        external["chat_ready"] = bool(settings.chatgpt_api_key or settings.openai_api_key)
-        try:
-            probe_path = Path(settings.base_output_dir) / ".health_probe"
-            probe_path.parent.mkdir(parents=True, exist_ok=True)
-            probe_path.write_text("ok", encoding="utf-8")
-            probe_path.unlink(missing_ok=True)
-            external["storage_ready"] = True
-        except Exception:
-            external["storage_ready"] = False
-        if os.getenv("HEALTH_PROBE_OPENAI") == "1":
-            external["openai_probe"] = _probe_http(settings.openai_base_url or "", timeout_sec=2)
-        degraded = not all(val for val in external.values() if isinstance(val, bool))
-        return {
-            "status": "degraded" if degraded else "ok",
-            "external": external,
-            "static_assets": assets_ok,
-        }
+        # Storage dir writeable
+        probe_path = Path(settings.base_output_dir) / ".health_probe"
+        probe_path.parent.mkdir(parents=True, exist_ok=True)
+        probe_path.write_text("ok", encoding="utf-8")
+        probe_path.unlink(missing_ok=True)
+        external["storage_ready"] = True
     except Exception:
-        return {"status": "unknown"}
+        external["storage_ready"] = False
+    if os.getenv("HEALTH_PROBE_OPENAI") == "1":
+        external["openai_probe"] = _probe_http(getattr(settings, "openai_base_url", "") or "", timeout_sec=2)
+    degraded = not all(external.values())
+    return {
+        "status": "degraded" if degraded else "ok",
+        "external": external,
+        "static_assets": assets_ok,
+    }
 
 
 def _compose_accuracy_snapshot(job: Job) -> Dict[str, Any]:
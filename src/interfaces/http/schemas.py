@@ -100,6 +100,7 @@ class UploadJobResponse(BaseModel):
     status: str
     profile_id: str
     auto_processed: bool
+    deduplicated: bool = False
 
 
 class TemplateRawResponse(BaseModel):
@@ -114,6 +115,24 @@ class TemplatePreviewResponse(BaseModel):
     rendered: str
 
 
+class TemplateRenderItem(BaseModel):
+    job_id: str
+    template_id: Optional[str] = None
+    locale: Optional[str] = None
+
+
+class BulkTemplateRenderRequest(BaseModel):
+    items: List[TemplateRenderItem]
+
+
+class BulkReviewRequest(BaseModel):
+    job_ids: List[str]
+    reviewer: str
+    decision: str = "approve"
+    notes: Optional[str] = None
+    deliver: bool = True
+
+
 class UpdateTemplateResponse(BaseModel):
     status: str
     template: Dict[str, str]
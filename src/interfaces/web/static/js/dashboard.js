@@ -1,5 +1,78 @@
 import { setSurfaceLoading } from "./core.js";
 
+const liveStreams = new Map();
+
+// One EventSource per endpoint, shared by every panel on the page. Returns null when
+// the browser has no EventSource so callers keep polling.
+function openLiveStream(endpoint) {
+  if (!endpoint || typeof window.EventSource === "undefined") {
+    return null;
+  }
+  if (!liveStreams.has(endpoint)) {
+    const source = new window.EventSource(endpoint);
+    liveStreams.set(endpoint, source);
+    window.addEventListener("beforeunload", () => source.close());
+  }
+  return liveStreams.get(endpoint);
+}
+
+function parseStreamData(event) {
+  try {
+    return JSON.parse(event.data);
+  } catch (_error) {
+    return null;
+  }
+}
+
+// Polls with ``refresh`` until the stream is open, then refreshes only when ``eventName``
+// arrives (debounced) or the server asks for a resync; polling resumes if the stream closes.
+function scheduleRefresh(refresh, intervalMs, stream, eventName, onEvent) {
+  let timerId = null;
+  let debounceId = null;
+  const startPolling = () => {
+    if (timerId === null) {
+      timerId = window.setInterval(() => {
+        if (!document.hidden) {
+          refresh();
+        }
+      }, intervalMs);
+    }
+  };
+  const stopPolling = () => {
+    if (timerId !== null) {
+      window.clearInterval(timerId);
+      timerId = null;
+    }
+  };
+  startPolling();
+  window.addEventListener("beforeunload", () => {
+    stopPolling();
+    window.clearTimeout(debounceId);
+  });
+  if (!stream) {
+    return;
+  }
+  const refreshSoon = () => {
+    window.clearTimeout(debounceId);
+    debounceId = window.setTimeout(refresh, 1000);
+  };
+  stream.addEventListener("open", stopPolling);
+  stream.addEventListener("error", () => {
+    if (stream.readyState === window.EventSource.CLOSED) {
+      startPolling();
+    }
+  });
+  stream.addEventListener("resync", refreshSoon);
+  stream.addEventListener(eventName, (event) => {
+    const data = parseStreamData(event);
+    if (data && onEvent) {
+      onEvent(data);
+      return;
+    }
+    refreshSoon();
+  });
+}
+
 function bindLiveSummary() {
   const container = document.querySelector("[data-live-summary-endpoint]");
   /* istanbul ignore next */
@@ -98,13 +171,7 @@ function bindLiveSummary() {
   };
 
   refresh();
-  const timerId = window.setInterval(() => {
-    if (!document.hidden) {
-      refresh();
-    }
-  }, intervalMs);
-
-  window.addEventListener("beforeunload", () => window.clearInterval(timerId));
+  scheduleRefresh(refresh, intervalMs, openLiveStream(container.dataset.liveStreamEndpoint), "job");
 }
 
 function bindLiveIncidents() {
@@ -123,6 +190,8 @@ function bindLiveIncidents() {
   const intervalMs = Math.max(Number(panel.dataset.refreshInterval || "45") * 1000, 10000);
   const emptyLabel = panel.dataset.emptyLabel || "Nenhum incidente registrado.";
   const surfaceId = panel.dataset.loadingSurface || panel.dataset.surface || "";
+  const maxItems = Math.max(Number(panel.dataset.maxItems || "5"), 1);
+  let currentItems = [];
   let hasLoaded = false;
 
   const updateStatus = (text, state = "") => {
@@ -194,7 +263,8 @@ function bindLiveIncidents() {
         throw new Error("incidents-fetch-failed");
       }
       const payload = await response.json();
-      renderItems(payload.items || []);
+      currentItems = payload.items || [];
+      renderItems(currentItems);
       if (payload.generated_at) {
         const updatedAt = new Date(payload.generated_at);
         const formatted = updatedAt.toLocaleTimeString("pt-BR", { hour12: false });
@@ -212,13 +282,14 @@ function bindLiveIncidents() {
     }
   };
 
+  const prependItem = (item) => {
+    currentItems = [item, ...currentItems].slice(0, maxItems);
+    renderItems(currentItems);
+    updateStatus("Monitoramento em tempo real ativo", "success");
+  };
+
   refresh();
-  const timerId = window.setInterval(() => {
-    if (!document.hidden) {
-      refresh();
-    }
-  }, intervalMs);
-  window.addEventListener("beforeunload", () => window.clearInterval(timerId));
+  scheduleRefresh(refresh, intervalMs, openLiveStream(panel.dataset.liveStreamEndpoint), "incident", prependItem);
 }
 
 export function initDashboard() {
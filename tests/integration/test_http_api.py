@@ -23,6 +23,8 @@ from domain.usecases.pipeline import ProcessJobPipeline
 import interfaces.http.app as http_app
 from interfaces.http.app import (
     app,
+    get_bulk_review_use_case,
+    get_bulk_template_renderer,
     get_job_controller_dep,
     get_job_log_service,
     get_review_controller_dep,
@@ -489,6 +491,41 @@ def test_dashboard_incidents_api_returns_latest_entries(tmp_path, monkeypatch):
     app.dependency_overrides.clear()
 
 
+def test_dashboard_jobs_api_answers_not_modified_until_the_store_changes(tmp_path, monkeypatch):
+    from infrastructure.database.job_repository import FileJobRepository
+
+    repository = FileJobRepository(tmp_path / "jobs.json")
+    repository.create(
+        Job(id="job-etag", source_path=tmp_path / "a.wav", profile_id="geral", engine=EngineType.OPENAI)
+    )
+    listed = []
+    original_list_recent = repository.list_recent
+    monkeypatch.setattr(repository, "list_recent", lambda limit=50: listed.append(limit) or original_list_recent(limit))
+    monkeypatch.setattr(http_app, "get_container", lambda: SimpleNamespace(job_repository=repository))
+    _force_authentication()
+    _override_app_settings(monkeypatch)
+    client = TestClient(app)
+
+    first = client.get("/api/dashboard/jobs")
+    etag = first.headers["etag"]
+    assert first.status_code == 200 and first.headers["cache-control"] == "private, no-cache"
+
+    cached = client.get("/api/dashboard/jobs", headers={"If-None-Match": etag})
+    assert cached.status_code == 304 and cached.content == b"" and cached.headers["etag"] == etag
+    assert client.get("/api/dashboard/jobs?status=failed", headers={"If-None-Match": etag}).status_code == 200
+    assert len(listed) == 2
+
+    time.sleep(0.01)
+    job = repository.find_by_id("job-etag")
+    job.status = JobStatus.FAILED
+    repository.update(job)
+    changed = client.get("/api/dashboard/jobs", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert changed.json()["jobs"][0]["status"] == "failed"
+
+    app.dependency_overrides.clear()
+
+
 def test_api_job_logs_returns_filtered_entries(tmp_path, monkeypatch):
     job = Job(
         id="job-logs",
@@ -1064,6 +1101,81 @@ def test_template_settings_page_and_creation(tmp_path, monkeypatch):
         http_app._reload_template_registry()
 
 
+def test_templates_render_bulk_streams_ndjson(monkeypatch):
+    class RecordingRenderer:
+        def __init__(self) -> None:
+            self.requests = []
+
+        def render_many(self, requests):
+            self.requests = list(requests)
+            for request in self.requests:
+                yield {"job_id": request.job_id, "template_id": request.template_id, "rendered": f"{request.locale}"}
+
+    renderer = RecordingRenderer()
+    _force_authentication()
+    app.dependency_overrides[get_bulk_template_renderer] = lambda: renderer
+    try:
+        client = TestClient(app)
+        response = client.post(
+            "/api/templates/render-bulk",
+            json={"items": [{"job_id": "job-1", "template_id": "custom", "locale": "pt_BR"}, {"job_id": "job-2"}]},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines == [
+            {"job_id": "job-1", "template_id": "custom", "rendered": "pt-br"},
+            {"job_id": "job-2", "template_id": None, "rendered": "None"},
+        ]
+
+        empty = client.post("/api/templates/render-bulk", json={"items": []})
+        assert empty.status_code == 400
+        invalid_locale = client.post("/api/templates/render-bulk", json={"items": [{"job_id": "x", "locale": "??"}]})
+        assert invalid_locale.status_code == 400
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_review_bulk_applies_decision_and_reports_items(monkeypatch):
+    from domain.usecases.bulk_review import BulkReviewOutcome, BulkReviewSummary
+
+    class RecordingUseCase:
+        def __init__(self) -> None:
+            self.inputs = []
+
+        def execute(self, data):
+            self.inputs.append(data)
+            return BulkReviewSummary(
+                outcomes=[
+                    BulkReviewOutcome(job_id="job-1", status="approved", package_path=Path("backup/job-1.zip")),
+                    BulkReviewOutcome(job_id="job-2", error="Job job-2 nao encontrado"),
+                ]
+            )
+
+    use_case = RecordingUseCase()
+    _force_authentication()
+    app.dependency_overrides[get_bulk_review_use_case] = lambda: use_case
+    try:
+        client = TestClient(app)
+        response = client.post(
+            "/api/jobs/review-bulk",
+            json={"job_ids": ["job-1", " job-2 "], "reviewer": "ana", "notes": "ok"},
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 2 and body["failed"] == 1
+        assert body["items"][0] == {"job_id": "job-1", "status": "approved", "package_path": str(Path("backup/job-1.zip"))}
+        assert body["items"][1]["error"] == "Job job-2 nao encontrado"
+        assert use_case.inputs[0].job_ids == ["job-1", "job-2"]
+        assert use_case.inputs[0].approved is True
+
+        assert client.post("/api/jobs/review-bulk", json={"job_ids": [], "reviewer": "ana"}).status_code == 400
+        invalid = client.post("/api/jobs/review-bulk", json={"job_ids": ["job-1"], "reviewer": "ana", "decision": "x"})
+        assert invalid.status_code == 400
+    finally:
+        app.dependency_overrides.clear()
+
+
 def test_job_detail_renders_accuracy_and_templates(tmp_path, monkeypatch):
     job = Job(
         id="job-detail",
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import random
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from application.services.line_breaker import BALANCED, GREEDY, break_lines
+from application.services.subtitle_formatter import SubtitleFormatter
+from domain.entities.profile import Profile
+from domain.entities.transcription import Segment
+
+WORDS = ["ola", "mundo", "transcricao", "legenda", "perfil", "audio", "cliente", "entrega", "revisao", "tempo"]
+
+
+def _segments(count: int) -> list[Segment]:
+    rng = random.Random(3)
+    return [
+        Segment(
+            id=idx,
+            start=idx * 2.0,
+            end=idx * 2.0 + 1.8,
+            text=" ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 18))),
+        )
+        for idx in range(count)
+    ]
+
+
+def _profile() -> Profile:
+    return Profile(id="perf", meta={"subtitle": {"max_chars_per_line": 42, "max_lines": 2}}, prompt_body="")
+
+
+@pytest.mark.performance
+def test_single_pass_subtitles_faster_than_separate_renders(tmp_path: Path):
+    formatter = SubtitleFormatter()
+    segments = _segments(10_000)
+    profile = _profile()
+
+    def separate() -> None:
+        (tmp_path / "a.srt").write_text(formatter.to_srt(segments, profile), encoding="utf-8")
+        (tmp_path / "a.vtt").write_text(formatter.to_vtt(segments, profile), encoding="utf-8")
+
+    def single_pass() -> None:
+        with (tmp_path / "b.srt").open("w", encoding="utf-8") as srt, (tmp_path / "b.vtt").open(
+            "w", encoding="utf-8"
+        ) as vtt:
+            formatter.write_all(segments, profile, {"srt": srt, "vtt": vtt})
+
+    timings = {}
+    for name, func in (("separate", separate), ("single_pass", single_pass)):
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+
+    assert (tmp_path / "a.srt").read_bytes() == (tmp_path / "b.srt").read_bytes()
+    assert (tmp_path / "a.vtt").read_bytes() == (tmp_path / "b.vtt").read_bytes()
+    assert timings["single_pass"] <= timings["separate"], timings
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("strategy", [GREEDY, BALANCED])
+def test_line_breaker_faster_than_textwrap(strategy):
+    texts = [segment.text for segment in _segments(10_000)]
+
+    def legacy() -> None:
+        for text in texts:
+            textwrap.wrap(text, width=42)
+
+    def current() -> None:
+        for text in texts:
+            break_lines(text, 42, strategy)
+
+    timings = {}
+    for name, func in (("textwrap", legacy), (strategy, current)):
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+
+    assert [break_lines(text, 42) for text in texts[:200]] == [textwrap.wrap(text, width=42) for text in texts[:200]]
+    assert timings[strategy] <= timings["textwrap"], timings
@@ -102,3 +102,49 @@ class ImmediateThread:
 
     def start(self) -> None:
         self.target(*self.args, **self.kwargs)
+
+
+class MemoryS3Client:
+    """In-memory stand-in for a boto3 S3 client (MinIO-style), covering the calls used by S3StorageClient."""
+
+    def __init__(self, fail_on_part: Optional[int] = None) -> None:
+        self.objects: Dict[tuple, bytes] = {}
+        self.uploads: Dict[str, Dict[int, bytes]] = {}
+        self.part_calls: List[int] = []
+        self.fail_on_part = fail_on_part
+        self._next_id = 0
+
+    def upload_file(self, filename, bucket, key, Config=None) -> None:  # noqa: N803 - boto3 signature
+        self.objects[(bucket, key)] = Path(filename).read_bytes()
+
+    def create_multipart_upload(self, Bucket, Key):  # noqa: N803
+        self._next_id += 1
+        upload_id = f"upload-{self._next_id}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):  # noqa: N803
+        if PartNumber == self.fail_on_part:
+            raise ConnectionError(f"part {PartNumber} lost")
+        self.part_calls.append(PartNumber)
+        self.uploads[UploadId][PartNumber] = bytes(Body)
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    def list_parts(self, Bucket, Key, UploadId, PartNumberMarker=0):  # noqa: N803
+        if UploadId not in self.uploads:
+            raise KeyError("NoSuchUpload")
+        parts = [
+            {"PartNumber": number, "ETag": f'"etag-{number}"'}
+            for number in sorted(self.uploads[UploadId])
+            if number > PartNumberMarker
+        ]
+        return {"Parts": parts, "IsTruncated": False}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):  # noqa: N803
+        stored = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == sorted(stored), "parts missing on complete"
+        self.objects[(Bucket, Key)] = b"".join(stored[number] for number in numbers)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):  # noqa: N803
+        self.uploads.pop(UploadId, None)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from application.services.accuracy_rescore import AccuracyBatchRescorer, RescoreTask, score_task
+from application.services.accuracy_service import TranscriptionAccuracyGuard
+from domain.entities.job import Job
+from domain.entities.transcription import TranscriptionResult
+from domain.entities.value_objects import ArtifactType, JobStatus
+from tests.support import stubs
+
+
+class BulkJobRepository(stubs.MemoryJobRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.bulk_calls: List[List[str]] = []
+        self.single_updates = 0
+
+    def update(self, job: Job) -> Job:
+        self.single_updates += 1
+        return super().update(job)
+
+    def update_many(self, jobs) -> None:
+        jobs = list(jobs)
+        self.bulk_calls.append([job.id for job in jobs])
+        for job in jobs:
+            self.jobs[job.id] = job
+
+
+def _make_job(tmp_path: Path, job_id: str, text: str, metadata: Dict[str, str] | None = None) -> Job:
+    json_path = tmp_path / f"{job_id}.json"
+    json_path.write_text(
+        json.dumps(
+            {
+                "job_id": job_id,
+                "language": "pt",
+                "text": text,
+                "segments": [{"id": 0, "start": 0.0, "end": 1.0, "text": text, "speaker": None}],
+                "flags": [],
+            }
+        ),
+        encoding="utf-8",
+    )
+    return Job(
+        id=job_id,
+        source_path=tmp_path / f"{job_id}.wav",
+        profile_id="geral",
+        status=JobStatus.AWAITING_REVIEW,
+        output_paths={ArtifactType.STRUCTURED_JSON: json_path},
+        metadata=metadata
+        if metadata is not None
+        else {
+            "accuracy_wer_asr": "0.1000",
+            "accuracy_penalty": "0.0000",
+            "accuracy_status": "needs_review",
+            "accuracy_language": "pt",
+        },
+    )
+
+
+def test_rescore_applies_new_threshold_and_writes_in_bulk(tmp_path):
+    repo = BulkJobRepository()
+    jobs = [repo.create(_make_job(tmp_path, f"job-{idx}", "ola mundo")) for idx in range(3)]
+    metrics: List[Tuple[str, Dict[str, Any]]] = []
+    guard = TranscriptionAccuracyGuard(
+        repo,
+        stubs.MemoryLogRepository(),
+        threshold=0.99,
+        metric_dispatcher=lambda event, payload: metrics.append((event, payload)),
+    )
+
+    summary = AccuracyBatchRescorer(repo, guard, max_workers=1).run(jobs, threshold=0.85)
+
+    assert len(summary.scored) == 3
+    assert summary.status_changes == 3
+    assert repo.bulk_calls == [["job-0", "job-1", "job-2"]]
+    assert repo.single_updates == 0
+    stored = repo.find_by_id("job-1")
+    assert stored.metadata["accuracy_status"] == "passing"
+    assert stored.metadata["accuracy_score"] == "0.9000"
+    assert [event for event, _ in metrics].count("accuracy.guard.evaluated") == 3
+    assert metrics[-1][0] == "accuracy.guard.rescored"
+    assert "| job-2 | 0.9000 |" in summary.to_markdown()
+
+
+def test_rescore_uses_reference_text_and_skips_unscorable_jobs(tmp_path):
+    repo = stubs.MemoryJobRepository()
+    scorable = repo.create(_make_job(tmp_path, "job-ref", "ola mundo perfeito"))
+    never_scored = repo.create(_make_job(tmp_path, "job-new", "ola", metadata={}))
+    no_artifact = repo.create(Job(id="job-missing", source_path=tmp_path / "x.wav", profile_id="geral"))
+    guard = TranscriptionAccuracyGuard(
+        repo,
+        stubs.MemoryLogRepository(),
+        reference_loader=lambda job: "ola mundo perfeito",
+    )
+
+    summary = AccuracyBatchRescorer(repo, guard, max_workers=1).run([scorable, never_scored, no_artifact])
+
+    assert summary.skipped == {"job-new": "missing_asr_baseline", "job-missing": "missing_json_artifact"}
+    metadata = repo.find_by_id("job-ref").metadata
+    assert metadata["accuracy_reference_source"] == "client_reference"
+    assert metadata["accuracy_wer_reference"] == "0.0000"
+    assert metadata["accuracy_status"] == "passing"
+
+
+def test_rescore_dry_run_keeps_repository_untouched(tmp_path):
+    repo = BulkJobRepository()
+    job = repo.create(_make_job(tmp_path, "job-dry", "ola mundo"))
+    guard = TranscriptionAccuracyGuard(repo, stubs.MemoryLogRepository())
+
+    summary = AccuracyBatchRescorer(repo, guard, max_workers=1).run([job], threshold=0.5, dry_run=True)
+
+    assert summary.scored[0].metadata["accuracy_status"] == "passing"
+    assert repo.bulk_calls == []
+    assert repo.find_by_id("job-dry").metadata["accuracy_status"] == "needs_review"
+
+
+
+def test_rescore_keeps_changes_made_to_the_job_while_scoring(tmp_path):
+    repo = BulkJobRepository()
+    loaded = copy.deepcopy(repo.create(_make_job(tmp_path, "job-live", "ola mundo")))
+    current = repo.find_by_id("job-live")
+    current.status = JobStatus.APPROVED
+    current.metadata["review_notes"] = "ok"
+    guard = TranscriptionAccuracyGuard(repo, stubs.MemoryLogRepository())
+
+    AccuracyBatchRescorer(repo, guard, max_workers=1).run([loaded], threshold=0.5)
+
+    stored = repo.find_by_id("job-live")
+    assert stored.status == JobStatus.APPROVED
+    assert stored.metadata["review_notes"] == "ok"
+    assert stored.metadata["accuracy_status"] == "passing"
+
+def test_rescore_process_pool_matches_inline(tmp_path):
+    jobs = [_make_job(tmp_path, f"job-{idx}", "ola mundo " * (idx + 1)) for idx in range(6)]
+    guard = TranscriptionAccuracyGuard(stubs.MemoryJobRepository(), stubs.MemoryLogRepository())
+
+    inline = AccuracyBatchRescorer(stubs.MemoryJobRepository(), guard, max_workers=1).run(jobs, dry_run=True)
+    pooled = AccuracyBatchRescorer(stubs.MemoryJobRepository(), guard, max_workers=2).run(jobs, dry_run=True)
+
+    assert [(o.job_id, o.score) for o in inline.scored] == [(o.job_id, o.score) for o in pooled.scored]
+
+
+def test_score_task_reports_unreadable_artifact(tmp_path):
+    outcome = score_task(RescoreTask(job_id="job-x", json_path=str(tmp_path / "missing.json")), threshold=0.9)
+
+    assert outcome.error and outcome.error.startswith("FileNotFoundError")
+    assert outcome.metadata == {}
+
+
+def test_rescore_recomputes_asr_wer_from_persisted_transcription(tmp_path):
+    from infrastructure.database.transcription_store import FilesystemTranscriptionStore
+
+    store = FilesystemTranscriptionStore(tmp_path / "asr")
+    repo = stubs.MemoryJobRepository()
+    job = repo.create(_make_job(tmp_path, "job-asr", "ola mundo", metadata={}))
+    store.save("job-asr", job.version, TranscriptionResult(text="ola mundo", segments=[], language="pt"))
+    guard = TranscriptionAccuracyGuard(repo, stubs.MemoryLogRepository())
+
+    summary = AccuracyBatchRescorer(repo, guard, max_workers=1, transcription_store=store).run([job])
+
+    assert summary.skipped == {}
+    assert repo.find_by_id("job-asr").metadata["accuracy_wer_asr"] == "0.0000"
+    assert repo.find_by_id("job-asr").metadata["accuracy_status"] == "passing"
+
+
+def test_rescore_reports_missing_baseline_when_store_has_no_result(tmp_path):
+    from infrastructure.database.transcription_store import FilesystemTranscriptionStore
+
+    repo = stubs.MemoryJobRepository()
+    job = repo.create(_make_job(tmp_path, "job-none", "ola", metadata={}))
+    guard = TranscriptionAccuracyGuard(repo, stubs.MemoryLogRepository())
+    rescorer = AccuracyBatchRescorer(
+        repo, guard, max_workers=1, transcription_store=FilesystemTranscriptionStore(tmp_path / "asr")
+    )
+
+    summary = rescorer.run([job])
+
+    assert [outcome.error for outcome in summary.failed] == ["missing_asr_baseline"]
@@ -5,6 +5,8 @@ from pathlib import Path
 from zipfile import ZipFile
 
 from application.services.artifact_builder import FilesystemArtifactBuilder
+from application.services.cue_optimizer import CueOptimizer
+from application.services.delivery_template_service import DeliveryTemplateRegistry
 from application.services.package_service import ZipPackageService
 from application.services.subtitle_formatter import SubtitleFormatter
 from application.services.validator_service import TranscriptValidator
@@ -65,6 +67,162 @@ def test_filesystem_artifact_builder_generates_all_formats(tmp_path: Path) -> No
     assert payload["warnings"]  # validator populates warnings due a long line
 
 
+def test_parallel_builder_matches_serial_output_and_reports_timings(tmp_path: Path) -> None:
+    metrics: list[tuple[str, dict]] = []
+    serial = FilesystemArtifactBuilder(tmp_path / "serial", SubtitleFormatter(), TranscriptValidator())
+    parallel = FilesystemArtifactBuilder(
+        tmp_path / "parallel",
+        SubtitleFormatter(),
+        TranscriptValidator(),
+        parallel_writes=True,
+        metric_dispatcher=lambda event, payload: metrics.append((event, payload)),
+    )
+    job = make_job("job-par", tmp_path)
+
+    serial_artifacts = list(serial.build(job, make_profile(), make_post_edit_result()))
+    parallel_artifacts = list(parallel.build(job, make_profile(), make_post_edit_result()))
+
+    assert [a.artifact_type for a in parallel_artifacts] == [a.artifact_type for a in serial_artifacts]
+    for expected, produced in zip(serial_artifacts, parallel_artifacts):
+        assert produced.path.read_bytes() == expected.path.read_bytes()
+    assert sorted(path.name for path in (tmp_path / "parallel" / job.id).iterdir()) == sorted(
+        artifact.path.name for artifact in parallel_artifacts
+    )
+    assert [payload["format"] for _, payload in metrics] == [a.artifact_type.value for a in parallel_artifacts]
+    assert all(event == "artifacts.format.written" and payload["bytes"] > 0 for event, payload in metrics)
+
+
+def test_compact_json_artifact_is_smaller_and_equivalent(tmp_path: Path) -> None:
+    job = make_job("job-json", tmp_path)
+    pretty = FilesystemArtifactBuilder(tmp_path / "pretty", SubtitleFormatter(), TranscriptValidator())
+    compact = FilesystemArtifactBuilder(tmp_path / "compact", SubtitleFormatter(), TranscriptValidator(), compact_json=True)
+
+    pretty_json = list(pretty.build(job, make_profile(), make_post_edit_result()))[-1].path
+    compact_json = list(compact.build(job, make_profile(), make_post_edit_result()))[-1].path
+
+    assert json.loads(compact_json.read_text(encoding="utf-8")) == json.loads(pretty_json.read_text(encoding="utf-8"))
+    assert compact_json.stat().st_size < pretty_json.stat().st_size
+    assert "\n" not in compact_json.read_text(encoding="utf-8")
+
+
+def test_incremental_builder_rewrites_only_txt_when_template_changes(tmp_path: Path) -> None:
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "default.template.txt").write_text("{{header}}\n\n{{transcript}}", encoding="utf-8")
+    (templates / "branded.template.txt").write_text("ACME\n{{transcript}}", encoding="utf-8")
+    metrics: list[tuple[str, dict]] = []
+    builder = FilesystemArtifactBuilder(
+        tmp_path / "out",
+        SubtitleFormatter(),
+        TranscriptValidator(),
+        template_registry=DeliveryTemplateRegistry(templates),
+        incremental=True,
+        metric_dispatcher=lambda event, payload: metrics.append((event, payload)),
+    )
+    job = make_job("job-inc", tmp_path)
+    job.metadata["delivery_template"] = "default"
+
+    artifacts = list(builder.build(job, make_profile(), make_post_edit_result()))
+    assert [event for event, _ in metrics] == ["artifacts.format.written"] * 4
+
+    metrics.clear()
+    list(builder.build(job, make_profile(), make_post_edit_result()))
+    assert [event for event, _ in metrics] == ["artifacts.format.reused"] * 4
+
+    metrics.clear()
+    job.metadata["delivery_template"] = "branded"
+    job.metadata["delivery_template_updated_at"] = "2024-01-01T00:00:00+00:00"
+    list(builder.build(job, make_profile(), make_post_edit_result()))
+    written = [payload["format"] for event, payload in metrics if event == "artifacts.format.written"]
+    assert written == [ArtifactType.TRANSCRIPT_TXT.value]
+    assert artifacts[0].path.read_text(encoding="utf-8").startswith("ACME")
+    json_path = next(artifact.path for artifact in artifacts if artifact.artifact_type == ArtifactType.STRUCTURED_JSON)
+    assert "delivery_template" not in json.loads(json_path.read_text(encoding="utf-8"))["metadata"]
+
+    metrics.clear()
+    (templates / "branded.template.txt").write_text("ACME 2\n{{transcript}}", encoding="utf-8")
+    rebuilt = FilesystemArtifactBuilder(
+        tmp_path / "out",
+        SubtitleFormatter(),
+        TranscriptValidator(),
+        template_registry=DeliveryTemplateRegistry(templates),
+        incremental=True,
+        metric_dispatcher=lambda event, payload: metrics.append((event, payload)),
+    )
+    list(rebuilt.build(job, make_profile(), make_post_edit_result()))
+    written = [payload["format"] for event, payload in metrics if event == "artifacts.format.written"]
+    assert written == [ArtifactType.TRANSCRIPT_TXT.value]
+
+
+def test_incremental_builder_rewrites_stale_or_missing_formats(tmp_path: Path) -> None:
+    metrics: list[tuple[str, dict]] = []
+    builder = FilesystemArtifactBuilder(
+        tmp_path,
+        SubtitleFormatter(),
+        TranscriptValidator(),
+        incremental=True,
+        metric_dispatcher=lambda event, payload: metrics.append((event, payload)),
+    )
+    job = make_job("job-stale", tmp_path)
+    artifacts = list(builder.build(job, make_profile(), make_post_edit_result()))
+    artifacts[1].path.unlink()
+    profile = make_profile()
+    profile.meta["subtitle"]["max_chars_per_line"] = 20
+
+    metrics.clear()
+    list(builder.build(job, profile, make_post_edit_result()))
+
+    written = [payload["format"] for event, payload in metrics if event == "artifacts.format.written"]
+    assert written == [ArtifactType.SUBTITLE_SRT.value, ArtifactType.SUBTITLE_VTT.value, ArtifactType.STRUCTURED_JSON.value]
+    assert artifacts[1].path.exists()
+
+
+def test_incremental_builder_rewrites_json_when_cue_optimizer_changes(tmp_path: Path) -> None:
+    metrics: list[tuple[str, dict]] = []
+
+    def builder(optimizer: CueOptimizer) -> FilesystemArtifactBuilder:
+        return FilesystemArtifactBuilder(
+            tmp_path,
+            SubtitleFormatter(),
+            TranscriptValidator(),
+            cue_optimizer=optimizer,
+            incremental=True,
+            metric_dispatcher=lambda event, payload: metrics.append((event, payload)),
+        )
+
+    job = make_job("job-optimizer", tmp_path)
+    list(builder(CueOptimizer()).build(job, make_profile(), make_post_edit_result()))
+
+    metrics.clear()
+    list(builder(CueOptimizer(min_duration=2.0)).build(job, make_profile(), make_post_edit_result()))
+
+    written = [payload["format"] for event, payload in metrics if event == "artifacts.format.written"]
+    assert written == [ArtifactType.SUBTITLE_SRT.value, ArtifactType.SUBTITLE_VTT.value, ArtifactType.STRUCTURED_JSON.value]
+
+
+def test_builder_failure_keeps_previous_artifact_intact(tmp_path: Path) -> None:
+    class ExplodingFormatter(SubtitleFormatter):
+        def write(self, entries, subtitle_format, handle):
+            handle.write("parcial")
+            raise RuntimeError("render falhou")
+
+    job = make_job("job-atomic", tmp_path)
+    FilesystemArtifactBuilder(tmp_path, SubtitleFormatter(), TranscriptValidator()).build(
+        job, make_profile(), make_post_edit_result()
+    )
+    srt_path = tmp_path / job.id / f"{job.id}_v{job.version}.srt"
+    previous = srt_path.read_bytes()
+    builder = FilesystemArtifactBuilder(tmp_path, ExplodingFormatter(), TranscriptValidator(), parallel_writes=True)
+
+    try:
+        builder.build(job, make_profile(), make_post_edit_result())
+    except RuntimeError:
+        pass
+
+    assert srt_path.read_bytes() == previous
+    assert not list((tmp_path / job.id).glob("*.tmp"))
+
+
 class StubStorageClient(StorageClient):
     def __init__(self) -> None:
         self.uploads: list[tuple[Path, str]] = []
@@ -103,3 +261,27 @@ def test_zip_package_service_creates_zip_and_uploads(tmp_path: Path) -> None:
         assert any(name.endswith(".srt") for name in names)
 
     assert storage.uploads == [(package_path, f"{job.id}/{package_path.name}")]
+
+
+def test_package_service_streams_members_and_reports_metrics(tmp_path: Path) -> None:
+    job = make_job("job-pkg", tmp_path)
+    builder = FilesystemArtifactBuilder(tmp_path / "out", SubtitleFormatter(), TranscriptValidator())
+    artifacts = list(builder.build(job, make_profile(), make_post_edit_result()))
+    metrics: list[tuple[str, dict]] = []
+    service = ZipPackageService(
+        tmp_path / "backup",
+        compression_level=9,
+        max_workers=2,
+        metric_dispatcher=lambda event, payload: metrics.append((event, payload)),
+    )
+
+    package_path = service.create_package(job, artifacts)
+
+    with ZipFile(package_path) as zip_file:
+        assert zip_file.testzip() is None
+        assert sorted(zip_file.namelist()) == sorted(f"{job.id}/{artifact.path.name}" for artifact in artifacts)
+    assert not list(package_path.parent.glob("*.tmp"))
+    event, payload = metrics[0]
+    assert event == "package.created"
+    assert payload["members"] == len(artifacts) and payload["level"] == 9 and payload["streamed"] is True
+
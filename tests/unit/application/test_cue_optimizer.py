@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from application.services.cue_optimizer import CueOptimizer
+from application.services.validator_service import TranscriptValidator
+from domain.entities.profile import Profile
+from domain.entities.transcription import Segment
+
+
+def _profile(max_chars: int = 20, max_lines: int = 2, cps: int = 15) -> Profile:
+    return Profile(
+        id="p",
+        meta={"subtitle": {"max_chars_per_line": max_chars, "max_lines": max_lines, "reading_speed_cps": cps}},
+        prompt_body="",
+    )
+
+
+def test_merges_short_neighbours_of_same_speaker():
+    segments = [
+        Segment(id=0, start=0.0, end=0.4, text="Sim.", speaker="A"),
+        Segment(id=1, start=0.5, end=1.2, text="Claro que sim.", speaker="A"),
+        Segment(id=2, start=1.3, end=1.8, text="Ok.", speaker="B"),
+    ]
+
+    cues = CueOptimizer().optimize(segments, _profile())
+
+    assert [(cue.id, cue.text, cue.speaker) for cue in cues] == [(0, "Sim. Claro que sim.", "A"), (1, "Ok.", "B")]
+    assert cues[0].start == 0.0
+    assert cues[0].end == 1.26  # stretched up to the next cue minus the minimum gap
+
+
+def test_splits_long_segments_and_satisfies_validator():
+    text = "uma frase bastante longa que nao cabe em duas linhas de vinte caracteres"
+    profile = _profile()
+    segments = [Segment(id=0, start=0.0, end=8.0, text=text)]
+
+    cues = CueOptimizer().optimize(segments, profile)
+
+    assert len(cues) == 2
+    assert all(len(cue.text.split("\n")) <= 2 for cue in cues)
+    assert " ".join(cue.text.replace("\n", " ") for cue in cues) == text
+    assert cues[0].end == cues[1].start
+    assert TranscriptValidator().validate(profile, segments)
+    assert TranscriptValidator().validate(profile, cues) == []
+
+
+def test_extends_fast_cues_into_available_gap():
+    segments = [
+        Segment(id=0, start=0.0, end=1.0, text="texto rapido demais aqui"),
+        Segment(id=1, start=5.0, end=7.0, text="depois"),
+    ]
+
+    cues = CueOptimizer().optimize(segments, _profile(cps=12))
+
+    assert cues[0].end == 2.0
+    assert cues[1].end == 7.0
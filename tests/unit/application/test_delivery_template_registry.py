@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -116,3 +117,57 @@ def test_get_raises_file_not_found_if_no_template_exists(tmp_path: Path) -> None
     registry = DeliveryTemplateRegistry(tmp_path / "templates")
     with pytest.raises(FileNotFoundError):
         registry.get("any-template")
+
+
+def test_templates_are_compiled_into_literal_and_placeholder_parts(tmp_path: Path) -> None:
+    templates_dir = tmp_path / "templates"
+    _write_template(templates_dir / "default.template.txt", {"id": "default"}, "Oi {{ name }}, job {{job.id}}!")
+
+    template = DeliveryTemplateRegistry(templates_dir).get("default")
+
+    assert template.parts == ("Oi ", "name", ", job ", "job.id", "!")
+    assert template.render({"name": "Ana"}) == "Oi Ana, job !\n"
+
+
+def test_refresh_reloads_only_changed_templates_and_drops_deleted(tmp_path: Path, monkeypatch) -> None:
+    templates_dir = tmp_path / "templates"
+    default_path = templates_dir / "default.template.txt"
+    custom_path = templates_dir / "custom.template.txt"
+    _write_template(default_path, {"id": "default"}, "Versao 1 {{name}}")
+    _write_template(custom_path, {"id": "custom"}, "Custom {{name}}")
+    registry = DeliveryTemplateRegistry(templates_dir, refresh_interval=3600)
+    assert registry.render("default", {"name": "Ana"}) == "Versao 1 Ana\n"
+
+    _write_template(default_path, {"id": "default"}, "Versao 2 {{name}}")
+    stat = default_path.stat()
+    os.utime(default_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert registry.render("default", {"name": "Ana"}) == "Versao 1 Ana\n"  # still within the refresh interval
+
+    loaded: list[Path] = []
+    original_loader = registry._load_template
+    monkeypatch.setattr(registry, "_load_template", lambda path: loaded.append(path) or original_loader(path))
+    assert registry.refresh(force=True) is True
+    assert loaded == [default_path]
+    assert registry.render("default", {"name": "Ana"}) == "Versao 2 Ana\n"
+
+    custom_path.unlink()
+    assert registry.refresh(force=True) is True
+    assert [template.id for template in registry.list_templates()] == ["default"]
+    assert registry.refresh(force=True) is False
+
+
+def test_refresh_swaps_in_a_new_index_instead_of_mutating_the_live_one(tmp_path: Path) -> None:
+    templates_dir = tmp_path / "templates"
+    _write_template(templates_dir / "default.template.txt", {"id": "default"}, "Padrao {{name}}")
+    registry = DeliveryTemplateRegistry(templates_dir, refresh_interval=3600)
+    live = registry._base_templates
+    snapshot = dict(live)
+
+    _write_template(templates_dir / "novo.template.txt", {"id": "novo"}, "Novo {{name}}")
+    assert registry.refresh(force=True) is True
+    registry.get("extra")  # falls back to default without touching the index
+
+    # A reader still iterating the old mapping sees it unchanged.
+    assert live == snapshot
+    assert registry._base_templates is not live
+    assert registry.get("novo").body.startswith("Novo")
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+from typing import List
+
+import pytest
+
+from application.services.accuracy_service import TranscriptionAccuracyGuard
+from application.services.edit_distance import (
+    banded_levenshtein,
+    bit_parallel_levenshtein,
+    encode_tokens,
+    levenshtein,
+)
+
+
+def reference_levenshtein(reference: List[str], hypothesis: List[str]) -> int:
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_token in enumerate(reference, start=1):
+        current = [i]
+        for j, hyp_token in enumerate(hypothesis, start=1):
+            cost = 0 if ref_token == hyp_token else 1
+            current.append(min(current[-1] + 1, previous[j] + 1, previous[j - 1] + cost))
+        previous = current
+    return previous[-1]
+
+
+def random_tokens(rng: random.Random, alphabet: str, max_len: int) -> List[str]:
+    return [rng.choice(alphabet) for _ in range(rng.randint(0, max_len))]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_bit_parallel_matches_reference_dp(seed):
+    rng = random.Random(seed)
+    for _ in range(300):
+        reference = random_tokens(rng, "abcde", 40)
+        hypothesis = random_tokens(rng, "abcde", 40)
+        expected = reference_levenshtein(reference, hypothesis)
+        ref_ids, hyp_ids = encode_tokens(reference, hypothesis)
+        assert bit_parallel_levenshtein(ref_ids, hyp_ids) == expected
+        assert levenshtein(reference, hypothesis) == expected
+
+
+@pytest.mark.parametrize("band", [0, 1, 4, 64])
+def test_banded_mode_matches_reference_dp(band):
+    rng = random.Random(band)
+    for _ in range(300):
+        reference = random_tokens(rng, "abc", 30)
+        hypothesis = random_tokens(rng, "abc", 30)
+        expected = reference_levenshtein(reference, hypothesis)
+        ref_ids, hyp_ids = encode_tokens(reference, hypothesis)
+        assert banded_levenshtein(ref_ids, hyp_ids, band) == expected
+        assert levenshtein(reference, hypothesis, band=band) == expected
+
+
+def test_distance_crosses_machine_word_boundaries():
+    rng = random.Random(42)
+    reference = [f"w{rng.randint(0, 50)}" for _ in range(300)]
+    hypothesis = list(reference)
+    for _ in range(25):
+        hypothesis[rng.randrange(len(hypothesis))] = "x"
+    del hypothesis[100:110]
+    hypothesis[200:200] = ["y", "z"]
+
+    expected = reference_levenshtein(reference, hypothesis)
+    assert levenshtein(reference, hypothesis) == expected
+    assert levenshtein(hypothesis, reference) == expected
+    assert levenshtein(reference, hypothesis, band=16) == expected
+
+
+def test_edge_cases():
+    assert levenshtein([], []) == 0
+    assert levenshtein([], ["a", "b"]) == 2
+    assert levenshtein(["a", "b", "c"], []) == 3
+    assert levenshtein(["a", "b"], ["a", "b"]) == 0
+    assert levenshtein(["a"], ["b"]) == 1
+    assert encode_tokens(["x", "y"], ["y", "z"]) == ([0, 1], [1, 2])
+
+
+def test_guard_word_error_rate_uses_fast_engine():
+    guard = TranscriptionAccuracyGuard(job_repository=None, log_repository=None)  # type: ignore[arg-type]
+    rng = random.Random(7)
+    for _ in range(100):
+        reference = " ".join(random_tokens(rng, "abcd", 20))
+        hypothesis = " ".join(random_tokens(rng, "abcd", 20))
+        ref_tokens = guard._tokenize(reference)
+        hyp_tokens = guard._tokenize(hypothesis)
+        if not ref_tokens:
+            continue
+        expected = min(1.0, reference_levenshtein(ref_tokens, hyp_tokens) / len(ref_tokens))
+        assert guard._word_error_rate(reference, hypothesis) == expected
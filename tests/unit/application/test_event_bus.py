@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from application.services.event_bus import JobEventBus, metrics_subscriber
+from domain.entities.artifact import Artifact
+from domain.entities.job import Job
+from domain.entities.job_event import JobEvent
+from domain.entities.value_objects import ArtifactType, JobEventType, JobStatus
+from domain.usecases.pipeline import ProcessJobPipeline
+from domain.usecases.post_edit import PostEditTranscript
+from domain.usecases.run_asr import RunAsrPipeline
+from infrastructure.api.event_webhooks import JobEventWebhookSubscriber
+from tests.support import stubs
+from tests.support.domain import StubProfileProvider
+
+
+def _event(job_id: str, event_type: JobEventType = JobEventType.STATUS_CHANGED) -> JobEvent:
+    return JobEvent(type=event_type, job_id=job_id)
+
+
+def test_emit_does_not_wait_for_slow_subscribers_and_keeps_order():
+    release = threading.Event()
+    slow_seen, fast_seen = [], []
+
+    def slow(event):
+        release.wait(2)
+        slow_seen.append(event.job_id)
+
+    bus = JobEventBus(max_workers=2)
+    bus.subscribe(slow, name="slow")
+    bus.subscribe(lambda event: fast_seen.append(event.job_id), name="fast")
+
+    started = time.perf_counter()
+    for index in range(20):
+        bus.emit(_event(f"job-{index}"))
+    assert time.perf_counter() - started < 0.5
+    assert bus.flush(timeout=0.05) is False
+
+    release.set()
+    assert bus.close(timeout=5)
+    expected = [f"job-{index}" for index in range(20)]
+    assert slow_seen == expected
+    assert fast_seen == expected
+
+
+
+def test_publish_many_hands_the_batch_to_batch_subscribers(tmp_path):
+    from application.services.sheet_service import CsvSheetService
+    from application.services.status_publisher import SheetStatusPublisher
+
+    class CountingSheet(CsvSheetService):
+        def __init__(self, path):
+            super().__init__(path)
+            self.single_writes = 0
+            self.batches = []
+
+        def record_job_status(self, job, status):
+            self.single_writes += 1
+            super().record_job_status(job, status)
+
+        def record_job_statuses(self, jobs):
+            self.batches.append([job.id for job in jobs])
+            super().record_job_statuses(jobs)
+
+    sheet = CountingSheet(tmp_path / "log.csv")
+    publisher = SheetStatusPublisher(sheet)
+    seen = []
+    bus = JobEventBus(max_workers=2)
+    bus.subscribe(publisher.handle_event, name="sheet", batch_handler=publisher.handle_events)
+    bus.subscribe(lambda event: seen.append(event.job_id), name="per-event")
+    jobs = [
+        Job(id=f"job-{index}", source_path=tmp_path / f"{index}.wav", profile_id="geral", status=JobStatus.APPROVED)
+        for index in range(3)
+    ]
+
+    bus.publish_many(jobs)
+    bus.publish(jobs[0])
+    assert bus.close(timeout=5)
+
+    assert sheet.batches == [["job-0", "job-1", "job-2"]]
+    assert sheet.single_writes == 1
+    assert seen == ["job-0", "job-1", "job-2", "job-0"]
+
+def test_full_subscriber_queue_drops_new_events_and_reports_them():
+    release = threading.Event()
+    metrics = []
+    bus = JobEventBus(max_workers=1, max_pending=2, metric_dispatcher=lambda name, payload: metrics.append(name))
+    bus.subscribe(lambda event: release.wait(2), name="stuck")
+
+    for index in range(6):
+        bus.emit(_event(f"job-{index}"))
+    release.set()
+    bus.close(timeout=5)
+
+    assert "events.dropped" in metrics
+
+
+def test_failing_subscriber_does_not_affect_others_and_filters_apply():
+    seen = []
+
+    def broken(event):
+        raise RuntimeError("sink fora do ar")
+
+    bus = JobEventBus(max_workers=0)
+    bus.subscribe(broken)
+    bus.subscribe(lambda event: seen.append(event.type), event_types=[JobEventType.FAILED])
+
+    bus.publish(Job(id="job-1", source_path=Path("a.wav"), profile_id="geral"))
+    bus.emit(_event("job-1", JobEventType.FAILED))
+
+    assert seen == [JobEventType.FAILED]
+
+
+def test_status_events_carry_a_snapshot_of_the_job():
+    received = []
+    bus = JobEventBus(max_workers=0)
+    bus.subscribe(lambda event: received.append(event.job))
+    job = Job(id="job-1", source_path=Path("a.wav"), profile_id="geral", status=JobStatus.PROCESSING)
+
+    bus.publish(job)
+    job.set_status(JobStatus.FAILED)
+
+    assert received[0].status == JobStatus.PROCESSING
+
+
+def test_metrics_subscriber_records_event_payload():
+    recorded = []
+    handle = metrics_subscriber(lambda name, payload: recorded.append((name, payload)))
+
+    handle(JobEvent(type=JobEventType.STAGE_COMPLETED, job_id="job-1", stage="asr", payload={"duration_ms": 1.5}))
+
+    name, payload = recorded[0]
+    assert name == "events.job.stage_completed"
+    assert payload["stage"] == "asr" and payload["payload"] == {"duration_ms": 1.5}
+
+
+def test_webhook_subscriber_signs_body():
+    captured = {}
+
+    class Session:
+        def post(self, url, data, headers, timeout):
+            captured.update(url=url, data=data, headers=headers)
+
+            class Response:
+                def raise_for_status(self) -> None:
+                    return None
+
+            return Response()
+
+    subscriber = JobEventWebhookSubscriber(["https://hooks.test/jobs", " "], secret="s3cr3t", session=Session())
+    subscriber(_event("job-1", JobEventType.CREATED))
+
+    expected = hmac.new(b"s3cr3t", captured["data"], hashlib.sha256).hexdigest()
+    assert captured["url"] == "https://hooks.test/jobs"
+    assert captured["headers"]["X-Signature"] == expected
+    assert captured["headers"]["X-Event-Type"] == "job.created"
+
+
+class _Artifacts:
+    def __init__(self, tmp_path: Path, fail: bool = False) -> None:
+        self.tmp_path = tmp_path
+        self.fail = fail
+
+    def execute(self, job_id, post_edit):
+        if self.fail:
+            raise OSError("disco cheio")
+        path = self.tmp_path / f"{job_id}.txt"
+        path.write_text(post_edit.text, encoding="utf-8")
+        return [Artifact(id="a1", job_id=job_id, artifact_type=ArtifactType.TRANSCRIPT_TXT, path=path)]
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_pipeline_emits_stage_events(tmp_path, fail):
+    repo = stubs.MemoryJobRepository()
+    repo.create(Job(id="job-1", source_path=tmp_path / "a.wav", profile_id="geral"))
+    log_repo = stubs.MemoryLogRepository()
+    profiles = StubProfileProvider(translate=False)
+    events = []
+    bus = JobEventBus(max_workers=0)
+    bus.subscribe(lambda event: events.append((event.type, event.stage)))
+    pipeline = ProcessJobPipeline(
+        RunAsrPipeline(repo, profiles, stubs.StubAsrService("ola mundo"), log_repo),
+        PostEditTranscript(repo, profiles, stubs.StubPostEditService(), log_repo),
+        _Artifacts(tmp_path, fail=fail),
+        log_repo,
+        event_publisher=bus,
+    )
+
+    if fail:
+        with pytest.raises(OSError):
+            pipeline.execute("job-1")
+    else:
+        pipeline.execute("job-1")
+
+    stage_events = [item for item in events if item[0] != JobEventType.STATUS_CHANGED]
+    assert stage_events[:4] == [
+        (JobEventType.STAGE_STARTED, "asr"),
+        (JobEventType.STAGE_COMPLETED, "asr"),
+        (JobEventType.STAGE_STARTED, "post_edit"),
+        (JobEventType.STAGE_COMPLETED, "post_edit"),
+    ]
+    last = (JobEventType.FAILED, "artifacts") if fail else (JobEventType.ARTIFACTS_READY, None)
+    assert stage_events[-1] == last
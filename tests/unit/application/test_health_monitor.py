@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import time
+
+from application.services.health_monitor import HealthMonitor
+
+
+def test_snapshot_serves_cached_probe_until_key_changes_or_result_is_too_old():
+    calls = []
+
+    def probe():
+        calls.append(1)
+        return {"status": "ok", "external": {"storage_ready": True}}
+
+    monitor = HealthMonitor(probe, interval_sec=60, max_age_sec=0.05)
+    assert monitor.snapshot() == {"status": "unknown"}
+    assert monitor.needs_refresh("a")
+
+    monitor.refresh("a")
+    monitor.refresh("a")
+    snapshot = monitor.snapshot()
+    assert len(calls) == 1
+    assert snapshot["status"] == "ok" and snapshot["age_sec"] >= 0 and "checked_at" in snapshot
+    assert not monitor.needs_refresh("a")
+    assert monitor.needs_refresh("b")
+
+    time.sleep(0.06)
+    assert monitor.needs_refresh("a")
+
+
+def test_background_thread_refreshes_and_probe_failures_report_unknown():
+    results = [{"status": "ok"}]
+
+    def probe():
+        if not results:
+            raise OSError("disk gone")
+        return results.pop()
+
+    monitor = HealthMonitor(probe, interval_sec=0.1)
+    monitor.refresh()
+    assert monitor.snapshot()["status"] == "ok"
+
+    monitor.start()
+    try:
+        deadline = time.monotonic() + 2
+        while monitor.snapshot()["status"] == "ok" and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        monitor.stop()
+    assert monitor.snapshot()["status"] == "unknown"
@@ -100,3 +100,40 @@ def test_requeue_job_uses_retry():
     job = controller.requeue_job("job-xyz", "error", retryable=False)
     assert job.id == "job-xyz"
     assert retry_use_case.decisions[-1].retryable is False
+
+
+def test_ingest_upload_reuses_job_for_same_content_profile_and_engine(tmp_path):
+    from infrastructure.database.upload_index import FileUploadIndex
+
+    class Repo(DummyJobRepo):
+        def find_by_id(self, job_id):
+            return next((job for job in self.jobs if job.id == job_id), None)
+
+    repo = Repo()
+    create_use_case = DummyCreateJobUseCase()
+    inputs = []
+    original_execute = create_use_case.execute
+
+    def execute(input_data):
+        inputs.append(input_data)
+        job = original_execute(input_data)
+        job.id = f"upload-{len(inputs)}"
+        repo.jobs.append(job)
+        return job
+
+    create_use_case.execute = execute
+    controller = JobController(
+        repo, create_use_case, None, DummyRetry(), upload_index=FileUploadIndex(tmp_path / "upload_index.json")
+    )
+
+    first, reused = controller.ingest_upload(Path("inbox/a.wav"), "geral", EngineType.OPENAI, "sha256:aa")
+    assert reused is False and inputs[0].metadata == {"upload_digest": "sha256:aa"}
+    again, reused = controller.ingest_upload(Path("inbox/a_1.wav"), "geral", EngineType.OPENAI, "sha256:aa")
+    assert reused is True and again.id == first.id
+    other, reused = controller.ingest_upload(Path("inbox/a_2.wav"), "legal", EngineType.OPENAI, "sha256:aa")
+    assert reused is False and other.id != first.id
+
+    first.status = JobStatus.FAILED
+    retried, reused = controller.ingest_upload(Path("inbox/a_3.wav"), "geral", EngineType.OPENAI, "sha256:aa")
+    assert reused is False and retried.id not in {first.id, other.id}
+    assert controller.ingest_upload(Path("inbox/a_4.wav"), "geral", EngineType.OPENAI, "sha256:aa")[0].id == retried.id
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from application.services import json_stream
+from application.services.json_stream import JsonStreamWriter, StreamedArray
+
+FIELDS = [
+    ("job_id", "job-1"),
+    ("text", "Olá, mundo — ação"),
+    ("segments", [{"id": 0, "start": 0.0, "end": 1.5, "text": "Olá", "speaker": None}, {"id": 1, "nested": {"a": [1, 2]}}]),
+    ("flags", []),
+    ("metadata", {"delivery_template": "default", "empty": {}}),
+]
+
+
+def _render(writer: JsonStreamWriter, fields) -> str:
+    buffer = io.StringIO()
+    writer.write_object(buffer, fields)
+    return buffer.getvalue()
+
+
+def _streamed(fields):
+    return [(key, StreamedArray(iter(value)) if key == "segments" else value) for key, value in fields]
+
+
+def test_pretty_output_is_identical_to_json_dumps():
+    expected = json.dumps(dict(FIELDS), ensure_ascii=False, indent=2)
+
+    assert _render(JsonStreamWriter(use_orjson=False), _streamed(FIELDS)) == expected
+
+
+def test_compact_output_matches_stdlib_separators():
+    expected = json.dumps(dict(FIELDS), ensure_ascii=False, separators=(",", ":"))
+
+    assert _render(JsonStreamWriter(compact=True, use_orjson=False), _streamed(FIELDS)) == expected
+
+
+def test_empty_object_and_stream():
+    assert _render(JsonStreamWriter(use_orjson=False), []) == "{}"
+    assert _render(JsonStreamWriter(use_orjson=False), [("segments", StreamedArray([]))]) == '{\n  "segments": []\n}'
+
+
+@pytest.mark.skipif(json_stream.orjson is None, reason="orjson nao instalado")
+def test_orjson_output_parses_to_same_document():
+    fields = FIELDS + [("big", 2**70)]  # orjson cannot encode it; falls back to json
+
+    rendered = _render(JsonStreamWriter(compact=True), _streamed(fields))
+
+    assert json.loads(rendered) == dict(fields)
+
+
+NUMBERS = [("timings", [1e-05, 1e16, 0.1]), ("score", float("nan"))]
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_pretty_numbers_follow_the_stdlib_with_either_backend(use_orjson):
+    rendered = _render(JsonStreamWriter(use_orjson=use_orjson), NUMBERS)
+
+    assert rendered == '{\n  "timings": [\n    1e-05,\n    1e+16,\n    0.1\n  ],\n  "score": NaN\n}'
+
+
+def test_compact_stdlib_numbers():
+    rendered = _render(JsonStreamWriter(compact=True, use_orjson=False), NUMBERS)
+
+    assert rendered == '{"timings":[1e-05,1e+16,0.1],"score":NaN}'
+
+
+@pytest.mark.skipif(json_stream.orjson is None, reason="orjson nao instalado")
+def test_compact_orjson_numbers_keep_values_but_drop_nan():
+    document = json.loads(_render(JsonStreamWriter(compact=True), NUMBERS))
+
+    assert document["timings"] == [1e-05, 1e16, 0.1]
+    assert document["score"] is None
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from application.services.line_breaker import BALANCED, GREEDY, break_lines, split_cues
+
+
+def test_greedy_fills_lines_and_cuts_long_words():
+    assert break_lines("o rato roeu a roupa do rei", 10) == ["o rato", "roeu a", "roupa do", "rei"]
+    assert break_lines("abcdefghij kl", 4) == ["abcd", "efgh", "ij", "kl"]
+    assert break_lines("  \t ", 10) == []
+
+
+def test_balanced_keeps_line_count_and_reduces_raggedness():
+    text = "aaa bb cc ddddd"
+    greedy = break_lines(text, 6, GREEDY)
+    balanced = break_lines(text, 6, BALANCED)
+
+    assert greedy == ["aaa bb", "cc", "ddddd"]
+    assert balanced == ["aaa", "bb cc", "ddddd"]
+    assert break_lines(text, 9, BALANCED) == ["aaa bb", "cc ddddd"]
+
+
+@pytest.mark.parametrize("strategy", [GREEDY, BALANCED])
+def test_break_lines_never_drops_words_or_exceeds_width(strategy):
+    rng = random.Random(7)
+    for _ in range(300):
+        width = rng.randint(3, 30)
+        words = ["x" * rng.randint(1, 12) for _ in range(rng.randint(0, 25))]
+        lines = break_lines(" ".join(words), width, strategy)
+
+        assert all(0 < len(line) <= width for line in lines)
+        assert "".join(lines).replace(" ", "") == "".join(words)
+        if strategy == BALANCED:
+            assert len(lines) == len(break_lines(" ".join(words), width, GREEDY))
+
+
+def test_split_cues_shares_duration_by_characters():
+    cues = split_cues(["aaaa", "aaaa", "aa", "aaaaaa"], 2, 10.0, 12.0)
+
+    assert cues == [(10.0, 11.0, ["aaaa", "aaaa"]), (11.0, 12.0, ["aa", "aaaaaa"])]
+    assert split_cues([], 2, 0.0, 1.0) == [(0.0, 1.0, [""])]
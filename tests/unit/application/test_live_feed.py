@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from application.services.event_bus import JobEventBus
+from application.services.live_feed import LiveFeed, ObservedLogRepository
+from domain.entities.job import Job
+from domain.entities.log_entry import LogEntry
+from domain.entities.value_objects import EngineType, JobStatus, LogLevel
+from infrastructure.database.log_repository import FileLogRepository
+
+
+def test_since_replays_missed_events_and_requests_resync_when_evicted():
+    feed = LiveFeed(history=3)
+    first = feed.publish("job", {"n": 1})
+    for n in range(2, 6):
+        feed.publish("job", {"n": n})
+
+    events, resync = feed.since(feed.last_event_id)
+    assert events == [] and resync is False
+
+    # Event 2 was evicted, but a client that saw it missed nothing that is gone.
+    events, resync = feed.since(first.id.replace("-1", "-2"))
+    assert [event.data["n"] for event in events] == [3, 4, 5] and resync is False
+
+    assert feed.since(first.id) == ([], True)
+    assert feed.since("other-3") == ([], True)
+    assert feed.since(None) == ([], True)
+
+
+def test_listeners_are_woken_once_per_event_and_can_be_removed():
+    feed = LiveFeed()
+    calls = []
+    remove = feed.add_listener(lambda: calls.append("a"))
+    feed.add_listener(lambda: (_ for _ in ()).throw(RuntimeError("loop closed")))
+
+    feed.publish("incident", {})
+    remove()
+    feed.publish("incident", {})
+
+    assert calls == ["a"]
+
+
+def test_bus_events_and_appended_logs_reach_the_feed(tmp_path):
+    feed = LiveFeed()
+    bus = JobEventBus(max_workers=0)
+    bus.subscribe(feed.handle_event)
+    logs = ObservedLogRepository(FileLogRepository(tmp_path / "logs.json"), feed.handle_log)
+    job = Job(
+        id="job-1",
+        source_path=Path("inbox/audio.wav"),
+        profile_id="geral",
+        engine=EngineType.OPENAI,
+        status=JobStatus.AWAITING_REVIEW,
+    )
+    cursor = feed.last_event_id
+
+    bus.publish(job)
+    logs.append(LogEntry(job_id="job-1", event="asr_failed", level=LogLevel.ERROR, message="timeout"))
+    logs.append_many([LogEntry(job_id="job-2", event="review_completed")])
+
+    events, _ = feed.since(cursor)
+    assert [event.kind for event in events] == ["job", "incident", "incident"]
+    assert events[0].data["job"] == {
+        "id": "job-1",
+        "source_name": "audio.wav",
+        "profile_id": "geral",
+        "status": "awaiting_review",
+        "updated_at": job.updated_at.isoformat(),
+    }
+    assert events[1].data["level"] == "error" and events[1].data["message"] == "timeout"
+    assert [entry.job_id for entry in logs.list_recent(5)] == ["job-2", "job-1"]
+
+
+def test_dashboard_stream_replays_from_last_event_id_then_stops_on_disconnect():
+    from interfaces.http.app import _live_event_stream
+
+    class DisconnectingRequest:
+        async def is_disconnected(self) -> bool:
+            return True
+
+    feed = LiveFeed()
+    seen = feed.publish("job", {"job_id": "job-1", "status": "processing"})
+    feed.publish("incident", {"job_id": "job-1", "level": "error", "event": "asr_failed"})
+
+    async def collect(resume_from):
+        return [frame async for frame in _live_event_stream(feed, DisconnectingRequest(), resume_from, 1)]
+
+    frames = asyncio.run(collect(seen.id))
+    assert frames[0].startswith("retry: ")
+    assert frames[1].startswith(f"id: {feed.last_event_id}\nevent: incident\ndata: ")
+    assert '"icon"' in frames[1]
+    assert len(frames) == 2
+
+    resync = asyncio.run(collect("stale-1"))
+    assert resync[1] == f'id: {feed.last_event_id}\nevent: resync\ndata: {{"last_event_id": "{feed.last_event_id}"}}\n\n'
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from application.services.sheet_batch_writer import SheetBatchWriter
+from application.services.sheet_service import CsvSheetService
+from domain.entities.job import Job
+from domain.entities.value_objects import EngineType, JobStatus
+
+
+def _job(job_id: str) -> Job:
+    return Job(
+        id=job_id,
+        source_path=Path(f"inbox/{job_id}.wav"),
+        profile_id="geral",
+        engine=EngineType.OPENAI,
+        status=JobStatus.APPROVED,
+    )
+
+
+class RecordingGateway:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.batches = []
+
+    def append_row(self, row) -> None:
+        raise AssertionError("append_rows should be used")
+
+    def append_rows(self, rows) -> None:
+        if self.fail:
+            raise ConnectionError("sheets indisponivel")
+        self.batches.append([row["job_id"] for row in rows])
+
+
+def test_writer_coalesces_rows_until_max_rows():
+    batches = []
+    writer = SheetBatchWriter(batches.append, max_rows=3, max_delay_ms=10_000)
+    try:
+        writer.submit([{"job_id": "a"}, {"job_id": "b"}])
+        time.sleep(0.05)
+        assert batches == []
+        writer.submit([{"job_id": "c"}])
+        deadline = time.monotonic() + 2
+        while not batches and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [[row["job_id"] for row in batch] for batch in batches] == [["a", "b", "c"]]
+    finally:
+        writer.close()
+
+
+def test_writer_flushes_after_delay_and_on_close():
+    batches = []
+    writer = SheetBatchWriter(batches.append, max_rows=100, max_delay_ms=20)
+    writer.submit([{"job_id": "a"}])
+    deadline = time.monotonic() + 2
+    while not batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(batches) == 1
+
+    writer.submit([{"job_id": "b"}])
+    writer.close()
+    assert [row["job_id"] for batch in batches for row in batch] == ["a", "b"]
+    assert writer.pending_count() == 0
+
+
+def test_writer_keeps_failed_rows_for_retry():
+    csv_rows = []
+    gateway = RecordingGateway(fail=True)
+    writer = SheetBatchWriter(csv_rows.extend, gateway.append_rows, max_rows=10, retry_interval_sec=60)
+    try:
+        writer.submit([{"job_id": "a"}], mirror=True)
+        writer.submit([{"job_id": "status-only"}])
+        assert writer.flush(timeout=2)
+
+        assert [row["job_id"] for row in csv_rows] == ["a", "status-only"]
+        assert writer.failed_rows() == [("sheet", {"job_id": "a"})]
+
+        gateway.fail = False
+        assert writer.retry_failed() == 0
+        assert gateway.batches == [["a"]]
+        assert writer.failed_rows() == []
+    finally:
+        writer.close()
+
+
+def test_buffered_sheet_service_returns_before_slow_sheet_write(tmp_path):
+    release = threading.Event()
+
+    class SlowGateway(RecordingGateway):
+        def append_rows(self, rows) -> None:
+            release.wait(2)
+            super().append_rows(rows)
+
+    gateway = SlowGateway()
+    service = CsvSheetService(tmp_path / "log.csv", sheet_gateway=gateway, buffer_max_rows=50, buffer_max_delay_ms=5)
+    started = time.perf_counter()
+    service.register(_job("job-1"), tmp_path / "job-1.zip")
+    service.record_job_statuses([_job("job-2"), _job("job-3")])
+    assert time.perf_counter() - started < 0.5
+
+    release.set()
+    assert service.close(timeout=5)
+    lines = (tmp_path / "log.csv").read_text(encoding="utf-8").splitlines()
+    assert [line.split(",")[0] for line in lines[1:]] == ["job-1", "job-2", "job-3"]
+    assert gateway.batches == [["job-1"]]
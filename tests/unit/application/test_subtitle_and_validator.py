@@ -27,9 +27,10 @@ def test_subtitle_formatter_wraps_text_into_allowed_lines() -> None:
 
     srt = formatter.to_srt(segments, profile)
     assert "1" in srt.splitlines()[0]
-    lines = [line for line in srt.splitlines() if line and "-->" not in line and not line.isdigit()]
-    assert all(len(line) <= 12 for line in lines)
-    assert len(lines) <= 2
+    cues = [block.splitlines()[2:] for block in srt.strip().split("\n\n")]
+    assert all(len(line) <= 12 for lines in cues for line in lines)
+    assert all(len(lines) <= 2 for lines in cues)
+    assert " ".join(line for lines in cues for line in lines) == "This subtitle line should wrap nicely"
 
     vtt = formatter.to_vtt(segments, profile)
     assert vtt.startswith("WEBVTT")
@@ -45,3 +45,25 @@ def test_format_timestamp_includes_milliseconds() -> None:
 
     assert "00:00:01,234" in output
     assert "00:00:02,345" in output
+
+
+def test_write_all_renders_every_format_from_one_pass(monkeypatch) -> None:
+    import io
+
+    formatter = SubtitleFormatter()
+    profile = _profile(max_chars=24, max_lines=2)
+    segments = [
+        Segment(id=1, start=0.0, end=1.5, text="primeira legenda longa", speaker=None),
+        Segment(id=2, start=1.5, end=3.0, text="", speaker=None),
+    ]
+    expected = (formatter.to_srt(segments, profile), formatter.to_vtt(segments, profile))
+    wraps = []
+    original_wrap = formatter._wrap_text
+    monkeypatch.setattr(formatter, "_wrap_text", lambda *args: wraps.append(args) or original_wrap(*args))
+    handles = {"srt": io.StringIO(), "vtt": io.StringIO()}
+
+    formatter.write_all(segments, profile, handles)
+
+    assert (handles["srt"].getvalue(), handles["vtt"].getvalue()) == expected
+    assert len(wraps) == len(segments)
+    assert expected[1].startswith("WEBVTT\n\n00:00:00,000 --> 00:00:01,500\n")
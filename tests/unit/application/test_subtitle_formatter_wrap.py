@@ -5,7 +5,7 @@ from domain.entities.profile import Profile
 from domain.entities.transcription import Segment
 
 
-def test_wrap_text_truncates_excess_lines() -> None:
+def test_wrap_text_splits_excess_lines_into_timed_cues() -> None:
     formatter = SubtitleFormatter()
     profile = Profile(
         id="p",
@@ -16,7 +16,12 @@ def test_wrap_text_truncates_excess_lines() -> None:
 
     output = formatter.to_srt(segments, profile)
 
-    # ensure at most 2 lines and truncated width
-    lines = [line for line in output.splitlines() if line and not line.isdigit() and "-->" not in line]
-    assert len(lines) <= 2
-    assert all(len(line) <= 5 for line in lines)
+    blocks = [block.splitlines() for block in output.strip().split("\n\n")]
+    assert [block[1] for block in blocks] == [
+        "00:00:00,000 --> 00:00:00,500",
+        "00:00:00,500 --> 00:00:01,000",
+    ]
+    cue_lines = [block[2:] for block in blocks]
+    assert all(len(lines) <= 2 and all(len(line) <= 5 for line in lines) for lines in cue_lines)
+    # no text is dropped
+    assert "".join(line for lines in cue_lines for line in lines) == "abcdefghijkl"
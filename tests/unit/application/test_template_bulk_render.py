@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from application.services.artifact_builder import FilesystemArtifactBuilder
+from application.services.delivery_template_service import DeliveryTemplateRegistry
+from application.services.subtitle_formatter import SubtitleFormatter
+from application.services.template_bulk_render import BulkTemplateRenderer, TemplateRenderRequest
+from application.services.validator_service import TranscriptValidator
+from domain.entities.job import Job
+from domain.entities.transcription import PostEditResult
+from domain.entities.value_objects import ArtifactType
+from infrastructure.database.transcription_store import FilesystemTranscriptionStore
+from tests.support import stubs
+from tests.support.domain import StubProfileProvider
+
+
+def _renderer(tmp_path: Path, repo: stubs.MemoryJobRepository, store=None) -> BulkTemplateRenderer:
+    templates = tmp_path / "templates"
+    (templates / "en").mkdir(parents=True)
+    (templates / "default.template.txt").write_text("PADRAO {{transcript}}", encoding="utf-8")
+    (templates / "branded.template.txt").write_text("ACME {{job_id}}: {{transcript}}", encoding="utf-8")
+    (templates / "en" / "branded.template.txt").write_text("ACME EN {{transcript}}", encoding="utf-8")
+    builder = FilesystemArtifactBuilder(
+        tmp_path / "out",
+        SubtitleFormatter(),
+        TranscriptValidator(),
+        template_registry=DeliveryTemplateRegistry(templates),
+    )
+    return BulkTemplateRenderer(repo, StubProfileProvider(translate=False), builder, transcription_store=store, max_workers=2)
+
+
+def test_bulk_render_uses_checkpoint_and_json_artifact_in_request_order(tmp_path: Path) -> None:
+    repo = stubs.MemoryJobRepository()
+    store = FilesystemTranscriptionStore(tmp_path / "checkpoints")
+    checkpointed = repo.create(Job(id="job-a", source_path=tmp_path / "a.wav", profile_id="geral"))
+    store.save_post_edit("job-a", checkpointed.version, PostEditResult(text="texto a", segments=[], language="pt"))
+    json_path = tmp_path / "job-b.json"
+    json_path.write_text(json.dumps({"text": "texto b", "language": "pt", "flags": []}), encoding="utf-8")
+    repo.create(
+        Job(
+            id="job-b",
+            source_path=tmp_path / "b.wav",
+            profile_id="geral",
+            output_paths={ArtifactType.STRUCTURED_JSON: json_path},
+        )
+    )
+    renderer = _renderer(tmp_path, repo, store)
+
+    results = list(
+        renderer.render_many(
+            [
+                TemplateRenderRequest("job-a", "branded"),
+                TemplateRenderRequest("job-b", "branded", "en-US"),
+                TemplateRenderRequest("job-a"),
+                TemplateRenderRequest("job-x", "branded"),
+            ]
+        )
+    )
+
+    assert [result["job_id"] for result in results] == ["job-a", "job-b", "job-a", "job-x"]
+    assert results[0]["rendered"] == "ACME job-a: texto a\n"
+    assert results[1]["rendered"] == "ACME EN texto b\n"
+    assert results[2]["rendered"] == "PADRAO texto a\n"
+    assert results[3] == {"job_id": "job-x", "template_id": "branded", "locale": None, "error": "job_not_found"}
+
+
+def test_bulk_render_reports_jobs_without_post_edit_result(tmp_path: Path) -> None:
+    repo = stubs.MemoryJobRepository()
+    repo.create(Job(id="job-empty", source_path=tmp_path / "e.wav", profile_id="geral"))
+
+    results = list(_renderer(tmp_path, repo).render_many([TemplateRenderRequest("job-empty")]))
+
+    assert results[0]["error"] == "post_edit_result_missing"
+    assert "rendered" not in results[0]
+
+
+class _CountingRepository(stubs.MemoryJobRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups: list = []
+
+    def find_by_id(self, job_id: str):
+        self.lookups.append(("find_by_id", job_id))
+        return super().find_by_id(job_id)
+
+    def find_many(self, job_ids):
+        self.lookups.append(("find_many", list(job_ids)))
+        return [job for job in map(super().find_by_id, job_ids) if job]
+
+
+def test_bulk_render_loads_all_requested_jobs_in_one_lookup(tmp_path: Path) -> None:
+    repo = _CountingRepository()
+    store = FilesystemTranscriptionStore(tmp_path / "checkpoints")
+    job = repo.create(Job(id="job-a", source_path=tmp_path / "a.wav", profile_id="geral"))
+    store.save_post_edit("job-a", job.version, PostEditResult(text="texto a", segments=[], language="pt"))
+
+    results = list(
+        _renderer(tmp_path, repo, store).render_many(
+            [TemplateRenderRequest("job-a"), TemplateRenderRequest("job-a", "branded"), TemplateRenderRequest("job-x")]
+        )
+    )
+
+    assert repo.lookups == [("find_many", ["job-a", "job-x"])]
+    assert [result.get("rendered") for result in results] == ["PADRAO texto a\n", "ACME job-a: texto a\n", None]
+    assert results[2]["error"] == "job_not_found"
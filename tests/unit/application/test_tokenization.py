@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import random
+import re
+import unicodedata
+from typing import List
+
+from application.services import tokenization
+from application.services.accuracy_service import TranscriptionAccuracyGuard
+from application.services.tokenization import TokenCache, tokenize
+from domain.entities.transcription import PostEditResult, Segment, TranscriptionResult
+from tests.support import stubs
+
+
+def legacy_tokenize(text: str) -> List[str]:
+    normalized = unicodedata.normalize("NFKD", text or "").casefold()
+    normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
+    cleaned = re.sub(r"[^a-z0-9\s]", " ", normalized)
+    return [token for token in cleaned.split() if token]
+
+
+def test_tokenize_matches_legacy_on_known_samples():
+    samples = [
+        "",
+        "Olá, Mundo!",
+        "AÇÃO   não\tÉ\nfácil",
+        "İstanbul straße ﬁnal",
+        "preço: R$ 10,50 — 100%",
+        "emoji 😀 e espaço largo",
+        "tabs\x1cand\x1fseparators",
+    ]
+    for sample in samples:
+        assert tokenize(sample) == legacy_tokenize(sample)
+
+
+def test_tokenize_matches_legacy_on_random_text():
+    rng = random.Random(3)
+    alphabet = "abcXYZ019 .,?!\t\nçãéÀÕüßİﬁ́ "
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        if rng.random() < 0.3:
+            text += chr(rng.randint(0x80, 0x2FFFF))
+        assert tokenize(text) == legacy_tokenize(text)
+
+
+def test_token_cache_tokenizes_each_text_once(monkeypatch):
+    calls: List[str] = []
+    original = tokenization.tokenize
+
+    def tracked(text: str) -> List[str]:
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(tokenization, "tokenize", tracked)
+    cache = TokenCache()
+
+    assert cache.tokens("um texto") == ["um", "texto"]
+    assert cache.tokens("um texto") == ["um", "texto"]
+    assert cache.tokens(None) == []  # type: ignore[arg-type]
+
+    assert calls == ["um texto", ""]
+
+
+def test_guard_tokenizes_post_edit_text_once_per_evaluation(monkeypatch):
+    calls: List[str] = []
+    original = tokenization.tokenize
+
+    def tracked(text: str) -> List[str]:
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(tokenization, "tokenize", tracked)
+    guard = TranscriptionAccuracyGuard(stubs.MemoryJobRepository(), stubs.MemoryLogRepository())
+    transcription = TranscriptionResult(text="ola mundo ruim", segments=[], language="pt")
+    post_edit = PostEditResult(
+        text="ola mundo perfeito",
+        segments=[Segment(id=1, start=0, end=1, text="ola mundo perfeito", confidence=0.95)],
+    )
+
+    payload = guard._calculate_score(transcription, post_edit, reference_text="ola mundo perfeito")
+
+    assert calls.count("ola mundo perfeito") == 1
+    assert calls.count("ola mundo ruim") == 1
+    assert payload["reference_source"] == "client_reference"
@@ -141,3 +141,28 @@ def test_run_chunked_ignores_remove_errors(monkeypatch, tmp_path: Path) -> None:
     result = service.run(job, profile)
 
     assert result.metadata["chunked"] is True
+
+
+def test_run_chunked_streams_offset_chunks(monkeypatch, tmp_path: Path) -> None:
+    def _chunker_split(_path: Path) -> List[AudioChunk]:
+        chunks = []
+        for idx in range(2):
+            p = tmp_path / f"stream{idx}.wav"
+            p.write_bytes(b"c")
+            chunks.append(AudioChunk(path=p, start_sec=float(idx * 10), duration_sec=10.0))
+        return chunks
+
+    client = _FakeClient({"text": "part", "segments": [{"start": 1.0, "end": 2.0, "text": "seg"}], "duration": 10.0})
+    service = WhisperService(
+        engine_clients={EngineType.OPENAI.value: client},
+        retry_executor=_SimpleRetry(),
+        chunker=type("Chunker", (), {"split": staticmethod(_chunker_split)}),
+    )
+    monkeypatch.setattr(service, "_should_chunk", lambda _p: True)
+    received: List[TranscriptionResult] = []
+
+    result = service.run(_job(tmp_path), Profile(id="p", meta={}, prompt_body=""), on_chunk=received.append)
+
+    assert [chunk.metadata["chunk_index"] for chunk in received] == [0, 1]
+    assert [chunk.segments[0].start for chunk in received] == [1.0, 11.0]
+    assert [segment.start for segment in result.segments] == [1.0, 11.0]
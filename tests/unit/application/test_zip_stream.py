@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import io
+import os
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from application.services.zip_stream import StreamingZipWriter, choose_method, fits_zip32, plan_members
+
+
+def _files(tmp_path: Path) -> list[tuple[Path, str]]:
+    transcript = tmp_path / "job_v1.txt"
+    transcript.write_text("linha de transcricao repetida\n" * 2000, encoding="utf-8")
+    subtitle = tmp_path / "job_v1.srt"
+    subtitle.write_text("1\n00:00:00,000 --> 00:00:01,000\nOla\n\n" * 500, encoding="utf-8")
+    audio = tmp_path / "job_v1.mp3"
+    audio.write_bytes(os.urandom(4096))
+    tiny = tmp_path / "job_v1.json"
+    tiny.write_text('{"a": 1}', encoding="utf-8")
+    return [(path, f"job/{path.name}") for path in (transcript, subtitle, audio, tiny)]
+
+
+def _archive(members, workers: int, level: int = 6) -> bytes:
+    buffer = io.BytesIO()
+    writer = StreamingZipWriter(buffer, compression_level=level, max_workers=workers)
+    writer.write_members(members)
+    writer.close()
+    return buffer.getvalue()
+
+
+def test_streamed_archive_is_valid_and_picks_method_per_member(tmp_path: Path) -> None:
+    files = _files(tmp_path)
+    members = plan_members(files)
+
+    with ZipFile(io.BytesIO(_archive(members, workers=1))) as archive:
+        assert archive.testzip() is None
+        infos = {info.filename: info for info in archive.infolist()}
+        assert infos["job/job_v1.txt"].compress_type == ZIP_DEFLATED
+        assert infos["job/job_v1.srt"].compress_type == ZIP_DEFLATED
+        assert infos["job/job_v1.mp3"].compress_type == ZIP_STORED
+        assert infos["job/job_v1.json"].compress_type == ZIP_STORED
+        for path, arcname in files:
+            assert archive.read(arcname) == path.read_bytes()
+
+
+def test_parallel_compression_produces_identical_content(tmp_path: Path) -> None:
+    members = plan_members(_files(tmp_path))
+
+    serial = ZipFile(io.BytesIO(_archive(members, workers=1)))
+    parallel = ZipFile(io.BytesIO(_archive(members, workers=4)))
+
+    assert parallel.testzip() is None
+    assert [info.filename for info in parallel.infolist()] == [info.filename for info in serial.infolist()]
+    for info in serial.infolist():
+        assert parallel.read(info.filename) == serial.read(info.filename)
+        assert parallel.getinfo(info.filename).CRC == info.CRC
+
+
+def test_compression_level_trades_size(tmp_path: Path) -> None:
+    members = plan_members(_files(tmp_path))
+
+    assert len(_archive(members, workers=1, level=0)) > len(_archive(members, workers=1, level=9))
+
+
+def test_choose_method_and_zip32_guard(tmp_path: Path) -> None:
+    assert choose_method(Path("a.txt"), 10) == ZIP_STORED
+    assert choose_method(Path("a.TXT"), 10_000) == ZIP_DEFLATED
+    assert choose_method(Path("a.m4a"), 10_000) == ZIP_STORED
+    members = plan_members(_files(tmp_path))
+    assert fits_zip32(members)
+    huge = [members[0].__class__(m.path, m.arcname, m.method, 2**32, m.mtime) for m in members[:1]]
+    assert not fits_zip32(huge)
+
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self) -> None:
+        self.buffer = io.BytesIO()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return self.buffer.write(data)
+
+
+def test_stored_members_are_read_once_and_described_in_place_or_after(tmp_path: Path, monkeypatch) -> None:
+    members = plan_members(_files(tmp_path))
+    opened: list[str] = []
+    original_open = Path.open
+
+    def counting_open(self, *args, **kwargs):
+        opened.append(self.name)
+        return original_open(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "open", counting_open)
+    seekable = ZipFile(io.BytesIO(_archive(members, workers=1)))
+    assert opened.count("job_v1.mp3") == 1
+    # On a seekable handle CRC and sizes are patched into the local header.
+    assert not seekable.getinfo("job/job_v1.mp3").flag_bits & 0x08
+
+    handle = _Unseekable()
+    writer = StreamingZipWriter(handle)
+    writer.write_members(members)
+    writer.close()
+    streamed = ZipFile(io.BytesIO(handle.buffer.getvalue()))
+    assert streamed.testzip() is None
+    assert streamed.getinfo("job/job_v1.mp3").flag_bits & 0x08
+    assert streamed.read("job/job_v1.mp3") == seekable.read("job/job_v1.mp3")
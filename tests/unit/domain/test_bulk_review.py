@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+from application.services.package_service import ZipPackageService
+from application.services.sheet_service import CsvSheetService
+from application.services.status_publisher import SheetStatusPublisher
+from domain.entities.artifact import Artifact
+from domain.entities.delivery_record import DeliveryRecord
+from domain.entities.job import Job
+from domain.entities.value_objects import ArtifactType, EngineType, JobStatus
+from domain.usecases.bulk_review import BulkReviewDelivery, BulkReviewInput
+from domain.usecases.register_delivery import RegisterDelivery
+from infrastructure.database.job_repository import FileJobRepository
+from infrastructure.database.log_repository import FileLogRepository
+from infrastructure.database.review_repository import FileReviewRepository
+
+
+class InMemoryArtifactRepository:
+    def __init__(self, artifacts) -> None:
+        self.artifacts = artifacts
+
+    def list_by_job(self, job_id: str):
+        return [artifact for artifact in self.artifacts if artifact.job_id == job_id]
+
+
+class CountingJobRepository(FileJobRepository):
+    def __init__(self, storage_path: Path) -> None:
+        super().__init__(storage_path)
+        self.calls = []
+
+    def find_by_id(self, job_id: str):
+        self.calls.append("find_by_id")
+        return super().find_by_id(job_id)
+
+    def find_many(self, job_ids):
+        self.calls.append("find_many")
+        return super().find_many(job_ids)
+
+    def update(self, job: Job) -> Job:
+        self.calls.append("update")
+        return super().update(job)
+
+    def update_many(self, jobs) -> None:
+        self.calls.append("update_many")
+        super().update_many(jobs)
+
+
+class BatchDeliveryClient:
+    def __init__(self) -> None:
+        self.batches = []
+
+    def submit_package(self, job: Job, package_path: Path) -> DeliveryRecord:
+        raise AssertionError("submit_batch should be used")
+
+    def submit_batch(self, items):
+        self.batches.append([job.id for job, _ in items])
+        return [
+            DeliveryRecord(job_id=job.id, integration="gotranscript", status="received", external_id=f"ext-{job.id}")
+            for job, _ in items
+        ]
+
+
+def _build(tmp_path: Path, job_ids, with_artifacts):
+    job_repository = CountingJobRepository(tmp_path / "jobs.json")
+    artifacts = []
+    for job_id in job_ids:
+        job_repository.create(
+            Job(
+                id=job_id,
+                source_path=tmp_path / f"{job_id}.wav",
+                profile_id="geral",
+                engine=EngineType.OPENAI,
+                status=JobStatus.AWAITING_REVIEW,
+            )
+        )
+        if job_id in with_artifacts:
+            path = tmp_path / "output" / job_id / f"{job_id}.txt"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(f"transcricao {job_id} " * 200, encoding="utf-8")
+            artifacts.append(Artifact(id=f"art-{job_id}", job_id=job_id, artifact_type=ArtifactType.TRANSCRIPT_TXT, path=path))
+    job_repository.calls.clear()
+    sheet = CsvSheetService(tmp_path / "log.csv")
+    log_repository = FileLogRepository(tmp_path / "logs.json")
+    client = BatchDeliveryClient()
+    register = RegisterDelivery(
+        job_repository=job_repository,
+        artifact_repository=InMemoryArtifactRepository(artifacts),
+        package_service=ZipPackageService(tmp_path / "backup"),
+        delivery_logger=sheet,
+        log_repository=log_repository,
+        delivery_client=client,
+    )
+    use_case = BulkReviewDelivery(
+        job_repository=job_repository,
+        review_repository=FileReviewRepository(tmp_path / "reviews.json"),
+        log_repository=log_repository,
+        status_publisher=SheetStatusPublisher(sheet),
+        register_delivery=register,
+        package_workers=2,
+    )
+    return use_case, job_repository, client, log_repository
+
+
+def test_bulk_review_approves_packages_and_submits_in_batches(tmp_path):
+    use_case, job_repository, client, log_repository = _build(tmp_path, ["a", "b", "c"], with_artifacts={"a", "c"})
+
+    summary = use_case.execute(BulkReviewInput(job_ids=["a", "b", "missing", "c"], reviewer="ana", notes="ok"))
+
+    assert [outcome.job_id for outcome in summary.outcomes] == ["a", "b", "missing", "c"]
+    assert job_repository.calls == ["find_many", "update_many"]
+    assert all(job.status == JobStatus.APPROVED for job in job_repository.find_many(["a", "b", "c"]))
+    assert client.batches == [["a", "c"]]
+    assert summary.outcomes[0].delivery.external_id == "ext-a"
+    assert summary.outcomes[1].error == "Nenhum artefato disponivel para empacotar."
+    assert summary.outcomes[2].error == "Job missing nao encontrado"
+    with zipfile.ZipFile(summary.outcomes[3].package_path) as archive:
+        assert archive.namelist() == ["c/c.txt"]
+        assert archive.testzip() is None
+
+    rows = (tmp_path / "log.csv").read_text(encoding="utf-8").splitlines()
+    # header + three status rows + two delivery rows
+    assert len(rows) == 6
+    events = [entry.event for entry in log_repository.list_by_job("a")]
+    assert events == ["review_completed", "delivery_package_created", "delivery_external_submitted"]
+    assert len(FileReviewRepository(tmp_path / "reviews.json")._load_all()) == 3
+
+
+def test_bulk_review_adjustment_skips_delivery(tmp_path):
+    use_case, job_repository, client, _ = _build(tmp_path, ["a"], with_artifacts={"a"})
+
+    summary = use_case.execute(BulkReviewInput(job_ids=["a"], reviewer="ana", approved=False))
+
+    assert summary.outcomes[0].status == JobStatus.ADJUSTMENTS_REQUIRED.value
+    assert summary.outcomes[0].package_path is None
+    assert client.batches == []
+    assert not (tmp_path / "backup" / "a").exists()
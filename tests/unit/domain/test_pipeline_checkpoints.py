@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from domain.entities.artifact import Artifact
+from domain.entities.job import Job
+from domain.entities.value_objects import ArtifactType, JobStatus
+from domain.usecases.pipeline import ProcessJobPipeline
+from domain.usecases.post_edit import PostEditTranscript
+from domain.usecases.retry_or_reject import RetryDecision, RetryOrRejectJob
+from domain.usecases.run_asr import RunAsrPipeline
+from infrastructure.database.transcription_store import FilesystemTranscriptionStore
+from tests.support import stubs
+from tests.support.domain import StubProfileProvider
+
+
+class CountingAsrService(stubs.StubAsrService):
+    def __init__(self) -> None:
+        super().__init__("ola mundo")
+        self.calls = 0
+
+    def run(self, job, profile, task="transcribe"):
+        self.calls += 1
+        return super().run(job, profile, task)
+
+
+class CountingPostEditService(stubs.StubPostEditService):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def run(self, job, profile, transcription):
+        self.calls += 1
+        return super().run(job, profile, transcription)
+
+
+class FlakyArtifactUseCase:
+    def __init__(self, tmp_path: Path, failures: int = 1) -> None:
+        self.tmp_path = tmp_path
+        self.failures = failures
+        self.received = []
+
+    def execute(self, job_id, post_edit):
+        self.received.append(post_edit.text)
+        if self.failures:
+            self.failures -= 1
+            raise OSError("disco cheio")
+        path = self.tmp_path / f"{job_id}.txt"
+        path.write_text(post_edit.text, encoding="utf-8")
+        return [Artifact(id="a1", job_id=job_id, artifact_type=ArtifactType.TRANSCRIPT_TXT, path=path)]
+
+
+def _build(tmp_path: Path, resume: bool = True, failures: int = 1):
+    repo = stubs.MemoryJobRepository()
+    repo.create(Job(id="job-1", source_path=tmp_path / "a.wav", profile_id="geral"))
+    log_repo = stubs.MemoryLogRepository()
+    store = FilesystemTranscriptionStore(tmp_path / "checkpoints")
+    profiles = StubProfileProvider(translate=False)
+    asr_service = CountingAsrService()
+    post_edit_service = CountingPostEditService()
+    artifacts = FlakyArtifactUseCase(tmp_path, failures=failures)
+    pipeline = ProcessJobPipeline(
+        RunAsrPipeline(repo, profiles, asr_service, log_repo, transcription_store=store),
+        PostEditTranscript(repo, profiles, post_edit_service, log_repo, transcription_store=store),
+        artifacts,
+        log_repo,
+        retry_handler=RetryOrRejectJob(repo, log_repo, transcription_store=store),
+        allow_retry=True,
+        resume=resume,
+    )
+    return pipeline, repo, log_repo, asr_service, post_edit_service, artifacts
+
+
+def test_requeued_job_resumes_from_failed_stage(tmp_path):
+    pipeline, repo, log_repo, asr_service, post_edit_service, artifacts = _build(tmp_path)
+
+    with pytest.raises(OSError):
+        pipeline.execute("job-1")
+    assert repo.find_by_id("job-1").version == 2
+
+    result = pipeline.execute("job-1")
+
+    assert [artifact.artifact_type for artifact in result] == [ArtifactType.TRANSCRIPT_TXT]
+    assert asr_service.calls == 1
+    assert post_edit_service.calls == 1
+    assert artifacts.received == ["OLA MUNDO", "OLA MUNDO"]
+    events = [entry.event for entry in log_repo.entries]
+    assert "stage_checkpoints_carried" in events
+    assert events.count("asr_resumed") == 1
+    assert events.count("post_edit_resumed") == 1
+    job = repo.find_by_id("job-1")
+    assert job.language == "pt"
+    assert job.status == JobStatus.POST_EDITING
+
+
+def test_resume_disabled_reruns_every_stage(tmp_path):
+    pipeline, _, _, asr_service, post_edit_service, _ = _build(tmp_path, resume=False)
+
+    with pytest.raises(OSError):
+        pipeline.execute("job-1")
+    pipeline.execute("job-1")
+
+    assert asr_service.calls == 2
+    assert post_edit_service.calls == 2
+
+
+def test_manual_requeue_does_not_carry_checkpoints(tmp_path):
+    pipeline, repo, _, asr_service, _, _ = _build(tmp_path, failures=0)
+    pipeline.execute("job-1")
+
+    pipeline.retry_handler.execute(RetryDecision(job_id="job-1", error_message="reprocessar"))
+    pipeline.execute("job-1")
+
+    assert repo.find_by_id("job-1").version == 2
+    assert asr_service.calls == 2
+
+
+def test_reprocessing_a_completed_job_runs_the_engines_again(tmp_path):
+    pipeline, repo, log_repo, asr_service, post_edit_service, _ = _build(tmp_path, failures=1)
+    with pytest.raises(OSError):
+        pipeline.execute("job-1")
+    pipeline.execute("job-1")  # the requeued run resumes once
+    assert (asr_service.calls, post_edit_service.calls) == (1, 1)
+
+    pipeline.execute("job-1")
+
+    assert repo.find_by_id("job-1").version == 2
+    assert (asr_service.calls, post_edit_service.calls) == (2, 2)
+    assert [entry.event for entry in log_repo.entries].count("asr_resumed") == 1
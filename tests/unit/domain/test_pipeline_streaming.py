@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import threading
+
+from domain.entities.job import Job
+from domain.entities.transcription import PostEditResult, Segment, TranscriptionResult
+from domain.usecases.pipeline import ProcessJobPipeline
+from domain.usecases.post_edit import PostEditTranscript, merge_post_edit_results
+from domain.usecases.run_asr import RunAsrPipeline
+from tests.support import stubs
+from tests.support.domain import StubProfileProvider
+
+
+class ChunkedAsrService:
+    """Emits three chunks and only finishes once the first one has been post-edited."""
+
+    def __init__(self, first_chunk_edited: threading.Event) -> None:
+        self.first_chunk_edited = first_chunk_edited
+        self.overlapped = False
+
+    def run(self, job, profile, task="transcribe", on_chunk=None):
+        segments = []
+        for index in range(3):
+            chunk = TranscriptionResult(
+                text=f"parte {index}",
+                segments=[Segment(id=0, start=index * 10.0, end=index * 10.0 + 5, text=f"parte {index}")],
+                language="pt",
+                metadata={"chunk_index": index},
+            )
+            segments.extend(chunk.segments)
+            if on_chunk:
+                on_chunk(chunk)
+            if index == 0 and on_chunk:
+                self.overlapped = self.first_chunk_edited.wait(timeout=5)
+        return TranscriptionResult(
+            text="parte 0 parte 1 parte 2", segments=segments, language="pt", metadata={"chunked": True, "chunk_count": 3}
+        )
+
+
+class SignallingPostEditService(stubs.StubPostEditService):
+    def __init__(self, first_chunk_edited: threading.Event) -> None:
+        self.first_chunk_edited = first_chunk_edited
+        self.inputs = []
+
+    def run(self, job, profile, transcription):
+        self.inputs.append(transcription.text)
+        result = super().run(job, profile, transcription)
+        self.first_chunk_edited.set()
+        return result
+
+
+class CollectingArtifacts:
+    def __init__(self) -> None:
+        self.post_edit = None
+
+    def execute(self, job_id, post_edit):
+        self.post_edit = post_edit
+        return []
+
+
+def _pipeline(streaming: bool):
+    repo = stubs.MemoryJobRepository()
+    repo.create(Job(id="job-1", source_path="inbox/a.wav", profile_id="geral"))
+    log_repo = stubs.MemoryLogRepository()
+    profiles = StubProfileProvider(translate=False)
+    edited = threading.Event()
+    asr_service = ChunkedAsrService(edited)
+    post_edit_service = SignallingPostEditService(edited)
+    artifacts = CollectingArtifacts()
+    pipeline = ProcessJobPipeline(
+        RunAsrPipeline(repo, profiles, asr_service, log_repo),
+        PostEditTranscript(repo, profiles, post_edit_service, log_repo),
+        artifacts,
+        log_repo,
+        streaming=streaming,
+    )
+    return pipeline, asr_service, post_edit_service, artifacts
+
+
+def test_streaming_pipeline_overlaps_post_edit_with_asr():
+    pipeline, asr_service, post_edit_service, artifacts = _pipeline(streaming=True)
+
+    pipeline.execute("job-1")
+
+    assert asr_service.overlapped is True
+    assert post_edit_service.inputs == ["parte 0", "parte 1", "parte 2"]
+    assert artifacts.post_edit.text == "PARTE 0 PARTE 1 PARTE 2"
+    assert [(segment.id, segment.start) for segment in artifacts.post_edit.segments] == [(0, 0.0), (1, 10.0), (2, 20.0)]
+
+
+def test_serial_pipeline_post_edits_whole_transcript():
+    pipeline, asr_service, post_edit_service, artifacts = _pipeline(streaming=False)
+
+    pipeline.execute("job-1")
+
+    assert asr_service.overlapped is False
+    assert post_edit_service.inputs == ["parte 0 parte 1 parte 2"]
+    assert artifacts.post_edit.text == "PARTE 0 PARTE 1 PARTE 2"
+
+
+def test_merge_post_edit_results_keeps_first_language_and_all_flags():
+    merged = merge_post_edit_results(
+        [
+            PostEditResult(text="a ", segments=[Segment(id=7, start=0.0, end=1.0, text="a")], flags=[{"t": "1"}]),
+            PostEditResult(
+                text="b", segments=[Segment(id=0, start=1.0, end=2.0, text="b")], flags=[{"t": "2"}], language="en"
+            ),
+        ],
+        fallback_language="pt",
+    )
+
+    assert merged.text == "a b"
+    assert [segment.id for segment in merged.segments] == [0, 1]
+    assert merged.flags == [{"t": "1"}, {"t": "2"}]
+    assert merged.language == "en"
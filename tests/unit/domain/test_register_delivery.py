@@ -175,3 +175,74 @@ def test_register_delivery_enforces_existing_job(tmp_path):
 
     with pytest.raises(ValueError):
         use_case.execute("missing")
+
+
+class BatchDeliveryClient(DummyDeliveryClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = []
+
+    def submit_batch(self, items):
+        self.batches.append([job.id for job, _ in items])
+        return [self.submit_package(job, path) for job, path in items]
+
+
+def test_register_delivery_execute_many_submits_single_batch(tmp_path):
+    jobs = {
+        job_id: Job(
+            id=job_id,
+            source_path=tmp_path / f"{job_id}.wav",
+            profile_id="geral",
+            status=status,
+            engine=EngineType.OPENAI,
+        )
+        for job_id, status in (("job-a", JobStatus.APPROVED), ("job-b", JobStatus.PENDING), ("job-c", JobStatus.APPROVED))
+    }
+
+    class MultiJobRepository:
+        def find_by_id(self, job_id: str):
+            return jobs.get(job_id)
+
+    artifact = Artifact(id="art", job_id="job-a", artifact_type=ArtifactType.TRANSCRIPT_TXT, path=tmp_path / "file.txt")
+    artifact.path.write_text("conteudo", encoding="utf-8")
+    log_repo = InMemoryLogRepository()
+    delivery_client = BatchDeliveryClient()
+    use_case = RegisterDelivery(
+        job_repository=MultiJobRepository(),
+        artifact_repository=InMemoryArtifactRepository([artifact]),
+        package_service=DummyPackageService(tmp_path / "pkg.zip"),
+        delivery_logger=RecordingDeliveryLogger(),
+        log_repository=log_repo,
+        delivery_client=delivery_client,
+    )
+
+    records = use_case.execute_many(["job-a", "job-b", "job-c"])
+
+    assert [record.job_id for record in records] == ["job-a", "job-b", "job-c"]
+    assert delivery_client.batches == [["job-a", "job-c"]]
+    assert records[1].status == "failed" and records[1].integration == "package"
+    assert [entry.job_id for entry in log_repo.entries if entry.event == "delivery_external_submitted"] == ["job-a", "job-c"]
+
+
+def test_register_delivery_execute_many_without_client_reports_packages(tmp_path):
+    job = Job(
+        id="job-1",
+        source_path=tmp_path / "audio.wav",
+        profile_id="geral",
+        status=JobStatus.APPROVED,
+        engine=EngineType.OPENAI,
+    )
+    artifact = Artifact(id="art", job_id=job.id, artifact_type=ArtifactType.TRANSCRIPT_TXT, path=tmp_path / "file.txt")
+    artifact.path.write_text("conteudo", encoding="utf-8")
+    use_case = RegisterDelivery(
+        job_repository=InMemoryJobRepository(job),
+        artifact_repository=InMemoryArtifactRepository([artifact]),
+        package_service=DummyPackageService(tmp_path / "pkg.zip"),
+        delivery_logger=RecordingDeliveryLogger(),
+        log_repository=InMemoryLogRepository(),
+    )
+
+    records = use_case.execute_many([job.id])
+
+    assert records[0].status == "packaged"
+    assert records[0].message == str(tmp_path / "pkg.zip")
@@ -62,3 +62,39 @@ def test_run_asr_pipeline_marks_failure_on_exception() -> None:
     assert repo.job.status == JobStatus.FAILED
     assert repo.job.notes == "falha ASR"
     assert ("asr_failed", LogLevel.ERROR) in log_repo.events
+
+
+def test_run_asr_pipeline_persists_raw_result(tmp_path) -> None:
+    from infrastructure.database.transcription_store import FilesystemTranscriptionStore
+
+    job = make_job()
+    job.version = 3
+    repo = TrackingJobRepository(job)
+    store = FilesystemTranscriptionStore(tmp_path / "asr")
+    use_case = RunAsrPipeline(
+        repo, StubProfileProvider(translate=False), ControlledAsrService(), LogRepositorySpy(), transcription_store=store
+    )
+
+    result = use_case.execute(job.id)
+
+    assert store.path_for(job.id, 3).exists()
+    assert use_case.load_result(job.id, 3) == result
+    assert use_case.load_result(job.id, 2) is None
+
+
+def test_run_asr_pipeline_logs_when_persisting_fails() -> None:
+    class BrokenStore:
+        def save(self, job_id, version, result):
+            raise OSError("disk full")
+
+    job = make_job()
+    repo = TrackingJobRepository(job)
+    log_repo = LogRepositorySpy()
+    use_case = RunAsrPipeline(
+        repo, StubProfileProvider(translate=False), ControlledAsrService(), log_repo, transcription_store=BrokenStore()
+    )
+
+    use_case.execute(job.id)
+
+    assert repo.job.status == JobStatus.ASR_COMPLETED
+    assert ("asr_result_persist_failed", LogLevel.WARNING) in log_repo.events
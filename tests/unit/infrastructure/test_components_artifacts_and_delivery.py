@@ -57,3 +57,20 @@ def test_build_delivery_services_no_integrations(tmp_path):
     )
     assert package_service
     assert register_delivery
+
+
+def test_build_storage_client_uses_local_backup_when_s3_disabled(tmp_path):
+    from infrastructure.api.storage_client import LocalStorageClient
+
+    settings = Settings()
+    settings.s3_enabled = False
+    assert components_delivery._build_storage_client(settings) is None
+
+    settings.local_backup_enabled = True
+    settings.local_backup_dir = tmp_path / "mirror"
+    settings.local_backup_allow_hardlinks = True
+    client = components_delivery._build_storage_client(settings)
+
+    assert isinstance(client, LocalStorageClient)
+    assert client.base_dir == tmp_path / "mirror"
+    assert "hardlink" in client.strategies
@@ -45,3 +45,22 @@ def test_file_job_repository_list_recent_order(tmp_path):
 
     recent = repo.list_recent(limit=2)
     assert [job.id for job in recent] == ["job-b", "job-c"]
+
+
+def test_file_job_repository_update_many_single_write(tmp_path, monkeypatch):
+    repo = FileJobRepository(tmp_path / "jobs.json")
+    now = datetime.now(timezone.utc)
+    job_a = repo.create(_make_job("job-a", now))
+    job_b = repo.create(_make_job("job-b", now))
+    saves = []
+    original_save = repo._save_all
+    monkeypatch.setattr(repo, "_save_all", lambda jobs: (saves.append(len(jobs)), original_save(jobs)))
+
+    job_a.metadata = {"accuracy_status": "passing"}
+    job_b.metadata = {"accuracy_status": "needs_review"}
+    repo.update_many([job_a, job_b, _make_job("job-c", now)])
+
+    assert saves == [3]
+    assert repo.find_by_id("job-a").metadata == {"accuracy_status": "passing"}
+    assert repo.find_by_id("job-b").metadata == {"accuracy_status": "needs_review"}
+    assert repo.find_by_id("job-c") is not None
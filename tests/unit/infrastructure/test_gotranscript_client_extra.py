@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
@@ -22,6 +27,60 @@ def _job(tmp_path: Path) -> Job:
     )
 
 
+class _StubDeliveryServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StubDeliveryHandler)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.connections: set = set()
+        self.requests: list[dict] = []
+
+
+class _StubDeliveryHandler(BaseHTTPRequestHandler):
+    """Accepts multipart deliveries; answers 500 for job-2 and keeps connections alive."""
+
+    protocol_version = "HTTP/1.1"
+    server: _StubDeliveryServer
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        match = re.search(rb'name="job_id"\r\n\r\n([^\r]+)', body)
+        job_id = match.group(1).decode() if match else ""
+        with self.server.lock:
+            self.server.active += 1
+            self.server.peak = max(self.server.peak, self.server.active)
+            self.server.connections.add(self.client_address)
+            self.server.requests.append(
+                {"path": self.path, "job_id": job_id, "auth": self.headers.get("Authorization"), "zip": b"PK" in body}
+            )
+        time.sleep(0.05)
+        with self.server.lock:
+            self.server.active -= 1
+        status, payload = (500, {"error": "indisponivel"}) if job_id == "job-2" else (201, {"id": f"ext-{job_id}"})
+        encoded = json.dumps({**payload, "status": "received"}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format, *args) -> None:  # keep pytest output clean
+        pass
+
+
+@pytest.fixture
+def delivery_server():
+    server = _StubDeliveryServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
 def test_init_raises_when_api_key_missing():
     with pytest.raises(ValueError):
         GoTranscriptClient(base_url="http://x", api_key="")
@@ -29,3 +88,83 @@ def test_init_raises_when_api_key_missing():
 
 def test_extract_external_id_returns_none():
     assert _extract_external_id({}) is None
+
+
+def test_submit_batch_keeps_order_bounds_concurrency_and_isolates_failures(tmp_path):
+    import threading
+    import time
+
+    import requests
+
+    client = GoTranscriptClient(base_url="http://x", api_key="key", max_concurrency=2)
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    class DummyResponse:
+        def __init__(self, job_id: str) -> None:
+            self.job_id = job_id
+
+        def raise_for_status(self) -> None:
+            if self.job_id == "job-2":
+                raise requests.HTTPError("500 Server Error")
+
+        def json(self) -> dict:
+            return {"id": f"ext-{self.job_id}", "status": "received"}
+
+    def fake_post(url, headers, data, files, timeout):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return DummyResponse(data["job_id"])
+
+    client.session.post = fake_post  # type: ignore[assignment]
+    items = []
+    for index in range(5):
+        job = _job(tmp_path)
+        job.id = f"job-{index}"
+        package_path = tmp_path / f"{job.id}.zip"
+        package_path.write_bytes(b"zip")
+        items.append((job, package_path))
+
+    records = client.submit_batch(items)
+
+    assert [record.job_id for record in records] == [job.id for job, _ in items]
+    assert records[0].external_id == "ext-job-0"
+    assert records[2].status == "failed"
+    assert "HTTPError" in (records[2].message or "")
+    assert all(record.status == "received" for index, record in enumerate(records) if index != 2)
+    assert 1 < state["peak"] <= 2
+
+
+def test_submit_batch_against_stub_server_reuses_pooled_connections(tmp_path, delivery_server):
+    host, port = delivery_server.server_address
+    client = GoTranscriptClient(base_url=f"http://{host}:{port}/v1/", api_key="key", max_concurrency=2)
+    items = []
+    for index in range(6):
+        job = _job(tmp_path)
+        job.id = f"job-{index}"
+        package_path = tmp_path / f"{job.id}.zip"
+        package_path.write_bytes(b"PK\x03\x04conteudo")
+        items.append((job, package_path))
+
+    records = client.submit_batch(items)
+    client.session.close()
+
+    assert [record.job_id for record in records] == [job.id for job, _ in items]
+    assert records[2].status == "failed" and "500 Server Error" in (records[2].message or "")
+    assert [record.external_id for record in records if record.status == "received"] == [
+        "ext-job-0",
+        "ext-job-1",
+        "ext-job-3",
+        "ext-job-4",
+        "ext-job-5",
+    ]
+    assert len(delivery_server.requests) == 6
+    assert all(request["path"] == "/v1/deliveries" for request in delivery_server.requests)
+    assert all(request["auth"] == "Bearer key" and request["zip"] for request in delivery_server.requests)
+    assert delivery_server.peak == 2
+    # Keep-alive: six submissions from two workers share at most two sockets.
+    assert len(delivery_server.connections) <= 2
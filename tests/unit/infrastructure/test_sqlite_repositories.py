@@ -54,3 +54,63 @@ def test_sqlite_repositories_crud(tmp_path: Path):
     recent = job_repo.list_recent(10)
     assert recent and recent[0].id == "job-1"
     assert isinstance(json.loads(job_repo.conn.execute("SELECT payload FROM jobs").fetchone()[0]), dict)
+
+
+def test_sqlite_job_repository_update_many(tmp_path: Path):
+    job_repo = SqlJobRepository(tmp_path / "tf.db")
+    jobs = [job_repo.create(_make_job(f"job-{idx}")) for idx in range(3)]
+    for job in jobs:
+        job.metadata = {"accuracy_status": "passing"}
+
+    job_repo.update_many(jobs)
+
+    assert all(job_repo.find_by_id(job.id).metadata == {"accuracy_status": "passing"} for job in jobs)
+
+
+def test_sqlite_repositories_batch_reads_and_writes(tmp_path: Path):
+    db_path = tmp_path / "tf.db"
+    job_repo = SqlJobRepository(db_path)
+    for idx in range(3):
+        job_repo.create(_make_job(f"job-{idx}"))
+
+    found = job_repo.find_many(["job-2", "job-0", "missing", "job-0"])
+    assert sorted(job.id for job in found) == ["job-0", "job-2"]
+
+    log_repo = SqlLogRepository(db_path)
+    log_repo.append_many(
+        LogEntry(job_id=f"job-{idx}", event="review_completed", level=LogLevel.INFO, message="ok") for idx in range(3)
+    )
+    assert len(log_repo.list_recent(10)) == 3
+
+    review_repo = SqlReviewRepository(db_path)
+    review_repo.save_many(
+        [UserReview(id=f"r-{idx}", job_id=f"job-{idx}", reviewer="ana", decision=ReviewDecision.APPROVED) for idx in range(2)]
+    )
+    assert review_repo.find_latest("job-1").reviewer == "ana"
+
+
+def test_sqlite_revisions_change_on_every_write_including_other_connections(tmp_path: Path):
+    db_path = tmp_path / "tf.db"
+    job_repo = SqlJobRepository(db_path)
+    log_repo = SqlLogRepository(db_path)
+    before = job_repo.revision()
+    assert job_repo.revision() == before
+
+    SqlJobRepository(db_path).create(_make_job("job-1"))
+    after_create = job_repo.revision()
+    job_repo.update_many([_make_job("job-1"), _make_job("job-2")])
+
+    assert len({before, after_create, job_repo.revision()}) == 3
+    assert log_repo.revision() == "0"
+    log_repo.append_many([LogEntry(job_id="job-1", event="a"), LogEntry(job_id="job-1", event="b")])
+    assert log_repo.revision() == "2"
+
+
+def test_sqlite_upload_index_keeps_latest_job_per_key(tmp_path: Path):
+    from infrastructure.database.sqlite_repositories import SqlUploadIndex
+
+    index = SqlUploadIndex(tmp_path / "tf.db")
+    assert index.find("sha256:aa|geral|openai") is None
+    index.register("sha256:aa|geral|openai", "job-1")
+    index.register("sha256:aa|geral|openai", "job-2")
+    assert SqlUploadIndex(tmp_path / "tf.db").find("sha256:aa|geral|openai") == "job-2"
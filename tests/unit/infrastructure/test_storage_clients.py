@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import os
 import sys
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 
-from infrastructure.api.storage_client import LocalStorageClient, S3StorageClient
+import pytest
+
+from infrastructure.api.storage_client import (
+    MIN_PART_SIZE,
+    BackgroundStorageClient,
+    LocalStorageClient,
+    S3StorageClient,
+)
+from tests.support import stubs
 
 
 def test_local_storage_upload_copies_file(tmp_path):
@@ -41,3 +52,190 @@ def test_s3_storage_client_uses_boto3_stub(monkeypatch, tmp_path):
 
     assert uri == "s3://bkt/pre/folder/file.txt"
     assert uploads == [(str(src), "bkt", "pre/folder/file.txt")]
+
+
+def _s3_client(monkeypatch, fake, **kwargs) -> S3StorageClient:
+    monkeypatch.setitem(sys.modules, "boto3", SimpleNamespace(client=lambda *_args, **_kwargs: fake))
+    return S3StorageClient(bucket="bkt", prefix="pre", **kwargs)
+
+
+def test_s3_multipart_upload_resumes_after_interruption(monkeypatch, tmp_path):
+    fake = stubs.MemoryS3Client(fail_on_part=3)
+    metrics: list[tuple[str, dict]] = []
+    resume_dir = tmp_path / "uploads"
+    client = _s3_client(
+        monkeypatch,
+        fake,
+        multipart_threshold=1,
+        multipart_chunksize=MIN_PART_SIZE,
+        max_concurrency=1,
+        resume_dir=resume_dir,
+        metric_dispatcher=lambda event, payload: metrics.append((event, payload)),
+    )
+    src = tmp_path / "package.zip"
+    payload = os.urandom(MIN_PART_SIZE * 3 + 10)
+    src.write_bytes(payload)
+
+    with pytest.raises(ConnectionError):
+        client.upload(src, "job/package.zip")
+    assert fake.part_calls == [1, 2, 4]  # parts after the failed one still land and are kept
+    assert len(list(resume_dir.glob("*.json"))) == 1
+
+    fake.fail_on_part = None
+    restarted = _s3_client(
+        monkeypatch,
+        fake,
+        multipart_threshold=1,
+        multipart_chunksize=MIN_PART_SIZE,
+        resume_dir=resume_dir,
+        metric_dispatcher=lambda event, payload: metrics.append((event, payload)),
+    )
+    assert restarted.resume_pending() == ["s3://bkt/pre/job/package.zip"]
+
+    assert fake.part_calls == [1, 2, 4, 3]
+    assert fake.objects[("bkt", "pre/job/package.zip")] == payload
+    assert not list(resume_dir.glob("*.json"))
+    assert metrics[-1][1]["reused_parts"] == 3
+
+
+def test_s3_resume_restarts_when_source_changed(monkeypatch, tmp_path):
+    fake = stubs.MemoryS3Client(fail_on_part=2)
+    client = _s3_client(
+        monkeypatch,
+        fake,
+        multipart_threshold=1,
+        multipart_chunksize=MIN_PART_SIZE,
+        max_concurrency=1,
+        resume_dir=tmp_path / "uploads",
+    )
+    src = tmp_path / "package.zip"
+    src.write_bytes(b"a" * (MIN_PART_SIZE + 1))
+    with pytest.raises(ConnectionError):
+        client.upload(src, "package.zip")
+
+    fake.fail_on_part = None
+    src.write_bytes(b"b" * (MIN_PART_SIZE + 5))
+    client.upload(src, "package.zip")
+
+    assert fake.objects[("bkt", "pre/package.zip")] == src.read_bytes()
+    assert fake.uploads == {}
+
+
+def test_background_storage_client_returns_before_upload_and_reports_failures(tmp_path):
+    release = threading.Event()
+    uploaded: list[str] = []
+    metrics: list[tuple[str, dict]] = []
+
+    class SlowClient:
+        def upload(self, local_path, remote_key):
+            release.wait(5)
+            if remote_key == "bad":
+                raise OSError("rede indisponivel")
+            uploaded.append(remote_key)
+            return f"mem://{remote_key}"
+
+        def remote_uri(self, remote_key):
+            return f"mem://{remote_key}"
+
+    client = BackgroundStorageClient(
+        SlowClient(), metric_dispatcher=lambda event, payload: metrics.append((event, payload))
+    )
+    assert client.upload(tmp_path / "a.zip", "good") == "mem://good"
+    client.upload(tmp_path / "b.zip", "bad")
+    assert uploaded == [] and client.pending_count() == 2
+
+    release.set()
+    assert client.flush(timeout=5)
+    assert uploaded == ["good"]
+    assert metrics == [("storage.upload.failed", {"key": "bad", "error": "rede indisponivel"})]
+
+
+
+def test_background_storage_client_flush_waits_for_every_upload_of_the_same_key(tmp_path):
+    release = threading.Event()
+    uploaded: list[Path] = []
+
+    class SlowClient:
+        def upload(self, local_path, remote_key):
+            if local_path.name == "v1.zip":
+                release.wait(5)
+            uploaded.append(local_path)
+            return remote_key
+
+    client = BackgroundStorageClient(SlowClient(), max_workers=2)
+    client.upload(tmp_path / "v1.zip", "package.zip")
+    client.upload(tmp_path / "v2.zip", "package.zip")
+
+    assert not client.flush(timeout=0.2)
+    release.set()
+    assert client.flush(timeout=5)
+    assert sorted(path.name for path in uploaded) == ["v1.zip", "v2.zip"]
+    assert client.pending_count() == 0
+
+def test_local_storage_hardlinks_when_allowed_and_falls_back_otherwise(tmp_path, monkeypatch):
+    src = tmp_path / "package.zip"
+    src.write_bytes(b"conteudo" * 1000)
+    metrics: list[tuple[str, dict]] = []
+    linked = LocalStorageClient(
+        tmp_path / "linked",
+        allow_hardlinks=True,
+        strategies=("hardlink", "copy"),
+        metric_dispatcher=lambda event, payload: metrics.append((event, payload)),
+    )
+
+    dest = Path(linked.upload(src, "job/package.zip"))
+    linked.upload(src, "job/package.zip")  # overwriting an existing backup also works
+
+    assert linked.last_strategy == "hardlink"
+    assert dest.stat().st_ino == src.stat().st_ino
+    assert [payload["strategy"] for _, payload in metrics] == ["hardlink", "hardlink"]
+
+    copied = LocalStorageClient(tmp_path / "copied")
+    dest = Path(copied.upload(src, "job/package.zip"))
+    assert copied.last_strategy in {"reflink", "copy_file_range", "copy"}
+    assert dest.stat().st_ino != src.stat().st_ino
+    assert dest.read_bytes() == src.read_bytes()
+    assert dest.stat().st_mtime == src.stat().st_mtime
+
+
+def test_local_storage_remembers_unsupported_strategies(tmp_path, monkeypatch):
+    from infrastructure.api import storage_client
+
+    calls: list[str] = []
+
+    def failing_reflink(source, target):
+        calls.append("reflink")
+        raise OSError(95, "Operation not supported")
+
+    monkeypatch.setitem(storage_client._COPY_FUNCTIONS, "reflink", failing_reflink)
+    client = LocalStorageClient(tmp_path / "dest", strategies=("reflink", "copy"))
+    src = tmp_path / "a.txt"
+    src.write_text("x", encoding="utf-8")
+
+    client.upload(src, "a.txt")
+    client.upload(src, "b.txt")
+
+    assert calls == ["reflink"]
+    assert client.last_strategy == "copy"
+    assert not list((tmp_path / "dest").glob(".*.tmp"))
+
+
+def test_local_storage_retries_strategy_after_transient_error(tmp_path, monkeypatch):
+    from infrastructure.api import storage_client
+
+    calls: list[str] = []
+
+    def flaky_reflink(source, target):
+        calls.append("reflink")
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setitem(storage_client._COPY_FUNCTIONS, "reflink", flaky_reflink)
+    client = LocalStorageClient(tmp_path / "dest", strategies=("reflink", "copy"))
+    src = tmp_path / "a.txt"
+    src.write_text("x", encoding="utf-8")
+
+    client.upload(src, "a.txt")
+    client.upload(src, "b.txt")
+
+    assert calls == ["reflink", "reflink"]
+    assert client.last_strategy == "copy"
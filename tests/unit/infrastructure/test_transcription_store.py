@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+
+from domain.entities.transcription import PostEditResult, Segment, TranscriptionResult
+from infrastructure.database.transcription_store import STORE_FORMAT, FilesystemTranscriptionStore
+
+
+def _result() -> TranscriptionResult:
+    return TranscriptionResult(
+        text="ola mundo. segunda frase",
+        segments=[
+            Segment(id=0, start=0.0, end=1.5, text="ola mundo.", confidence=0.91),
+            Segment(id=1, start=1.5, end=3.25, text="segunda frase", speaker="S2", confidence=None),
+        ],
+        language="pt",
+        duration_sec=3.25,
+        engine="openai",
+        metadata={"task": "transcribe", "chunked": True, "chunk_count": 2},
+    )
+
+
+def test_transcription_store_roundtrip(tmp_path):
+    store = FilesystemTranscriptionStore(tmp_path / "asr")
+    path = store.save("job-1", 2, _result())
+
+    assert path == tmp_path / "asr" / "job-1" / "job-1_v2.asr.jsonl"
+    assert store.load("job-1", 2) == _result()
+    assert store.load_text("job-1", 2) == "ola mundo. segunda frase"
+    assert store.load("job-1", 1) is None
+    assert not list(path.parent.glob("*.tmp"))
+
+
+def test_transcription_store_columnar_layout(tmp_path):
+    store = FilesystemTranscriptionStore(tmp_path)
+    path = store.save("job-1", 1, _result())
+    header, text, columns, segment_texts = path.read_text(encoding="utf-8").splitlines()
+
+    assert json.loads(header)["format"] == STORE_FORMAT
+    assert json.loads(header)["segment_count"] == 2
+    assert json.loads(text) == "ola mundo. segunda frase"
+    assert json.loads(columns) == {
+        "id": [0, 1],
+        "start": [0.0, 1.5],
+        "end": [1.5, 3.25],
+        "confidence": [0.91, None],
+        "speaker": [None, "S2"],
+    }
+    assert json.loads(segment_texts) == ["ola mundo.", "segunda frase"]
+
+
+def test_stored_transcription_loads_lazily(tmp_path):
+    store = FilesystemTranscriptionStore(tmp_path)
+    path = store.save("job-1", 1, _result())
+    # Corrupt the segment columns: header and text must still be readable.
+    lines = path.read_text(encoding="utf-8").splitlines()
+    path.write_text("\n".join(lines[:2]) + "\n", encoding="utf-8")
+
+    stored = store.open("job-1", 1)
+
+    assert stored is not None
+    assert stored.language == "pt"
+    assert stored.segment_count == 2
+    assert stored.text == "ola mundo. segunda frase"
+    assert store.load("job-1", 1) is None
+
+
+def test_transcription_store_ignores_foreign_files(tmp_path):
+    store = FilesystemTranscriptionStore(tmp_path)
+    path = store.path_for("job-1", 1)
+    path.parent.mkdir(parents=True)
+    path.write_text('{"format": "other"}\n', encoding="utf-8")
+
+    assert store.open("job-1", 1) is None
+    assert store.load_text("job-1", 1) is None
+
+
+def test_transcription_store_post_edit_checkpoint_and_carry_forward(tmp_path):
+    store = FilesystemTranscriptionStore(tmp_path)
+    post_edit = PostEditResult(
+        text="Ola mundo.",
+        segments=[Segment(id=0, start=0.0, end=1.5, text="Ola mundo.")],
+        flags=[{"type": "termo", "value": "mundo"}],
+        language="pt",
+    )
+    store.save("job-1", 1, _result())
+    path = store.save_post_edit("job-1", 1, post_edit)
+
+    assert path == tmp_path / "job-1" / "job-1_v1.post_edit.jsonl"
+    assert store.load_post_edit("job-1", 1) == post_edit
+    assert store.load_post_edit("job-1", 2) is None
+
+    carried = store.carry_forward("job-1", 1, 2, ["asr", "post_edit"])
+
+    assert carried == ["asr", "post_edit"]
+    assert store.load("job-1", 2) == _result()
+    assert store.load_post_edit("job-1", 2) == post_edit
+    assert json.loads(store.path_for("job-1", 2).read_text(encoding="utf-8").splitlines()[0])["version"] == 2
+    assert store.carry_forward("job-1", 5, 6, ["asr", "post_edit"]) == []
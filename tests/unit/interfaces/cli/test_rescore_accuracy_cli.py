@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from domain.entities.job import Job
+from interfaces.cli import rescore_accuracy
+from tests.support import stubs
+
+
+class RecordingRescorer:
+    instances: list = []
+
+    def __init__(self, job_repository, guard, max_workers=None, transcription_store=None):
+        self.max_workers = max_workers
+        self.calls = []
+        RecordingRescorer.instances.append(self)
+
+    def run(self, jobs, threshold=None, dry_run=False):
+        self.calls.append(([job.id for job in jobs], threshold, dry_run))
+        return SimpleNamespace(to_markdown=lambda: "# Accuracy Re-evaluation\n")
+
+
+def _container():
+    repo = stubs.MemoryJobRepository()
+    for job_id in ("job-1", "job-2"):
+        repo.create(Job(id=job_id, source_path="inbox/a.wav", profile_id="geral"))
+    return SimpleNamespace(job_repository=repo, accuracy_guard=object())
+
+
+def test_rescore_cli_filters_jobs_and_writes_report(monkeypatch, tmp_path, capsys):
+    RecordingRescorer.instances = []
+    monkeypatch.setattr(rescore_accuracy, "get_container", _container)
+    monkeypatch.setattr(rescore_accuracy, "AccuracyBatchRescorer", RecordingRescorer)
+    report = tmp_path / "summary.md"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["rescore", "--job-id", "job-2", "--threshold", "0.9", "--workers", "3", "--dry-run", "--report", str(report)],
+    )
+
+    rescore_accuracy.main()
+
+    rescorer = RecordingRescorer.instances[0]
+    assert rescorer.max_workers == 3
+    assert rescorer.calls == [(["job-2"], 0.9, True)]
+    assert report.read_text(encoding="utf-8").startswith("# Accuracy Re-evaluation")
+    assert "Resumo salvo" in capsys.readouterr().out
+
+
+def test_rescore_cli_fetches_requested_jobs_without_listing_recent(monkeypatch, tmp_path):
+    RecordingRescorer.instances = []
+    container = _container()
+
+    def _no_listing(limit=50):
+        raise AssertionError("list_recent should not be used when --job-id is given")
+
+    container.job_repository.list_recent = _no_listing
+    monkeypatch.setattr(rescore_accuracy, "get_container", lambda: container)
+    monkeypatch.setattr(rescore_accuracy, "AccuracyBatchRescorer", RecordingRescorer)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["rescore", "--job-id", "job-1", "--job-id", "job-2", "--limit", "1", "--report", str(tmp_path / "r.md")],
+    )
+
+    rescore_accuracy.main()
+
+    assert RecordingRescorer.instances[0].calls == [(["job-1", "job-2"], None, False)]
+
+
+def test_rescore_cli_rejects_unknown_job(monkeypatch, tmp_path):
+    monkeypatch.setattr(rescore_accuracy, "get_container", _container)
+    monkeypatch.setattr(sys, "argv", ["rescore", "--job-id", "job-x", "--report", str(tmp_path / "r.md")])
+
+    with pytest.raises(SystemExit):
+        rescore_accuracy.main()
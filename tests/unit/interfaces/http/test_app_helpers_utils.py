@@ -65,3 +65,28 @@ def test_health_endpoint_reports_external(tmp_path, monkeypatch):
     assert payload["status"] in {"ok", "degraded"}
     assert payload["external"]["asr_ready"] is True
     assert payload["external"]["chat_ready"] is True
+
+
+def test_health_endpoint_serves_cached_probes_between_refreshes(tmp_path, monkeypatch):
+    settings = SimpleNamespace(
+        app_env="test",
+        openai_api_key="test",
+        chatgpt_api_key="",
+        openai_chunk_trigger_mb=10,
+        max_audio_size_mb=2048,
+        base_output_dir=tmp_path / "output",
+    )
+    probes = []
+    original_probe = http_app._run_health_probes
+    monitor = http_app.HealthMonitor(lambda: probes.append(1) or original_probe(), interval_sec=60)
+    monkeypatch.setattr(http_app, "_health_monitor", monitor)
+    monkeypatch.setattr(http_app, "get_settings", lambda: settings)
+    monkeypatch.setattr(http_app, "_feature_flags_snapshot", lambda: {"downloads.signature_required": True})
+
+    client = TestClient(http_app.app)
+    first = client.get("/health").json()
+    second = client.get("/health").json()
+
+    assert len(probes) == 1
+    assert first["external"]["storage_ready"] is True
+    assert second["checked_at"] == first["checked_at"] and second["age_sec"] >= first["age_sec"]
@@ -32,7 +32,7 @@ def _setup_upload_client(monkeypatch, tmp_path: Path):
 async def _fake_persist(tmp_path: Path, total_bytes: int):
     path = tmp_path / "upload.wav"
     path.write_bytes(b"audio")
-    return path, total_bytes
+    return path, total_bytes, "sha256:abc"
 
 
 @pytest.mark.parametrize("total_bytes", [0, 1024])
@@ -63,7 +63,7 @@ def test_upload_job_auto_process_error(monkeypatch, tmp_path: Path):
     async def fake(file, profile, max_bytes):
         path = tmp_path / "upload.wav"
         path.write_bytes(b"audio")
-        return path, 1024
+        return path, 1024, "sha256:abc"
 
     def process_job(job_id: str) -> None:
         raise RuntimeError("boom")
@@ -87,7 +87,7 @@ def test_api_upload_job_handles_zero_bytes(monkeypatch, tmp_path: Path):
     async def fake(file, profile, max_bytes):
         path = tmp_path / "upload.wav"
         path.write_bytes(b"audio")
-        return path, 0
+        return path, 0, "sha256:abc"
 
     monkeypatch.setattr(http_app, "_persist_upload_file", fake)
     monkeypatch.setattr(http_app, "_validate_upload_token", lambda *args, **kwargs: None)
@@ -109,7 +109,7 @@ def test_api_upload_job_auto_process_failure(monkeypatch, tmp_path: Path):
     async def fake(file, profile, max_bytes):
         path = tmp_path / "upload.wav"
         path.write_bytes(b"audio")
-        return path, 1024
+        return path, 1024, "sha256:abc"
 
     def process_job(job_id: str) -> None:
         raise RuntimeError("boom")
@@ -127,3 +127,55 @@ def test_api_upload_job_auto_process_failure(monkeypatch, tmp_path: Path):
 
     assert response.status_code == 400
     assert "boom" in response.json()["detail"]
+
+
+def test_persist_upload_file_hashes_while_streaming(monkeypatch, tmp_path: Path):
+    import asyncio
+    import hashlib
+    import io
+
+    from fastapi import UploadFile
+    from starlette.datastructures import Headers
+
+    monkeypatch.setattr(http_app, "get_settings", lambda: SimpleNamespace(base_input_dir=tmp_path))
+    monkeypatch.setattr(http_app, "_blake3", None)
+    content = b"RIFF" + b"\x01" * (3 * 1024 * 1024)
+    upload = UploadFile(
+        io.BytesIO(content), filename="audio.wav", headers=Headers({"content-type": "audio/wav"})
+    )
+
+    target, total, digest = asyncio.run(http_app._persist_upload_file(upload, "geral", 10 * 1024 * 1024))
+
+    assert total == len(content) and target.read_bytes() == content
+    assert digest == f"sha256:{hashlib.sha256(content).hexdigest()}"
+
+
+def test_api_upload_job_returns_existing_job_for_repeated_content(monkeypatch, tmp_path: Path):
+    client, job_controller = _setup_upload_client(monkeypatch, tmp_path)
+    existing = SimpleNamespace(id="job-existing", status=SimpleNamespace(value="awaiting_review"), profile_id="geral")
+    calls = []
+
+    def ingest_upload(path, profile_id, engine, digest):
+        calls.append(digest)
+        return existing, True
+
+    monkeypatch.setattr(job_controller, "ingest_upload", ingest_upload, raising=False)
+    monkeypatch.setattr(job_controller, "process_job", lambda job_id: calls.append("processed"))
+    monkeypatch.setattr(http_app, "_validate_upload_token", lambda *args, **kwargs: None)
+
+    response = client.post(
+        "/api/uploads",
+        data={"token": "token", "expires": "now", "profile": "geral", "engine": "openai", "auto_process": "true"},
+        files={"file": ("audio.wav", b"RIFF-audio", "audio/wav")},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "job_id": "job-existing",
+        "status": "awaiting_review",
+        "profile_id": "geral",
+        "auto_processed": False,
+        "deduplicated": True,
+    }
+    assert calls == [f"sha256:{__import__('hashlib').sha256(b'RIFF-audio').hexdigest()}"]
+    assert not (tmp_path / "geral" / "audio.wav").exists()